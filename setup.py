@@ -7,7 +7,8 @@ from pathlib import Path
 
 # Read long description from README
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text()
+readme_path = this_directory / "README.md"
+long_description = readme_path.read_text(encoding="utf-8") if readme_path.exists() else ""
 
 setup(
     name="simple-uptime-monitor",
@@ -24,6 +25,7 @@ setup(
         "Flask>=3.0.0",
         "Jinja2>=3.1.2",
         "Werkzeug>=3.0.1",
+        "waitress>=2.1.2",
         "SQLAlchemy>=2.0.23",
         "alembic>=1.13.1",
         "requests>=2.31.0",
@@ -32,14 +34,13 @@ setup(
         "icmplib>=3.0.4",
         "websocket-client>=1.6.4",
         "docker>=7.0.0",
-        "discord-webhook>=1.3.0",
-        "slack-sdk>=3.26.1",
         "PyYAML>=6.0.1",
         "python-dotenv>=1.0.0",
         "jsonpath-ng>=1.6.0",
         "schedule>=1.2.0",
         "python-dateutil>=2.8.2",
         "pytz>=2023.3",
+        "orjson>=3.9.10",
         "cryptography>=41.0.7",
         "certifi>=2023.11.17",
     ],
@@ -78,32 +78,15 @@
                 incidentBanner.remove();
             }
 
-            // Update last checked time
+            // Update last checked time (formatted by time-format.js)
             const lastChecked = card.querySelector('.last-checked');
             if (lastChecked && monitor.last_checked) {
-                lastChecked.textContent = 'Last checked: ' + formatTimeAgo(new Date(monitor.last_checked));
+                lastChecked.dataset.ts = monitor.last_checked;
+                lastChecked.textContent = formatTimeAgo(monitor.last_checked);
             }
         });
     }
 
-    /**
-     * Format timestamp as "time ago" string
-     */
-    function formatTimeAgo(timestamp) {
-        const now = new Date();
-        const seconds = Math.floor((now - timestamp) / 1000);
-
-        if (seconds < 60) {
-            return seconds + 's ago';
-        } else if (seconds < 3600) {
-            return Math.floor(seconds / 60) + 'm ago';
-        } else if (seconds < 86400) {
-            return Math.floor(seconds / 3600) + 'h ago';
-        } else {
-            return Math.floor(seconds / 86400) + 'd ago';
-        }
-    }
-
     // Start auto-update when page loads
     if (document.readyState === 'loading') {
         document.addEventListener('DOMContentLoaded', function() {
@@ -0,0 +1,79 @@
+/**
+ * Client-side time formatting for server-rendered pages
+ *
+ * Templates emit raw values instead of formatted text:
+ *   data-ts="<ISO-8601 time>"     -> "5m ago"
+ *   data-secs="<seconds>"         -> "1h 5m"
+ *   data-since="<ISO-8601 time>"  -> duration from that time until now
+ */
+
+/**
+ * Format a Date (or ISO-8601 string) as "time ago" string
+ */
+function formatTimeAgo(timestamp) {
+    const seconds = Math.floor((new Date() - new Date(timestamp)) / 1000);
+
+    if (seconds < 60) {
+        return seconds + 's ago';
+    } else if (seconds < 3600) {
+        return Math.floor(seconds / 60) + 'm ago';
+    } else if (seconds < 86400) {
+        return Math.floor(seconds / 3600) + 'h ago';
+    } else {
+        return Math.floor(seconds / 86400) + 'd ago';
+    }
+}
+
+/**
+ * Format a number of seconds as human-readable duration
+ */
+function formatDuration(seconds) {
+    seconds = Math.floor(seconds);
+    if (!seconds) {
+        return 'N/A';
+    }
+
+    if (seconds < 60) {
+        return seconds + 's';
+    } else if (seconds < 3600) {
+        return Math.floor(seconds / 60) + 'm ' + (seconds % 60) + 's';
+    } else if (seconds < 86400) {
+        return Math.floor(seconds / 3600) + 'h ' + Math.floor((seconds % 3600) / 60) + 'm';
+    } else {
+        return Math.floor(seconds / 86400) + 'd ' + Math.floor((seconds % 86400) / 3600) + 'h';
+    }
+}
+
+/**
+ * Fill in every data-ts / data-secs / data-since element under root
+ */
+function renderTimes(root) {
+    root = root || document;
+
+    root.querySelectorAll('[data-ts]').forEach(el => {
+        el.textContent = formatTimeAgo(el.dataset.ts);
+    });
+    root.querySelectorAll('[data-secs]').forEach(el => {
+        el.textContent = formatDuration(Number(el.dataset.secs));
+    });
+    root.querySelectorAll('[data-since]').forEach(el => {
+        el.textContent = formatDuration((new Date() - new Date(el.dataset.since)) / 1000);
+    });
+}
+
+(function() {
+    'use strict';
+
+    const REFRESH_INTERVAL = 5000; // 5 seconds
+
+    function start() {
+        renderTimes();
+        setInterval(renderTimes, REFRESH_INTERVAL);
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', start);
+    } else {
+        start();
+    }
+})();
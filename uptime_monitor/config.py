@@ -5,16 +5,32 @@ Loads YAML configuration with environment variable substitution.
 
 import os
 import re
+import sys
 import yaml
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from pathlib import Path
 import logging
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
+# Prefer the libyaml-backed loader when available (much faster than pure Python)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Matches ${VAR_NAME} placeholders for environment variable substitution
+_ENV_VAR_RE = re.compile(r'\$\{([A-Za-z0-9_]+)\}')
+
+# Matches a possibly incomplete placeholder at the end of a chunk
+_PARTIAL_ENV_VAR_RE = re.compile(r'\$(\{[A-Za-z0-9_]*)?$')
+
+# Supported monitor types (tuple keeps a stable order for error messages)
+_MONITOR_TYPES = ('http', 'tcp', 'ping', 'dns', 'websocket', 'docker', 'push')
+VALID_MONITOR_TYPES = frozenset(_MONITOR_TYPES)
+
+# Load environment variables from .env file (skipped when the file is absent,
+# e.g. in containers where the orchestrator provides the environment)
+if os.environ.get('SKIP_DOTENV') != '1' and Path('.env').exists():
+    load_dotenv('.env')
 
 
 class ConfigError(Exception):
@@ -22,6 +38,20 @@ class ConfigError(Exception):
     pass
 
 
+class _ChunkReader:
+    """Minimal file-like wrapper that feeds text chunks to the YAML parser"""
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> str:
+        # The parser treats an empty string as EOF, so only return one at the end
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return ''
+
+
 class Config:
     """Configuration manager"""
 
@@ -38,21 +68,25 @@ class Config:
         self.notifications: List[Dict[str, Any]] = []
         self.groups: List[Dict[str, Any]] = []
         self.monitors: List[Dict[str, Any]] = []
+        self._groups_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._order_cache: Optional[List[str]] = None
+        self._notifications_by_name: Dict[str, Dict[str, Any]] = {}
+        self._db_dir_ensured = False
 
     def load(self) -> None:
         """Load and parse configuration file"""
         if not Path(self.config_path).exists():
             raise ConfigError(f"Configuration file not found: {self.config_path}")
 
-        try:
-            with open(self.config_path, 'r') as f:
-                raw_content = f.read()
-
-            # Substitute environment variables
-            substituted_content = self._substitute_env_vars(raw_content)
+        # Invalidate derived data
+        self._groups_cache = None
+        self._order_cache = None
+        self._notifications_by_name = {}
+        self._db_dir_ensured = False
 
+        try:
             # Parse YAML
-            self.raw_config = yaml.safe_load(substituted_content)
+            self.raw_config = self._parse_yaml()
 
             if not self.raw_config:
                 raise ConfigError("Configuration file is empty")
@@ -74,6 +108,19 @@ class Config:
         except Exception as e:
             raise ConfigError(f"Failed to load configuration: {e}")
 
+    def _parse_yaml(self) -> Any:
+        """
+        Parse the configuration file.
+
+        The file is streamed through environment variable substitution in
+        chunks, so the full text is never held in memory.
+
+        Returns:
+            Parsed YAML data
+        """
+        with open(self.config_path, 'r') as f:
+            return yaml.load(_ChunkReader(self._iter_substituted(f)), Loader=_YAML_LOADER)
+
     def _substitute_env_vars(self, content: str) -> str:
         """
         Substitute environment variables in format ${VAR_NAME}.
@@ -87,18 +134,52 @@ class Config:
         Raises:
             ConfigError: If required env var is not found
         """
-        pattern = re.compile(r'\$\{([A-Za-z0-9_]+)\}')
+        return _ENV_VAR_RE.sub(self._replace_env_var, content)
+
+    def _iter_substituted(self, f, chunk_size: int = 65536) -> Iterator[str]:
+        """
+        Read a file in chunks, substituting environment variables on the fly.
+
+        A trailing partial ${...} token is carried over to the next chunk so
+        placeholders split across chunk boundaries are still substituted.
+
+        Args:
+            f: Open text file
+            chunk_size: Number of characters to read at a time
 
-        def replacer(match):
-            var_name = match.group(1)
-            var_value = os.environ.get(var_name)
+        Yields:
+            Substituted content chunks
+        """
+        pending = ''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+
+            data = pending + chunk
+            partial = _PARTIAL_ENV_VAR_RE.search(data)
+            if partial:
+                pending = data[partial.start():]
+                data = data[:partial.start()]
+            else:
+                pending = ''
+
+            if data:
+                yield self._substitute_env_vars(data)
+
+        if pending:
+            yield pending
 
-            if var_value is None:
-                raise ConfigError(f"Environment variable '{var_name}' not found. Set it in .env file or environment.")
+    @staticmethod
+    def _replace_env_var(match: re.Match) -> str:
+        """Resolve a single ${VAR_NAME} match from the environment"""
+        var_name = match.group(1)
+        var_value = os.environ.get(var_name)
 
-            return var_value
+        if var_value is None:
+            raise ConfigError(f"Environment variable '{var_name}' not found. Set it in .env file or environment.")
 
-        return pattern.sub(replacer, content)
+        return var_value
 
     def _validate(self) -> None:
         """Validate configuration structure"""
@@ -126,19 +207,33 @@ class Config:
             monitor_names.add(name)
 
             # Validate monitor type
-            valid_types = ['http', 'tcp', 'ping', 'dns', 'websocket', 'docker', 'push']
-            if monitor['type'] not in valid_types:
+            if monitor['type'] not in VALID_MONITOR_TYPES:
                 raise ConfigError(
                     f"Monitor '{name}' has invalid type '{monitor['type']}'. "
-                    f"Valid types: {', '.join(valid_types)}"
+                    f"Valid types: {', '.join(_MONITOR_TYPES)}"
                 )
 
+            # Validate check interval
+            interval = monitor.get('interval')
+            if interval is not None and (not isinstance(interval, int) or interval < 1):
+                raise ConfigError(
+                    f"Monitor '{name}' has invalid interval '{interval}'. "
+                    f"Must be a whole number of seconds, at least 1"
+                )
+
+            monitor['type'] = sys.intern(monitor['type'])
+
+        # Index notifications by name for O(1) lookups; the first entry wins
+        # if a name is duplicated, as with the linear scan this replaced
+        self._notifications_by_name = {}
+        for notification in self.notifications:
+            self._notifications_by_name.setdefault(notification['name'], notification)
+
         # Validate notification names referenced by monitors
-        notification_names = {n['name'] for n in self.notifications}
         for monitor in self.monitors:
             monitor_notifs = monitor.get('notifications', [])
             for notif_name in monitor_notifs:
-                if notif_name not in notification_names:
+                if notif_name not in self._notifications_by_name:
                     logger.warning(
                         f"Monitor '{monitor['name']}' references unknown notification '{notif_name}'"
                     )
@@ -151,9 +246,11 @@ class Config:
         """Get database path from config or default"""
         db_path = self.get_global('database', 'data/uptime.db')
 
-        # Create data directory if it doesn't exist
-        db_dir = Path(db_path).parent
-        db_dir.mkdir(parents=True, exist_ok=True)
+        # Create data directory if it doesn't exist (once per load)
+        if not self._db_dir_ensured:
+            db_dir = Path(db_path).parent
+            db_dir.mkdir(parents=True, exist_ok=True)
+            self._db_dir_ensured = True
 
         return db_path
 
@@ -183,7 +280,10 @@ class Config:
         }
 
     def get_monitors_by_group(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Get monitors organized by group"""
+        """Get monitors organized by group (cached until reload)"""
+        if self._groups_cache is not None:
+            return self._groups_cache
+
         groups = {}
 
         for monitor in self.monitors:
@@ -192,23 +292,25 @@ class Config:
                 groups[group_name] = []
             groups[group_name].append(monitor)
 
+        self._groups_cache = groups
         return groups
 
     def get_notification_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get notification configuration by name"""
-        for notif in self.notifications:
-            if notif.get('name') == name:
-                return notif
-        return None
+        return self._notifications_by_name.get(name)
 
     def get_group_display_order(self) -> List[str]:
-        """Get group names in display order"""
-        # Sort groups by display_order field
-        sorted_groups = sorted(
-            self.groups,
-            key=lambda g: g.get('display_order', 999)
-        )
-        return [g['name'] for g in sorted_groups]
+        """Get group names in display order (cached until reload)"""
+        if self._order_cache is None:
+            # Sort groups by display_order field
+            sorted_groups = sorted(
+                self.groups,
+                key=lambda g: g.get('display_order', 999)
+            )
+            self._order_cache = [g['name'] for g in sorted_groups]
+
+        # Return a copy since callers may extend the list
+        return list(self._order_cache)
 
     @staticmethod
     def _generate_secret_key() -> str:
@@ -216,6 +318,35 @@ class Config:
         import secrets
         return secrets.token_hex(32)
 
+    def set_monitor(self, monitor_config: Dict[str, Any], old_name: Optional[str] = None) -> None:
+        """
+        Add or replace one monitor without re-reading the file.
+
+        Args:
+            monitor_config: New monitor configuration
+            old_name: Name of the monitor to replace; the monitor is appended
+                if not given or not found
+        """
+        self._groups_cache = None
+
+        if old_name is not None:
+            for idx, monitor in enumerate(self.monitors):
+                if monitor['name'] == old_name:
+                    self.monitors[idx] = monitor_config
+                    return
+
+        self.monitors.append(monitor_config)
+
+    def remove_monitor(self, name: str) -> None:
+        """
+        Remove one monitor without re-reading the file.
+
+        Args:
+            name: Name of the monitor to remove
+        """
+        self._groups_cache = None
+        self.monitors[:] = [m for m in self.monitors if m['name'] != name]
+
     def reload(self) -> None:
         """Reload configuration from file"""
         logger.info("Reloading configuration...")
@@ -258,3 +389,40 @@ def get_config() -> Config:
     if _config is None:
         raise ConfigError("Configuration not loaded. Call load_config() first.")
     return _config
+
+
+def _tcp_target(config: dict) -> str:
+    host = config.get('host', 'Unknown')
+    port = config.get('port', '')
+    return f"{host}:{port}" if port else host
+
+
+# Monitor type -> function extracting the human-readable target from its config
+_TARGET_EXTRACTORS = {
+    'http': lambda c: c.get('url', 'Unknown'),
+    'tcp': _tcp_target,
+    'ping': lambda c: c.get('host', 'Unknown'),
+    'dns': lambda c: (f"{c.get('hostname', 'Unknown')} ({c.get('record_type', 'A')}) "
+                      f"via {c.get('resolver', '8.8.8.8')}"),
+    'websocket': lambda c: c.get('url', 'Unknown'),
+    'docker': lambda c: c.get('container_name', 'Unknown'),
+    'push': lambda c: 'Push-based (passive)',
+}
+
+
+def _unknown_target(config: dict) -> str:
+    return 'Unknown'
+
+
+def get_monitor_target(monitor_type: str, config: dict) -> str:
+    """
+    Extract human-readable target information from monitor config.
+
+    Args:
+        monitor_type: Type of monitor
+        config: Monitor configuration dict
+
+    Returns:
+        Human-readable target string
+    """
+    return _TARGET_EXTRACTORS.get(monitor_type, _unknown_target)(config)
@@ -3,18 +3,65 @@ Database models and initialization using SQLAlchemy.
 """
 
 from datetime import datetime, date
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 import json
 import logging
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, Float, DateTime, Date, Text, ForeignKey, Index, JSON
-from sqlalchemy.orm import declarative_base, sessionmaker, relationship, Session, scoped_session
-from sqlalchemy.pool import NullPool
+from sqlalchemy import bindparam, case, create_engine, event, inspect, select, text, Column, Integer, String, Boolean, Float, DateTime, Date, Text, ForeignKey, Index
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.orm import declarative_base, deferred, sessionmaker, relationship, Session, scoped_session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
 
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string (uses orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value)
+
+
+def json_loads(value: Any) -> Any:
+    """Deserialize a JSON string (uses orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+class JSONText(TypeDecorator):
+    """
+    JSON value stored in a TEXT column.
+
+    Serialization is done explicitly with orjson (falling back to the
+    stdlib json module), bypassing SQLAlchemy's generic JSON type handling
+    on the check-result insert path. Existing rows written by the JSON
+    type are plain JSON text and remain readable.
+    """
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return json_dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return json_loads(value)
+
+
 class MonitorModel(Base):
     """Monitor configuration cache"""
     __tablename__ = 'monitors'
@@ -27,9 +74,11 @@ class MonitorModel(Base):
     interval = Column(Integer)  # seconds
     timeout = Column(Integer)
     retry_count = Column(Integer)
-    config = Column(JSON)  # Full monitor configuration as JSON
+    config = deferred(Column(JSONText))  # Full monitor configuration as JSON (loaded on access)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_run_at = Column(DateTime)  # time of the latest stored check, used to resume the schedule
+    target_display = Column(String(255))  # human-readable target, precomputed from config at sync time
 
     # Relationships
     check_results = relationship("CheckResult", back_populates="monitor", cascade="all, delete-orphan")
@@ -52,13 +101,16 @@ class CheckResult(Base):
     response_time = Column(Float)  # milliseconds
     status_code = Column(Integer)
     error_message = Column(Text)
-    check_metadata = Column(JSON)  # Renamed from 'metadata' to avoid SQLAlchemy conflict
+    check_metadata = deferred(Column(JSONText))  # Renamed from 'metadata' to avoid SQLAlchemy conflict
 
     # Relationship
     monitor = relationship("MonitorModel", back_populates="check_results")
 
     __table_args__ = (
-        Index('idx_check_results_monitor_timestamp', 'monitor_id', 'timestamp'),
+        # Covering index for dashboard queries (latest check, uptime by status).
+        # Newest-first lookups ("ORDER BY timestamp DESC LIMIT n" per monitor)
+        # walk it backwards, so no separate descending index is needed
+        Index('idx_cr_monitor_ts_status', 'monitor_id', 'timestamp', 'status', 'response_time'),
     )
 
     def __repr__(self):
@@ -86,6 +138,10 @@ class Incident(Base):
     monitor = relationship("MonitorModel", back_populates="incidents")
     notifications_log = relationship("NotificationLog", back_populates="incident", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('idx_incidents_monitor_ended', 'monitor_id', 'ended_at'),
+    )
+
     @property
     def is_ongoing(self) -> bool:
         """Check if incident is still ongoing"""
@@ -94,7 +150,7 @@ class Incident(Base):
     @property
     def duration_seconds(self) -> Optional[int]:
         """Get incident duration in seconds"""
-        if self.duration:
+        if self.duration is not None:
             return self.duration
         if self.started_at and self.ended_at:
             return int((self.ended_at - self.started_at).total_seconds())
@@ -107,6 +163,89 @@ class Incident(Base):
         return f"<Incident(id={self.id}, monitor_id={self.monitor_id}, status='{status}')>"
 
 
+@event.listens_for(Incident.ended_at, 'set')
+def _set_incident_duration(target, value, oldvalue, initiator):
+    """Store the incident duration as soon as ended_at is set"""
+    if value is not None and target.started_at is not None:
+        target.duration = int((value - target.started_at).total_seconds())
+
+
+class seconds_between(FunctionElement):
+    """
+    Whole seconds from one timestamp to another, as a SQL expression.
+
+    Lets an UPDATE compute incident durations in the database, the way
+    _set_incident_duration does for ORM instances. Usage:
+    seconds_between(Incident.started_at, literal(ended_at, DateTime))
+    """
+    type = Integer()
+    inherit_cache = True
+    name = 'seconds_between'
+
+
+@compiles(seconds_between)
+def _seconds_between_default(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return "CAST(FLOOR(EXTRACT(EPOCH FROM (%s - %s))) AS INTEGER)" % (
+        compiler.process(end, **kw), compiler.process(start, **kw)
+    )
+
+
+@compiles(seconds_between, 'sqlite')
+def _seconds_between_sqlite(element, compiler, **kw):
+    # julianday() is only exact to a few tens of microseconds, so round to
+    # milliseconds before truncating like int() does
+    start, end = list(element.clauses)
+    return "CAST(ROUND((julianday(%s) - julianday(%s)) * 86400, 3) AS INTEGER)" % (
+        compiler.process(end, **kw), compiler.process(start, **kw)
+    )
+
+
+@compiles(seconds_between, 'mysql')
+def _seconds_between_mysql(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return "TIMESTAMPDIFF(SECOND, %s, %s)" % (
+        compiler.process(start, **kw), compiler.process(end, **kw)
+    )
+
+
+class add_seconds(FunctionElement):
+    """
+    A timestamp plus a number of seconds, as a SQL expression.
+
+    Lets an UPDATE derive a deadline from per-row intervals. Usage:
+    add_seconds(literal(now, DateTime), PushMonitor.expected_interval)
+    """
+    type = DateTime()
+    inherit_cache = True
+    name = 'add_seconds'
+
+
+@compiles(add_seconds)
+def _add_seconds_default(element, compiler, **kw):
+    timestamp, seconds = list(element.clauses)
+    return "(%s + make_interval(secs => %s))" % (
+        compiler.process(timestamp, **kw), compiler.process(seconds, **kw)
+    )
+
+
+@compiles(add_seconds, 'sqlite')
+def _add_seconds_sqlite(element, compiler, **kw):
+    # Keep the 'YYYY-MM-DD HH:MM:SS.fff' text format SQLAlchemy reads back
+    timestamp, seconds = list(element.clauses)
+    return "strftime('%%Y-%%m-%%d %%H:%%M:%%f', %s, '+' || (%s) || ' seconds')" % (
+        compiler.process(timestamp, **kw), compiler.process(seconds, **kw)
+    )
+
+
+@compiles(add_seconds, 'mysql')
+def _add_seconds_mysql(element, compiler, **kw):
+    timestamp, seconds = list(element.clauses)
+    return "DATE_ADD(%s, INTERVAL (%s) SECOND)" % (
+        compiler.process(timestamp, **kw), compiler.process(seconds, **kw)
+    )
+
+
 class NotificationLog(Base):
     """Notification audit trail"""
     __tablename__ = 'notifications_log'
@@ -135,6 +274,7 @@ class PushMonitor(Base):
     __tablename__ = 'push_monitors'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    # The unique constraint also serves as the index for monitor_id lookups
     monitor_id = Column(Integer, ForeignKey('monitors.id', ondelete='CASCADE'), nullable=False, unique=True)
     secret_key = Column(String(255), nullable=False, unique=True)
     last_push_at = Column(DateTime)
@@ -190,33 +330,73 @@ class SSLCertificate(Base):
     issued_by = Column(String(255))
     valid_from = Column(DateTime)
     valid_until = Column(DateTime, index=True)
-    days_remaining = Column(Integer)
     last_checked = Column(DateTime, default=datetime.utcnow)
 
     # Relationship
     monitor = relationship("MonitorModel", back_populates="ssl_certificates")
 
     @property
+    def days_remaining(self) -> Optional[int]:
+        """Days until the certificate expires (computed from valid_until)"""
+        if self.valid_until is None:
+            return None
+        return (self.valid_until - datetime.utcnow()).days
+
     def is_expiring_soon(self, days: int = 30) -> bool:
         """Check if certificate is expiring within specified days"""
-        return self.days_remaining is not None and self.days_remaining <= days
+        if self.valid_until is None:
+            return False
+        return (self.valid_until - datetime.utcnow()).days <= days
 
     def __repr__(self):
         return f"<SSLCertificate(hostname='{self.hostname}', days_remaining={self.days_remaining})>"
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Configure each new SQLite connection.
+
+    WAL lets the web dashboard read while the scheduler writes check
+    results, and synchronous=NORMAL is safe under WAL while avoiding an
+    fsync on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    finally:
+        cursor.close()
+
+
+# (table, index) pairs created by earlier versions and since replaced;
+# init_db() drops them from existing databases
+_SUPERSEDED_INDEXES = (
+    # Covered by idx_cr_monitor_ts_status
+    ('check_results', 'idx_check_results_monitor_timestamp'),
+)
+
+
 class Database:
     """Database manager"""
 
-    def __init__(self, database_url: str = "sqlite:///data/uptime.db"):
+    def __init__(self, database_url: str = "sqlite:///data/uptime.db", max_workers: int = 10):
         """
         Initialize database.
 
         Args:
             database_url: SQLAlchemy database URL
+            max_workers: Number of scheduler worker threads; the connection
+                pool is sized so they never wait on a checkout
         """
         self.database_url = database_url
 
+        # Room for every worker plus the scheduler, writer and web threads
+        pool_size = max(max_workers, 10)
+        max_overflow = 2 * max_workers
+
         # Configure engine
         if database_url.startswith('sqlite'):
             # SQLite-specific configuration for thread safety
@@ -226,11 +406,25 @@ class Database:
                     'check_same_thread': False,
                     'timeout': 30  # 30 second timeout for locks
                 },
-                poolclass=NullPool,  # No connection pooling for SQLite
+                # Pool connections so each session doesn't reconnect and
+                # re-run the PRAGMA setup
+                poolclass=QueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
                 echo=False
             )
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
         else:
-            self.engine = create_engine(database_url)
+            # Server databases drop idle connections, so test them on
+            # checkout and replace them before they get that old
+            self.engine = create_engine(
+                database_url,
+                poolclass=QueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,
+                pool_recycle=1800
+            )
 
         # Use scoped_session for thread-safe session management
         session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
@@ -240,12 +434,203 @@ class Database:
         """Initialize database tables"""
         logger.info("Initializing database tables...")
         Base.metadata.create_all(bind=self.engine)
+
+        # create_all() skips existing tables, so add any (nullable) columns
+        # and indexes introduced since the database was first created
+        inspector = inspect(self.engine)
+        for table in Base.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    logger.info(f"Adding column {table.name}.{column.name}")
+                    with self.engine.begin() as conn:
+                        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+
+        # Drop indexes superseded by the ones above (after creating those,
+        # so queries are never left without an index)
+        for table_name, index_name in _SUPERSEDED_INDEXES:
+            if any(index['name'] == index_name for index in inspector.get_indexes(table_name)):
+                logger.info(f"Dropping superseded index {index_name}")
+                if self.engine.dialect.name == 'mysql':
+                    drop = f"DROP INDEX {index_name} ON {table_name}"
+                else:
+                    drop = f"DROP INDEX IF EXISTS {index_name}"
+                with self.engine.begin() as conn:
+                    conn.execute(text(drop))
+
+        self._backfill_uptime_stats()
+
         logger.info("Database tables created successfully")
 
     def get_session(self) -> Session:
         """Get a thread-local database session"""
         return self.SessionLocal()
 
+    def bulk_record_checks(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert many check results in a single transaction.
+
+        Check results are write-only, so this runs a Core executemany
+        INSERT directly on a connection, skipping the ORM session and unit
+        of work, and amortizes the commit across all rows. Each monitor's
+        last_run_at is moved up to its newest result, and the per-day
+        UptimeStats counters are incremented, in the same transaction.
+
+        Args:
+            rows: CheckResult column mappings (monitor_id, timestamp, status, ...)
+        """
+        if not rows:
+            return
+
+        last_run = {}
+        daily = {}
+        for row in rows:
+            monitor_id = row['monitor_id']
+            if monitor_id not in last_run or row['timestamp'] > last_run[monitor_id]:
+                last_run[monitor_id] = row['timestamp']
+
+            counts = daily.setdefault((monitor_id, row['timestamp'].date()), [0, 0])
+            counts[0] += 1
+            if row['status'] == 'up':
+                counts[1] += 1
+
+        monitors = MonitorModel.__table__
+        with self.engine.begin() as conn:
+            conn.execute(CheckResult.__table__.insert(), rows)
+            conn.execute(
+                monitors.update()
+                .where(monitors.c.id == bindparam('monitor_id'))
+                # Bookkeeping, not a config change: keep updated_at as is
+                .values(last_run_at=bindparam('run_at'), updated_at=monitors.c.updated_at),
+                [{'monitor_id': monitor_id, 'run_at': run_at} for monitor_id, run_at in last_run.items()]
+            )
+            conn.execute(self._increment_uptime_stats(), [
+                {
+                    'monitor_id': monitor_id,
+                    'date': day,
+                    'total_checks': total,
+                    'successful_checks': successful,
+                    'failed_checks': total - successful,
+                    'uptime_percentage': successful * 100.0 / total
+                }
+                for (monitor_id, day), (total, successful) in daily.items()
+            ])
+
+    def _increment_uptime_stats(self) -> Any:
+        """Build the upsert adding a batch's counts to a monitor's UptimeStats row for a day"""
+        stats = UptimeStats.__table__
+        return self._upsert(
+            stats, ['monitor_id', 'date'],
+            lambda added: [
+                # First, so MySQL computes it from the counts before they change
+                ('uptime_percentage',
+                 (stats.c.successful_checks + added.successful_checks) * 100.0
+                 / (stats.c.total_checks + added.total_checks)),
+                ('total_checks', stats.c.total_checks + added.total_checks),
+                ('successful_checks', stats.c.successful_checks + added.successful_checks),
+                ('failed_checks', stats.c.failed_checks + added.failed_checks)
+            ]
+        )
+
+    def _backfill_uptime_stats(self) -> None:
+        """Aggregate existing check results into UptimeStats if it has never been filled"""
+        stats = UptimeStats.__table__
+        checks = CheckResult.__table__
+
+        with self.engine.begin() as conn:
+            if conn.execute(select(stats.c.id).limit(1)).first() is not None:
+                return
+            if conn.execute(select(checks.c.id).limit(1)).first() is None:
+                return
+
+            logger.info("Backfilling daily uptime statistics from check history...")
+            day = func.date(checks.c.timestamp)
+            total = func.count()
+            successful = func.sum(case((checks.c.status == 'up', 1), else_=0))
+            conn.execute(stats.insert().from_select(
+                ['monitor_id', 'date', 'total_checks', 'successful_checks', 'failed_checks', 'uptime_percentage'],
+                select(
+                    checks.c.monitor_id, day, total, successful, total - successful,
+                    successful * 100.0 / total
+                ).group_by(checks.c.monitor_id, day)
+            ))
+
+    def _upsert(self, table, conflict_columns: List[str], set_) -> Any:
+        """
+        Build an INSERT that updates the existing row on a unique conflict.
+
+        Uses the dialect's native upsert (ON CONFLICT DO UPDATE on SQLite
+        and PostgreSQL, ON DUPLICATE KEY UPDATE on MySQL).
+
+        Args:
+            table: Table to insert into
+            conflict_columns: Columns of the unique index rows conflict on
+            set_: Callable taking the proposed row's columns (excluded /
+                inserted) and returning (column name, expression) pairs to
+                assign, in order; expressions should read the existing row's
+                columns before any assignment, as MySQL applies them in order
+
+        Returns:
+            Insert statement for executemany
+
+        Raises:
+            NotImplementedError: If the database has no supported upsert
+        """
+        dialect = self.engine.dialect.name
+
+        if dialect in ('sqlite', 'postgresql'):
+            insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+            stmt = insert(table)
+            return stmt.on_conflict_do_update(
+                index_elements=[table.c[name] for name in conflict_columns],
+                set_=dict(set_(stmt.excluded))
+            )
+        elif dialect in ('mysql', 'mariadb'):
+            stmt = mysql.insert(table)
+            return stmt.on_duplicate_key_update(list(set_(stmt.inserted)))
+        else:
+            raise NotImplementedError(f"Upsert is not supported on {dialect}")
+
+    def upsert_monitors(self, rows: List[Dict[str, Any]]) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """
+        Insert or update monitors, matched by name, in one executemany.
+
+        Uses the dialect's native upsert, then reads back the ids with a
+        single SELECT.
+
+        Args:
+            rows: MonitorModel column mappings, all with the same keys
+                including 'name'
+
+        Returns:
+            Dictionary of monitor name to (id, last_run_at)
+
+        Raises:
+            NotImplementedError: If the database has no supported upsert
+        """
+        if not rows:
+            return {}
+
+        monitors = MonitorModel.__table__
+        update_columns = [key for key in rows[0] if key != 'name']
+        stmt = self._upsert(
+            monitors, ['name'],
+            lambda proposed: [(key, proposed[key]) for key in update_columns]
+        )
+
+        names = [row['name'] for row in rows]
+        with self.engine.begin() as conn:
+            conn.execute(stmt, rows)
+            result = conn.execute(
+                select(monitors.c.name, monitors.c.id, monitors.c.last_run_at)
+                .where(monitors.c.name.in_(names))
+            )
+            return {name: (monitor_id, last_run_at) for name, monitor_id, last_run_at in result}
+
     def remove_session(self) -> None:
         """Remove the current thread's session"""
         self.SessionLocal.remove()
@@ -261,18 +646,20 @@ class Database:
 _db: Optional[Database] = None
 
 
-def init_database(database_url: str = "sqlite:///data/uptime.db") -> Database:
+def init_database(database_url: str = "sqlite:///data/uptime.db", max_workers: int = 10) -> Database:
     """
     Initialize the global database instance.
 
     Args:
         database_url: SQLAlchemy database URL
+        max_workers: Number of scheduler worker threads, used to size the
+            connection pool
 
     Returns:
         Database instance
     """
     global _db
-    _db = Database(database_url)
+    _db = Database(database_url, max_workers=max_workers)
     _db.init_db()
     return _db
 
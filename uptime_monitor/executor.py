@@ -0,0 +1,259 @@
+"""
+Thread pool for monitor checks that reports its load and resizes itself.
+"""
+
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class MonitoringExecutor(Executor):
+    """
+    Thread pool that tracks queue length and task latency.
+
+    The pool grows by one worker at a time (up to max_workers) while more
+    than half as many tasks as there are workers have been waiting for
+    GROW_AFTER seconds, and shrinks back towards min_workers after
+    SHRINK_AFTER seconds without any work.
+
+    Workers are started on demand, while there are more queued tasks than
+    idle workers, and are stopped again when the pool shrinks.
+    """
+
+    TUNE_INTERVAL = 1.0  # seconds between tuner checks
+    GROW_AFTER = 5.0  # seconds of saturation before adding a worker
+    SHRINK_AFTER = 60.0  # seconds of idleness before dropping a worker
+    LATENCY_ALPHA = 0.2  # weight of the newest sample in the latency EWMAs
+
+    def __init__(self, min_workers: int, max_workers: int, thread_name_prefix: str = 'monitor'):
+        """
+        Initialize executor.
+
+        Args:
+            min_workers: Number of workers the pool starts with and never goes below
+            max_workers: Most workers the pool will grow to
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self.min_workers = min_workers
+        self.max_workers = max(max_workers, min_workers)
+        self._thread_name_prefix = thread_name_prefix
+        self._thread_counter = itertools.count()
+
+        # Queued (future, enqueued_at, fn, args, kwargs); None stops a worker
+        self._work_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: Set[threading.Thread] = set()
+        self._workers = min_workers
+        self._idle = 0
+        self._shutdown = False
+
+        # Guards the worker bookkeeping above as well as the counters
+        self._stats_lock = threading.Lock()
+        self._task_count = 0
+        self._queue_size = 0
+        self._busy = 0
+        self._avg_wait = 0.0
+        self._avg_latency = 0.0
+        self._max_latency = 0.0
+
+        self._tuner_stop = threading.Event()
+        self._tuner = threading.Thread(target=self._tune_loop, name=f"{thread_name_prefix}-tuner", daemon=True)
+        self._tuner.start()
+
+    @property
+    def workers(self) -> int:
+        """Current worker limit"""
+        return self._workers
+
+    @property
+    def task_count(self) -> int:
+        """Tasks completed so far"""
+        return self._task_count
+
+    @property
+    def queue_size(self) -> int:
+        """Tasks submitted but not yet started"""
+        return self._queue_size
+
+    @property
+    def current_threads_busy(self) -> int:
+        """Tasks currently running"""
+        return self._busy
+
+    @property
+    def avg_queue_wait(self) -> float:
+        """Moving average of the time tasks wait for a worker (seconds)"""
+        return self._avg_wait
+
+    @property
+    def avg_task_latency(self) -> float:
+        """Moving average of task run time (seconds)"""
+        return self._avg_latency
+
+    @property
+    def max_task_latency(self) -> float:
+        """Longest task run time seen (seconds)"""
+        return self._max_latency
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the pool's counters.
+
+        Returns:
+            Dictionary of counter name to value
+        """
+        with self._stats_lock:
+            return {
+                'workers': self._workers,
+                'task_count': self._task_count,
+                'queue_size': self._queue_size,
+                'current_threads_busy': self._busy,
+                'avg_queue_wait': self._avg_wait,
+                'avg_task_latency': self._avg_latency,
+                'max_task_latency': self._max_latency
+            }
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs), recording how long it waits and runs"""
+        future = Future()
+        with self._stats_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._queue_size += 1
+            self._work_queue.put((future, time.perf_counter(), fn, args, kwargs))
+            self._start_workers()
+        return future
+
+    def _start_workers(self) -> None:
+        """Start workers for queued tasks no idle worker will pick up (call with _stats_lock held)"""
+        while self._queue_size > self._idle and len(self._threads) < self._workers:
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"{self._thread_name_prefix}_{next(self._thread_counter)}",
+                daemon=True
+            )
+            self._threads.add(thread)
+            self._idle += 1
+            thread.start()
+
+    def _worker(self) -> None:
+        """Run queued tasks until told to stop"""
+        alpha = self.LATENCY_ALPHA
+        try:
+            while True:
+                item = self._work_queue.get()
+                if item is None:
+                    return
+
+                future, enqueued_at, fn, args, kwargs = item
+                started_at = time.perf_counter()
+                with self._stats_lock:
+                    self._queue_size -= 1
+                    self._idle -= 1
+                    self._busy += 1
+                    self._avg_wait += alpha * ((started_at - enqueued_at) - self._avg_wait)
+
+                try:
+                    if future.set_running_or_notify_cancel():
+                        try:
+                            result = fn(*args, **kwargs)
+                        except BaseException as e:
+                            future.set_exception(e)
+                        else:
+                            future.set_result(result)
+                finally:
+                    latency = time.perf_counter() - started_at
+                    with self._stats_lock:
+                        self._busy -= 1
+                        self._idle += 1
+                        self._task_count += 1
+                        self._avg_latency += alpha * (latency - self._avg_latency)
+                        if latency > self._max_latency:
+                            self._max_latency = latency
+                    # Drop references so a finished task can be freed while idle
+                    del future, fn, args, kwargs, item
+        finally:
+            with self._stats_lock:
+                self._idle -= 1
+                self._threads.discard(threading.current_thread())
+
+    def _tune_loop(self) -> None:
+        """Grow the pool while it is saturated and shrink it while idle"""
+        saturated_since = None
+        idle_since = None
+
+        while not self._tuner_stop.wait(self.TUNE_INTERVAL):
+            now = time.monotonic()
+            with self._stats_lock:
+                queue_size = self._queue_size
+                busy = self._busy
+                workers = self._workers
+
+            if queue_size > workers / 2:
+                idle_since = None
+                if saturated_since is None:
+                    saturated_since = now
+                elif now - saturated_since >= self.GROW_AFTER and workers < self.max_workers:
+                    self._resize(workers + 1)
+                    saturated_since = now
+            elif queue_size == 0 and busy == 0:
+                saturated_since = None
+                if idle_since is None:
+                    idle_since = now
+                elif now - idle_since >= self.SHRINK_AFTER and workers > self.min_workers:
+                    self._resize(workers - 1)
+                    idle_since = now
+            else:
+                saturated_since = None
+                idle_since = None
+
+    def _resize(self, workers: int) -> None:
+        """Change the worker limit, starting or stopping a worker to match"""
+        with self._stats_lock:
+            if self._shutdown:
+                return
+            logger.info(
+                f"Resizing monitor pool: {self._workers} -> {workers} workers "
+                f"(queue {self._queue_size}, avg task {self._avg_latency:.2f}s)"
+            )
+            self._workers = workers
+            if len(self._threads) > workers:
+                # Only shrinks while idle, so a waiting worker takes this next
+                self._work_queue.put(None)
+            else:
+                self._start_workers()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stop the tuner and the workers.
+
+        Tasks already queued still run unless cancel_futures is set.
+
+        Args:
+            wait: Block until the workers have exited
+            cancel_futures: Cancel tasks that haven't started yet
+        """
+        self._tuner_stop.set()
+        with self._stats_lock:
+            self._shutdown = True
+            threads = list(self._threads)
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        self._queue_size -= 1
+                        item[0].cancel()
+            for _ in threads:
+                self._work_queue.put(None)
+
+        if wait:
+            for thread in threads:
+                thread.join()
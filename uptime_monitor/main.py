@@ -11,7 +11,12 @@ from threading import Event
 from uptime_monitor.config import load_config
 from uptime_monitor.database import init_database
 from uptime_monitor.scheduler import MonitorScheduler
-from uptime_monitor.webapp import app, init_app
+from uptime_monitor.webapp import app, init_app, start_config_watcher
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
 
 # Setup logging
 logging.basicConfig(
@@ -27,12 +32,17 @@ logger = logging.getLogger(__name__)
 
 # Global shutdown event
 shutdown_event = Event()
-scheduler = None
+
+# Concurrent monitor checks; the database connection pool is sized to match
+MAX_WORKERS = 10
+
+# Request handler threads for the web server (waitress only)
+WEB_THREADS = 8
 
 
 def get_scheduler():
     """Get the global scheduler instance"""
-    return scheduler
+    return app.scheduler
 
 
 def signal_handler(signum, frame):
@@ -40,6 +50,7 @@ def signal_handler(signum, frame):
     logger.info(f"Received signal {signum}, shutting down...")
     shutdown_event.set()
 
+    scheduler = get_scheduler()
     if scheduler:
         scheduler.stop()
 
@@ -48,7 +59,7 @@ def signal_handler(signum, frame):
 
 def main():
     """Main application entry point"""
-    global scheduler
+    scheduler = None
 
     try:
         logger.info("=" * 60)
@@ -66,7 +77,7 @@ def main():
         # Initialize database
         logger.info("Initializing database...")
         db_path = config.get_database_path()
-        init_database(f"sqlite:///{db_path}")
+        init_database(f"sqlite:///{db_path}", max_workers=MAX_WORKERS)
 
         # Initialize Flask app
         logger.info("Initializing web application...")
@@ -74,11 +85,14 @@ def main():
 
         # Start monitoring scheduler
         logger.info("Starting monitor scheduler...")
-        scheduler = MonitorScheduler(max_workers=10)
+        scheduler = MonitorScheduler(max_workers=MAX_WORKERS)
+
+        # Store scheduler reference on the Flask app for access from routes
+        app.scheduler = scheduler
         scheduler.start()
 
-        # Store scheduler reference in Flask app for access from routes
-        app.config['SCHEDULER'] = scheduler
+        # Hot reload monitors when config.yaml is edited by hand
+        start_config_watcher()
 
         # Get web server configuration
         web_config = config.get_web_config()
@@ -91,14 +105,19 @@ def main():
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 60)
 
-        # Start Flask web server (blocking)
-        app.run(
-            host=host,
-            port=port,
-            debug=False,
-            use_reloader=False,  # Disable reloader to avoid duplicate scheduler
-            threaded=True
-        )
+        # Start web server (blocking). Prefer waitress, a production WSGI
+        # server that runs in this process (so it shares the scheduler),
+        # over Flask's development server
+        if serve is not None:
+            serve(app, host=host, port=port, threads=WEB_THREADS)
+        else:
+            app.run(
+                host=host,
+                port=port,
+                debug=False,
+                use_reloader=False,  # Disable reloader to avoid duplicate scheduler
+                threaded=True
+            )
 
     except FileNotFoundError as e:
         logger.error(f"Configuration file not found: {e}")
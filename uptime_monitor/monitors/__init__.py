@@ -2,6 +2,8 @@
 Monitor implementations for various service types.
 """
 
-from uptime_monitor.monitors.base import Monitor, MonitorResult, MonitorStatus
+from uptime_monitor.monitors.base import (
+    Monitor, MonitorResult, MonitorStatus, ValidationError, run_checks
+)
 
-__all__ = ['Monitor', 'MonitorResult', 'MonitorStatus']
+__all__ = ['Monitor', 'MonitorResult', 'MonitorStatus', 'ValidationError', 'run_checks']
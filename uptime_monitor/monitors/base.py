@@ -5,13 +5,25 @@ Base monitor class that all monitor implementations inherit from.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
-from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
+import asyncio
+import json
+import random
+import sys
 import time
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses need Python 3.10+; older interpreters get a regular one
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class MonitorStatus(Enum):
     """Monitor status enumeration"""
@@ -21,7 +33,12 @@ class MonitorStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+class ValidationError(Exception):
+    """Response validation failure (the message is reported as the check error)"""
+    pass
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MonitorResult:
     """Result of a monitor check"""
     status: MonitorStatus
@@ -29,7 +46,13 @@ class MonitorResult:
     status_code: Optional[int] = None
     error_message: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: float = field(default_factory=time.time)  # epoch seconds
+    retriable: bool = True  # False when retrying cannot change the outcome
+
+    @property
+    def utc_datetime(self) -> datetime:
+        """Check time as a naive UTC datetime (for the database and display)"""
+        return datetime.fromtimestamp(self.timestamp, timezone.utc).replace(tzinfo=None)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary"""
@@ -39,9 +62,23 @@ class MonitorResult:
             'status_code': self.status_code,
             'error_message': self.error_message,
             'metadata': self.metadata,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.utc_datetime.isoformat()
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize result to UTF-8 JSON (same shape as to_dict())"""
+        if orjson is not None:
+            # orjson handles the Enum and datetime natively
+            return orjson.dumps({
+                'status': self.status,
+                'response_time': self.response_time,
+                'status_code': self.status_code,
+                'error_message': self.error_message,
+                'metadata': self.metadata,
+                'timestamp': self.utc_datetime
+            }, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.to_dict()).encode('utf-8')
+
 
 class Monitor(ABC):
     """
@@ -75,6 +112,10 @@ class Monitor(ABC):
         self.retry_count = retry_count
         self.retry_delay = retry_delay
 
+        # Notification routing, set by the scheduler from the monitor's config
+        self.alert_on: FrozenSet[str] = frozenset(('down', 'up'))
+        self.notification_names: Tuple[str, ...] = ()
+
     @abstractmethod
     def check(self) -> MonitorResult:
         """
@@ -98,7 +139,7 @@ class Monitor(ABC):
 
         for attempt in range(1, self.retry_count + 1):
             try:
-                logger.debug(f"Monitor '{self.name}': Attempt {attempt}/{self.retry_count}")
+                logger.debug("Monitor '%s': Attempt %d/%d", self.name, attempt, self.retry_count)
                 result = self.check()
 
                 # If check succeeded, return immediately
@@ -108,13 +149,18 @@ class Monitor(ABC):
                 # Store result for potential return
                 last_result = result
 
+                # Definitive failures won't change on retry
+                if not result.retriable:
+                    break
+
                 # If not the last attempt, wait before retrying
                 if attempt < self.retry_count:
-                    logger.debug(f"Monitor '{self.name}': Check failed, retrying in {self.retry_delay}s")
-                    time.sleep(self.retry_delay)
+                    delay = self._backoff_delay(attempt)
+                    logger.debug("Monitor '%s': Check failed, retrying in %.1fs", self.name, delay)
+                    time.sleep(delay)
 
             except Exception as e:
-                logger.error(f"Monitor '{self.name}': Check failed with exception: {e}")
+                logger.error("Monitor '%s': Check failed with exception: %s", self.name, e)
                 last_result = MonitorResult(
                     status=MonitorStatus.DOWN,
                     error_message=str(e)
@@ -122,7 +168,91 @@ class Monitor(ABC):
 
                 # If not the last attempt, wait before retrying
                 if attempt < self.retry_count:
-                    time.sleep(self.retry_delay)
+                    time.sleep(self._backoff_delay(attempt))
+
+        # Return the last result (either failed check or exception)
+        return last_result if last_result else MonitorResult(
+            status=MonitorStatus.UNKNOWN,
+            error_message="No result from check"
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the wait before the next retry.
+
+        The delay doubles with each attempt and is jittered by +/-50% so
+        monitors that fail together don't all retry in lockstep.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            Delay in seconds
+        """
+        return self.retry_delay * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+    async def check_async(self) -> MonitorResult:
+        """
+        Perform the monitor check without blocking the event loop.
+
+        The default implementation runs the blocking check() in the event
+        loop's default executor. Subclasses backed by an asyncio-capable
+        client override this with a native implementation.
+
+        Returns:
+            MonitorResult with status, response time, and metadata
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.check)
+
+    async def check_with_retry_async(self, first_attempt: int = 1) -> MonitorResult:
+        """
+        Perform check with retry logic, asynchronously.
+
+        Equivalent to check_with_retry(), but waits between attempts with
+        asyncio.sleep() so many monitors can be checked concurrently on a
+        single event loop.
+
+        Args:
+            first_attempt: Attempt to start at; the attempts before it already
+                failed elsewhere, so their backoff is waited out first
+
+        Returns:
+            MonitorResult from the check (last attempt if all fail)
+        """
+        last_result = None
+
+        if first_attempt > 1:
+            await asyncio.sleep(self._backoff_delay(first_attempt - 1))
+
+        for attempt in range(first_attempt, self.retry_count + 1):
+            try:
+                logger.debug("Monitor '%s': Attempt %d/%d", self.name, attempt, self.retry_count)
+                result = await self.check_async()
+
+                # If check succeeded, return immediately
+                if result.status == MonitorStatus.UP:
+                    return result
+
+                # Store result for potential return
+                last_result = result
+
+                # Definitive failures won't change on retry
+                if not result.retriable:
+                    break
+
+            except Exception as e:
+                logger.error("Monitor '%s': Check failed with exception: %s", self.name, e)
+                last_result = MonitorResult(
+                    status=MonitorStatus.DOWN,
+                    error_message=str(e)
+                )
+
+            # If not the last attempt, wait before retrying
+            if attempt < self.retry_count:
+                delay = self._backoff_delay(attempt)
+                logger.debug("Monitor '%s': Check failed, retrying in %.1fs", self.name, delay)
+                await asyncio.sleep(delay)
 
         # Return the last result (either failed check or exception)
         return last_result if last_result else MonitorResult(
@@ -132,3 +262,37 @@ class Monitor(ABC):
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(name='{self.name}')>"
+
+
+async def run_checks(monitors: Iterable[Monitor],
+                     semaphore: Optional[asyncio.Semaphore] = None,
+                     first_attempt: int = 1) -> List[MonitorResult]:
+    """
+    Check many monitors concurrently on the running event loop.
+
+    Args:
+        monitors: Monitors to check
+        semaphore: Bounds how many checks run at once, if given
+        first_attempt: Retry attempt to start at (see Monitor.check_with_retry_async)
+
+    Returns:
+        One MonitorResult per monitor, in the same order
+    """
+    async def check(monitor: Monitor) -> MonitorResult:
+        if semaphore is None:
+            return await monitor.check_with_retry_async(first_attempt)
+        async with semaphore:
+            return await monitor.check_with_retry_async(first_attempt)
+
+    results = await asyncio.gather(
+        *(check(monitor) for monitor in monitors),
+        return_exceptions=True
+    )
+
+    return [
+        result if isinstance(result, MonitorResult) else MonitorResult(
+            status=MonitorStatus.DOWN,
+            error_message=f"Check failed: {result}"
+        )
+        for result in results
+    ]
@@ -3,7 +3,9 @@ DNS resolution monitor.
 """
 
 import time
+from typing import Dict, List, Optional, Tuple
 import dns.resolver
+from dns.resolver import NXDOMAIN, NoAnswer
 from dns.exception import DNSException, Timeout
 from uptime_monitor.monitors.base import Monitor, MonitorResult, MonitorStatus
 import logging
@@ -14,6 +16,38 @@ logger = logging.getLogger(__name__)
 class DNSMonitor(Monitor):
     """DNS resolution monitor"""
 
+    # Resolved values shared by all monitors, keyed by
+    # (hostname, record_type, resolver): (expires_at, values, record_ttl)
+    _dns_cache: Dict[Tuple[str, str, str], Tuple[float, List[str], int]] = {}
+    DEFAULT_CACHE_MAX_TTL = 900  # seconds
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolver: Optional[dns.resolver.Resolver] = None
+        self._resolver_ip: Optional[str] = None
+
+    def _get_resolver(self, resolver_ip: str) -> dns.resolver.Resolver:
+        """
+        Get the resolver for this monitor, building it on first use.
+
+        The resolver is created without reading /etc/resolv.conf and is
+        rebuilt only if the configured nameserver changes.
+
+        Args:
+            resolver_ip: Nameserver to query
+
+        Returns:
+            Configured dns.resolver.Resolver
+        """
+        if self._resolver is None or self._resolver_ip != resolver_ip:
+            resolver = dns.resolver.Resolver(configure=False)
+            resolver.nameservers = [resolver_ip]
+            resolver.timeout = self.timeout
+            resolver.lifetime = self.timeout
+            self._resolver = resolver
+            self._resolver_ip = resolver_ip
+        return self._resolver
+
     def check(self) -> MonitorResult:
         """
         Perform DNS resolution check.
@@ -31,31 +65,44 @@ class DNSMonitor(Monitor):
         if not hostname:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                error_message="No hostname configured"
+                error_message="No hostname configured",
+                retriable=False
             )
 
-        start_time = time.time()
+        cache_key = (hostname, record_type, resolver_ip)
+        cache_max_ttl = self._cache_max_ttl()
+        start_time = time.monotonic()
 
         try:
-            # Create resolver
-            resolver = dns.resolver.Resolver()
-            resolver.nameservers = [resolver_ip]
-            resolver.timeout = self.timeout
-            resolver.lifetime = self.timeout
-
-            # Perform DNS query
-            answers = resolver.resolve(hostname, record_type)
-            response_time = (time.time() - start_time) * 1000
-
-            # Extract resolved values
-            resolved_values = []
-            for rdata in answers:
-                if record_type == 'MX':
-                    resolved_values.append(str(rdata.exchange))
-                elif record_type == 'TXT':
-                    resolved_values.append(str(rdata))
-                else:
-                    resolved_values.append(str(rdata))
+            cached = self._dns_cache.get(cache_key) if cache_max_ttl else None
+            cache_hit = cached is not None and time.monotonic() < cached[0]
+
+            if cache_hit:
+                # Record still within its TTL; skip the query
+                resolved_values = cached[1]
+                response_time = 0.0
+            else:
+                # Perform DNS query
+                answers = self._get_resolver(resolver_ip).resolve(hostname, record_type)
+                response_time = (time.monotonic() - start_time) * 1000
+
+                # Extract resolved values
+                resolved_values = []
+                for rdata in answers:
+                    if record_type == 'MX':
+                        resolved_values.append(str(rdata.exchange))
+                    elif record_type == 'TXT':
+                        resolved_values.append(str(rdata))
+                    else:
+                        resolved_values.append(str(rdata))
+
+                if cache_max_ttl:
+                    record_ttl = answers.rrset.ttl
+                    self._dns_cache[cache_key] = (
+                        time.monotonic() + min(record_ttl, cache_max_ttl),
+                        resolved_values,
+                        record_ttl
+                    )
 
             # Validate results if expected values are configured
             if expected_values:
@@ -84,28 +131,53 @@ class DNSMonitor(Monitor):
                     'hostname': hostname,
                     'record_type': record_type,
                     'resolver': resolver_ip,
-                    'resolved_values': resolved_values
+                    'resolved_values': resolved_values,
+                    'cache_hit': cache_hit
                 }
             )
 
         except Timeout:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                response_time=(time.time() - start_time) * 1000,
+                response_time=(time.monotonic() - start_time) * 1000,
                 error_message=f"DNS query timed out after {self.timeout}s"
             )
+        except (NXDOMAIN, NoAnswer) as e:
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message=f"DNS error: {str(e)}",
+                retriable=False
+            )
         except DNSException as e:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"DNS error: {str(e)}"
             )
         except Exception as e:
-            logger.error(f"DNS monitor '{self.name}' failed: {e}")
+            logger.error("DNS monitor '%s' failed: %s", self.name, e)
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"DNS check failed: {str(e)}"
             )
 
+    def _cache_max_ttl(self) -> int:
+        """
+        Get the longest time a resolved record may be served from cache.
+
+        The ``cache_ttl`` config option is ``true`` (default, honor record
+        TTLs up to DEFAULT_CACHE_MAX_TTL), ``false``/``0`` (always query) or
+        a number of seconds to clamp record TTLs to.
+
+        Returns:
+            Maximum cache lifetime in seconds (0 disables caching)
+        """
+        cache_ttl = self.config.get('cache_ttl', True)
+        if cache_ttl is True:
+            return self.DEFAULT_CACHE_MAX_TTL
+        if not cache_ttl:
+            return 0
+        return int(cache_ttl)
+
     def _validate_values(self, resolved: list, expected: list, mode: str) -> bool:
         """
         Validate resolved values against expected values.
@@ -121,9 +193,10 @@ class DNSMonitor(Monitor):
         if mode == 'exact':
             # Exact match (same values, same order)
             return resolved == expected
-        elif mode == 'all':
+        resolved_set = set(resolved)
+        if mode == 'all':
             # All expected values must be present
-            return all(exp in resolved for exp in expected)
+            return resolved_set.issuperset(expected)
         else:  # 'any'
             # At least one expected value must be present
-            return any(exp in resolved for exp in expected)
+            return not resolved_set.isdisjoint(expected)
@@ -15,6 +15,37 @@ logger = logging.getLogger(__name__)
 class DockerMonitor(Monitor):
     """Docker container health monitor"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._client: Optional[docker.DockerClient] = None
+
+    def _get_client(self) -> docker.DockerClient:
+        """
+        Get the Docker client, connecting on first use.
+
+        The client (and its connection pool) is kept between checks and
+        only rebuilt after an API or connection error.
+
+        Returns:
+            Connected DockerClient
+        """
+        if self._client is None:
+            socket_path = self.config.get('socket', '/var/run/docker.sock')
+            if socket_path.startswith('tcp://'):
+                self._client = docker.DockerClient(base_url=socket_path)
+            else:
+                self._client = docker.DockerClient(base_url=f'unix://{socket_path}')
+        return self._client
+
+    def _reset_client(self) -> None:
+        """Drop the cached Docker client so the next check reconnects"""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:
+                pass
+            self._client = None
+
     def check(self) -> MonitorResult:
         """
         Perform Docker container health check.
@@ -22,35 +53,31 @@ class DockerMonitor(Monitor):
         Returns:
             MonitorResult with status and container info
         """
-        socket_path = self.config.get('socket', '/var/run/docker.sock')
         container_name = self.config.get('container_name')
         container_id = self.config.get('container_id')
         expect_status = self.config.get('expect_status', 'running')
         check_health = self.config.get('check_health', False)
+        force_refresh = self.config.get('force_refresh', False)
 
         if not container_name and not container_id:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                error_message="No container_name or container_id configured"
+                error_message="No container_name or container_id configured",
+                retriable=False
             )
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            # Connect to Docker
-            if socket_path.startswith('tcp://'):
-                client = docker.DockerClient(base_url=socket_path)
-            else:
-                client = docker.DockerClient(base_url=f'unix://{socket_path}')
-
             # Get container
             identifier = container_id if container_id else container_name
-            container = client.containers.get(identifier)
+            container = self._get_client().containers.get(identifier)
 
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.monotonic() - start_time) * 1000
 
-            # Get container status
-            container.reload()  # Refresh container info
+            # Get container status; get() already returns fresh attrs
+            if force_refresh:
+                container.reload()
             actual_status = container.status
 
             # Check if status matches expected
@@ -87,20 +114,24 @@ class DockerMonitor(Monitor):
         except NotFound:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                error_message=f"Container '{identifier}' not found"
+                error_message=f"Container '{identifier}' not found",
+                retriable=False
             )
         except APIError as e:
+            self._reset_client()
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"Docker API error: {str(e)}"
             )
         except DockerException as e:
+            self._reset_client()
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"Docker error: {str(e)}"
             )
         except Exception as e:
-            logger.error(f"Docker monitor '{self.name}' failed: {e}")
+            logger.error("Docker monitor '%s' failed: %s", self.name, e)
+            self._reset_client()
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"Docker check failed: {str(e)}"
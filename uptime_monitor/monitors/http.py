@@ -2,29 +2,85 @@
 HTTP/HTTPS monitor with keyword and JSON query validation support.
 """
 
+import codecs
 import time
 import re
 import ssl
 import socket
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError, SSLError
 from jsonpath_ng import parse as jsonpath_parse
 from jsonpath_ng.exceptions import JsonPathParserError
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 
-from uptime_monitor.monitors.base import Monitor, MonitorResult, MonitorStatus
+from uptime_monitor.database import json_loads
+from uptime_monitor.monitors.base import Monitor, MonitorResult, MonitorStatus, ValidationError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# JSONPath expressions made only of plain field names and list indexes,
+# e.g. "$.data.items[0].status", are walked directly instead of via jsonpath_ng
+_SIMPLE_JSONPATH_RE = re.compile(r'^\$(\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])+$')
+_SIMPLE_JSONPATH_STEP_RE = re.compile(r'\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]')
+
 
 class HTTPMonitor(Monitor):
     """HTTP/HTTPS monitor with support for keyword and JSON validation"""
 
+    # Parsed certificate info keyed by (hostname, port), shared by all
+    # monitors: (expires_at, not_valid_after, info)
+    _cert_cache: Dict[Tuple[str, int], Tuple[float, datetime, Dict[str, Any]]] = {}
+    CERT_CACHE_TTL = 3600  # seconds
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._session: Optional[requests.Session] = None
+        self._head_unsupported = False
+        self._ssl_cert: Optional[Tuple[datetime, Dict[str, Any]]] = None
+
+        # Compile the keyword regex once so checks don't pay for it
+        self._compiled_patterns: Dict[str, re.Pattern] = {}
+        keyword_config = self.config.get('keyword') or {}
+        if keyword_config.get('regex', False):
+            self._compile_pattern(keyword_config.get('search_for', ''))
+
+        # Parse the JSONPath expression once; jsonpath_ng's parser is slow
+        self._jsonpath_path: Optional[str] = None
+        self._jsonpath_expr = None
+        self._jsonpath_steps: Optional[List[Union[str, int]]] = None
+        self._jsonpath_error: Optional[str] = None
+        json_query_config = self.config.get('json_query') or {}
+        if json_query_config.get('path'):
+            self._parse_jsonpath(json_query_config['path'])
+
+    def _get_session(self) -> requests.Session:
+        """
+        Get the keep-alive session used for this monitor's requests.
+
+        The session is created on first use so TCP connections and TLS
+        sessions are reused between checks instead of being renegotiated
+        every interval. Cookies are cleared before each check so results
+        don't depend on state left over from a previous probe.
+
+        Returns:
+            requests.Session with a pooled adapter mounted
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        else:
+            self._session.cookies.clear()
+        return self._session
+
     def check(self) -> MonitorResult:
         """
         Perform HTTP(S) check.
@@ -36,7 +92,8 @@ class HTTPMonitor(Monitor):
         if not url:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                error_message="No URL configured"
+                error_message="No URL configured",
+                retriable=False
             )
 
         method = self.config.get('method', 'GET').upper()
@@ -45,60 +102,89 @@ class HTTPMonitor(Monitor):
         follow_redirects = self.config.get('follow_redirects', True)
         verify_ssl = self.config.get('verify_ssl', True)
         body = self.config.get('body')
+        reuse_connections = self.config.get('reuse_connections', True)
+        keyword_config = self.config.get('keyword')
+        json_query_config = self.config.get('json_query')
+
+        # A keyword-only check can stop reading the body at the first match
+        stream_body = bool(keyword_config) and not json_query_config
+
+        # Status-only GET checks use HEAD so the body is never downloaded
+        use_head = (
+            method == 'GET'
+            and not keyword_config
+            and not json_query_config
+            and self.config.get('auto_head', True)
+            and not self._head_unsupported
+        )
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Make HTTP request
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=body,
-                timeout=self.timeout,
-                allow_redirects=follow_redirects,
-                verify=verify_ssl
-            )
+            send = self._get_session().request if reuse_connections else requests.request
+            request_args = {
+                'url': url,
+                'headers': headers,
+                'data': body,
+                'timeout': self.timeout,
+                'allow_redirects': follow_redirects,
+                'verify': verify_ssl,
+                'stream': stream_body
+            }
+            response = send(method='HEAD' if use_head else method, **request_args)
+
+            if use_head and response.status_code not in expected_codes:
+                # Server may not handle HEAD like GET; confirm with a real GET
+                if response.status_code in (405, 501):
+                    self._head_unsupported = True
+                start_time = time.monotonic()
+                response = send(method=method, **request_args)
+                use_head = False
 
-            response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+            response_time = (time.monotonic() - start_time) * 1000  # Convert to milliseconds
 
             # Check status code
             if response.status_code not in expected_codes:
+                response.close()
                 return MonitorResult(
                     status=MonitorStatus.DOWN,
                     response_time=response_time,
                     status_code=response.status_code,
-                    error_message=f"Unexpected status code: {response.status_code} (expected {expected_codes})"
+                    error_message=f"Unexpected status code: {response.status_code} (expected {expected_codes})",
+                    retriable=self._is_retriable_status(response.status_code)
                 )
 
-            # Perform keyword validation if configured
-            keyword_config = self.config.get('keyword')
-            if keyword_config:
-                keyword_valid = self._validate_keyword(response.text, keyword_config)
-                if not keyword_valid:
-                    return MonitorResult(
-                        status=MonitorStatus.DOWN,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        error_message="Keyword validation failed"
-                    )
-
-            # Perform JSON query validation if configured
-            json_query_config = self.config.get('json_query')
-            if json_query_config:
-                json_valid, json_error = self._validate_json(response, json_query_config)
-                if not json_valid:
-                    return MonitorResult(
-                        status=MonitorStatus.DOWN,
-                        response_time=response_time,
-                        status_code=response.status_code,
-                        error_message=f"JSON validation failed: {json_error}"
-                    )
+            content_length = None
+            try:
+                # Perform keyword validation if configured
+                if keyword_config:
+                    if stream_body:
+                        content_length = self._search_stream(response, keyword_config)
+                    else:
+                        self._validate_keyword(response.text, keyword_config)
+
+                # Perform JSON query validation if configured
+                if json_query_config:
+                    self._validate_json(response, json_query_config)
+
+            except ValidationError as e:
+                return MonitorResult(
+                    status=MonitorStatus.DOWN,
+                    response_time=response_time,
+                    status_code=response.status_code,
+                    error_message=str(e)
+                )
 
             # Check SSL certificate if HTTPS
+            # Certificate info is refreshed by the scheduler on a slow cadence;
+            # only the first check (or one after a failed lookup) fetches it
             ssl_info = {}
             if url.startswith('https://'):
-                ssl_info = self._check_ssl_certificate(url)
+                if self._ssl_cert is None:
+                    self.refresh_ssl_info()
+                if self._ssl_cert is not None:
+                    ssl_info = self._ssl_info(*self._ssl_cert)
 
             # All checks passed
             return MonitorResult(
@@ -106,7 +192,7 @@ class HTTPMonitor(Monitor):
                 response_time=response_time,
                 status_code=response.status_code,
                 metadata={
-                    'content_length': len(response.content),
+                    'content_length': self._content_length(response, use_head, content_length),
                     'url': url,
                     **ssl_info
                 }
@@ -115,7 +201,7 @@ class HTTPMonitor(Monitor):
         except Timeout:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                response_time=(time.time() - start_time) * 1000,
+                response_time=(time.monotonic() - start_time) * 1000,
                 error_message=f"Request timed out after {self.timeout}s"
             )
         except SSLError as e:
@@ -134,13 +220,52 @@ class HTTPMonitor(Monitor):
                 error_message=f"Request failed: {str(e)}"
             )
         except Exception as e:
-            logger.error(f"HTTP monitor '{self.name}' failed with unexpected error: {e}")
+            logger.error("HTTP monitor '%s' failed with unexpected error: %s", self.name, e)
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"Unexpected error: {str(e)}"
             )
 
-    def _validate_keyword(self, content: str, keyword_config: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _content_length(response: requests.Response, is_head: bool, bytes_read: Optional[int]) -> int:
+        """
+        Get the body size to report for a response.
+
+        Args:
+            response: HTTP response
+            is_head: Whether the response is to a HEAD request
+            bytes_read: Bytes read from a streamed body, if streamed
+
+        Returns:
+            Body size in bytes
+        """
+        if bytes_read is not None:
+            return bytes_read
+        if is_head:
+            # No body was sent; report the size the server advertised
+            try:
+                return int(response.headers.get('Content-Length', 0))
+            except ValueError:
+                return 0
+        return len(response.content)
+
+    @staticmethod
+    def _is_retriable_status(status_code: int) -> bool:
+        """
+        Check whether an unexpected status code may change on retry.
+
+        Client errors (other than timeouts and rate limiting) are definitive;
+        server errors and anything else are worth retrying.
+
+        Args:
+            status_code: HTTP status code
+
+        Returns:
+            True if the request should be retried
+        """
+        return not (400 <= status_code < 500) or status_code in (408, 425, 429)
+
+    def _validate_keyword(self, content: str, keyword_config: Dict[str, Any]) -> None:
         """
         Validate keyword in response content.
 
@@ -148,8 +273,8 @@ class HTTPMonitor(Monitor):
             content: Response content
             keyword_config: Keyword validation config
 
-        Returns:
-            True if validation passes, False otherwise
+        Raises:
+            ValidationError: If validation fails
         """
         search_for = keyword_config.get('search_for', '')
         use_regex = keyword_config.get('regex', False)
@@ -157,20 +282,114 @@ class HTTPMonitor(Monitor):
 
         if use_regex:
             # Regex search
-            try:
-                pattern = re.compile(search_for)
-                found = pattern.search(content) is not None
-            except re.error as e:
-                logger.error(f"Invalid regex pattern '{search_for}': {e}")
-                return False
+            pattern = self._compiled_patterns.get(search_for) or self._compile_pattern(search_for)
+            if pattern is None:
+                raise ValidationError("Keyword validation failed")
+            found = pattern.search(content) is not None
         else:
             # Plain string search
             found = search_for in content
 
         # Apply invert logic
-        return not found if invert else found
+        if found == invert:
+            raise ValidationError("Keyword validation failed")
+
+    def _search_stream(self, response: requests.Response, keyword_config: Dict[str, Any]) -> int:
+        """
+        Validate keyword while streaming the response body.
+
+        Plain-string searches stop reading at the first match. Regex
+        searches read the body and search it once. Either way at most
+        ``max_body_bytes`` are read, and the response is closed afterwards.
+
+        Args:
+            response: Streamed HTTP response
+            keyword_config: Keyword validation config
+
+        Returns:
+            Number of bytes read
 
-    def _validate_json(self, response: requests.Response, json_config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+        Raises:
+            ValidationError: If validation fails
+        """
+        search_for = keyword_config.get('search_for', '')
+        use_regex = keyword_config.get('regex', False)
+        invert = keyword_config.get('invert', False)
+        max_bytes = self.config.get('max_body_bytes', 1_000_000)
+
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        pattern = None
+        if use_regex:
+            pattern = self._compiled_patterns.get(search_for) or self._compile_pattern(search_for)
+            if pattern is None:
+                response.close()
+                raise ValidationError("Keyword validation failed")
+
+        bytes_read = 0
+        parts = []
+        tail = ''
+        overlap = len(search_for) - 1
+        found = search_for == ''
+
+        try:
+            for chunk in response.iter_content(chunk_size=16384):
+                bytes_read += len(chunk)
+                text = decoder.decode(chunk)
+
+                if pattern is not None:
+                    parts.append(text)
+                else:
+                    # Keep the end of the previous chunk so matches spanning
+                    # a chunk boundary are found
+                    window = tail + text
+                    if search_for in window:
+                        found = True
+                        break
+                    tail = window[-overlap:] if overlap > 0 else ''
+
+                if bytes_read >= max_bytes:
+                    break
+            else:
+                text = decoder.decode(b'', final=True)
+                if pattern is not None:
+                    parts.append(text)
+                elif search_for in tail + text:
+                    found = True
+        finally:
+            response.close()
+
+        if pattern is not None:
+            found = pattern.search(''.join(parts)) is not None
+
+        # Apply invert logic
+        if found == invert:
+            raise ValidationError("Keyword validation failed")
+        return bytes_read
+
+    def _compile_pattern(self, search_for: str) -> Optional[re.Pattern]:
+        """
+        Compile a keyword regex and remember it for later checks.
+
+        Args:
+            search_for: Regex pattern
+
+        Returns:
+            Compiled pattern, or None if the pattern is invalid
+        """
+        try:
+            pattern = re.compile(search_for)
+        except re.error as e:
+            logger.error("Invalid regex pattern '%s': %s", search_for, e)
+            return None
+
+        self._compiled_patterns[search_for] = pattern
+        return pattern
+
+    def _validate_json(self, response: requests.Response, json_config: Dict[str, Any]) -> None:
         """
         Validate JSON response using JSONPath.
 
@@ -178,46 +397,116 @@ class HTTPMonitor(Monitor):
             response: HTTP response
             json_config: JSON validation config
 
-        Returns:
-            Tuple of (is_valid, error_message)
+        Raises:
+            ValidationError: If validation fails
         """
         try:
-            json_data = response.json()
+            json_data = json_loads(response.content)
         except ValueError as e:
-            return False, f"Response is not valid JSON: {str(e)}"
+            raise ValidationError(f"JSON validation failed: Response is not valid JSON: {str(e)}")
 
         path_expr = json_config.get('path')
         expected_value = json_config.get('expected_value')
         check_exists = json_config.get('exists', False)
 
         if not path_expr:
-            return False, "No JSONPath expression configured"
+            raise ValidationError("JSON validation failed: No JSONPath expression configured")
+
+        if path_expr != self._jsonpath_path:
+            self._parse_jsonpath(path_expr)
+        if self._jsonpath_error:
+            raise ValidationError(f"JSON validation failed: {self._jsonpath_error}")
 
         try:
-            # Parse JSONPath expression
-            jsonpath_expr = jsonpath_parse(path_expr)
-            matches = jsonpath_expr.find(json_data)
+            if self._jsonpath_steps is not None:
+                matches = self._find_simple_path(json_data, self._jsonpath_steps)
+            else:
+                matches = [match.value for match in self._jsonpath_expr.find(json_data)]
+        except Exception as e:
+            raise ValidationError(f"JSON validation failed: JSON validation error: {str(e)}")
 
-            # Check if field exists
-            if check_exists:
-                return len(matches) > 0, "JSONPath field not found" if len(matches) == 0 else None
+        # Check if field exists
+        if check_exists:
+            if not matches:
+                raise ValidationError("JSON validation failed: JSONPath field not found")
+            return
 
-            # Check if value matches
-            if expected_value is not None:
-                if len(matches) == 0:
-                    return False, f"JSONPath '{path_expr}' not found in response"
+        # Check if value matches
+        if expected_value is not None:
+            if not matches:
+                raise ValidationError(f"JSON validation failed: JSONPath '{path_expr}' not found in response")
 
-                actual_value = matches[0].value
+            actual_value = matches[0]
 
-                if actual_value != expected_value:
-                    return False, f"Expected '{expected_value}', got '{actual_value}'"
+            if actual_value != expected_value:
+                raise ValidationError(f"JSON validation failed: Expected '{expected_value}', got '{actual_value}'")
 
-            return True, None
+    def _parse_jsonpath(self, path_expr: str) -> None:
+        """
+        Parse a JSONPath expression and keep it for later checks.
+
+        Args:
+            path_expr: JSONPath expression
+        """
+        self._jsonpath_path = path_expr
+        self._jsonpath_expr = None
+        self._jsonpath_steps = None
+        self._jsonpath_error = None
+
+        if _SIMPLE_JSONPATH_RE.match(path_expr):
+            self._jsonpath_steps = [
+                int(index) if index else field
+                for field, index in _SIMPLE_JSONPATH_STEP_RE.findall(path_expr)
+            ]
+            return
 
+        try:
+            self._jsonpath_expr = jsonpath_parse(path_expr)
         except JsonPathParserError as e:
-            return False, f"Invalid JSONPath expression: {str(e)}"
+            self._jsonpath_error = f"Invalid JSONPath expression: {str(e)}"
         except Exception as e:
-            return False, f"JSON validation error: {str(e)}"
+            self._jsonpath_error = f"JSON validation error: {str(e)}"
+
+        if self._jsonpath_error:
+            logger.error("HTTP monitor '%s': %s", self.name, self._jsonpath_error)
+
+    @staticmethod
+    def _find_simple_path(json_data: Any, steps: List[Union[str, int]]) -> List[Any]:
+        """
+        Look up a simple dotted/indexed path without jsonpath_ng.
+
+        Args:
+            json_data: Decoded JSON document
+            steps: Field names and list indexes to follow
+
+        Returns:
+            List with the matched value, or an empty list if not found
+        """
+        value = json_data
+        for step in steps:
+            if isinstance(step, int):
+                if not isinstance(value, (list, str)) or step >= len(value):
+                    return []
+            elif not isinstance(value, dict) or step not in value:
+                return []
+            value = value[step]
+        return [value]
+
+    def refresh_ssl_info(self) -> None:
+        """
+        Fetch SSL certificate info for the monitored URL and keep it.
+
+        Called inline on the first HTTPS check and periodically by the
+        scheduler afterwards, so regular checks never open a second
+        connection just to read the certificate.
+        """
+        url = self.config.get('url') or ''
+        if not url.startswith('https://'):
+            return
+
+        info = self._check_ssl_certificate(url)
+        if info:
+            self._ssl_cert = (datetime.fromisoformat(info['ssl_valid_until']), info)
 
     def _check_ssl_certificate(self, url: str) -> Dict[str, Any]:
         """
@@ -233,6 +522,11 @@ class HTTPMonitor(Monitor):
             parsed = urlparse(url)
             hostname = parsed.hostname
             port = parsed.port or 443
+            key = (hostname, port)
+
+            cached = self._cert_cache.get(key)
+            if cached and time.time() < cached[0]:
+                return self._ssl_info(cached[1], cached[2])
 
             # Get certificate
             context = ssl.create_default_context()
@@ -242,17 +536,44 @@ class HTTPMonitor(Monitor):
 
             # Parse certificate
             cert = x509.load_der_x509_certificate(cert_der, default_backend())
-
-            # Calculate days until expiration
-            days_remaining = (cert.not_valid_after - datetime.utcnow()).days
-
-            return {
-                'ssl_valid_until': cert.not_valid_after.isoformat(),
-                'ssl_days_remaining': days_remaining,
+            valid_until = cert.not_valid_after
+            info = {
+                'ssl_valid_until': valid_until.isoformat(),
                 'ssl_issuer': cert.issuer.rfc4514_string(),
                 'ssl_subject': cert.subject.rfc4514_string()
             }
 
+            # Re-check after the TTL, or sooner if the certificate expires first
+            expires_at = min(
+                time.time() + self.CERT_CACHE_TTL,
+                valid_until.replace(tzinfo=timezone.utc).timestamp()
+            )
+            self._cert_cache[key] = (expires_at, valid_until, info)
+
+            return self._ssl_info(valid_until, info)
+
         except Exception as e:
-            logger.warning(f"Failed to check SSL certificate for {url}: {e}")
+            logger.warning("Failed to check SSL certificate for %s: %s", url, e)
             return {}
+
+    @staticmethod
+    def _ssl_info(valid_until: datetime, info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build SSL metadata from (possibly cached) certificate info.
+
+        Args:
+            valid_until: Certificate expiry (naive UTC)
+            info: Parsed certificate fields
+
+        Returns:
+            Dictionary with SSL certificate info
+        """
+        # Calculate days until expiration
+        days_remaining = (valid_until - datetime.utcnow()).days
+
+        return {
+            'ssl_valid_until': info['ssl_valid_until'],
+            'ssl_days_remaining': days_remaining,
+            'ssl_issuer': info['ssl_issuer'],
+            'ssl_subject': info['ssl_subject']
+        }
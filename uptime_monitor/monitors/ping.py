@@ -2,7 +2,7 @@
 ICMP Ping monitor.
 """
 
-from icmplib import ping as icmp_ping, NameLookupError, ICMPLibError
+from icmplib import ping as icmp_ping, async_ping as icmp_async_ping, NameLookupError, ICMPLibError
 from uptime_monitor.monitors.base import Monitor, MonitorResult, MonitorStatus
 import logging
 
@@ -20,8 +20,6 @@ class PingMonitor(Monitor):
             MonitorResult with status and response time
         """
         host = self.config.get('host')
-        packet_count = self.config.get('packet_count', 3)
-        packet_size = self.config.get('packet_size', 56)
 
         if not host:
             return MonitorResult(
@@ -31,50 +29,83 @@ class PingMonitor(Monitor):
 
         try:
             # Perform ping
-            result = icmp_ping(
-                address=host,
-                count=packet_count,
-                interval=0.2,
-                timeout=self.timeout,
-                payload_size=packet_size,
-                privileged=False  # Use unprivileged mode (works without root)
+            result = icmp_ping(address=host, **self._ping_options())
+            return self._build_result(host, result)
+
+        except Exception as e:
+            return self._error_result(host, e)
+
+    async def check_async(self) -> MonitorResult:
+        """
+        Perform ICMP ping check using icmplib's native asyncio support.
+
+        Returns:
+            MonitorResult with status and response time
+        """
+        host = self.config.get('host')
+
+        if not host:
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message="No host configured"
             )
 
-            # Check if any packets were received
-            if result.packets_received > 0:
-                return MonitorResult(
-                    status=MonitorStatus.UP,
-                    response_time=result.avg_rtt,  # Average RTT in milliseconds
-                    metadata={
-                        'host': host,
-                        'packets_sent': result.packets_sent,
-                        'packets_received': result.packets_received,
-                        'packet_loss': result.packet_loss,
-                        'min_rtt': result.min_rtt,
-                        'avg_rtt': result.avg_rtt,
-                        'max_rtt': result.max_rtt,
-                        'jitter': result.jitter
-                    }
-                )
-            else:
-                return MonitorResult(
-                    status=MonitorStatus.DOWN,
-                    error_message=f"No packets received from {host} (100% packet loss)"
-                )
-
-        except NameLookupError:
+        try:
+            result = await icmp_async_ping(address=host, **self._ping_options())
+            return self._build_result(host, result)
+
+        except Exception as e:
+            return self._error_result(host, e)
+
+    def _ping_options(self) -> dict:
+        """Build icmplib ping arguments from configuration"""
+        return {
+            'count': self.config.get('packet_count', 3),
+            'interval': 0.2,
+            'timeout': self.timeout,
+            'payload_size': self.config.get('packet_size', 56),
+            'privileged': False  # Use unprivileged mode (works without root)
+        }
+
+    def _build_result(self, host: str, result) -> MonitorResult:
+        """Convert an icmplib Host result into a MonitorResult"""
+        # Check if any packets were received
+        if result.packets_received > 0:
+            return MonitorResult(
+                status=MonitorStatus.UP,
+                response_time=result.avg_rtt,  # Average RTT in milliseconds
+                metadata={
+                    'host': host,
+                    'packets_sent': result.packets_sent,
+                    'packets_received': result.packets_received,
+                    'packet_loss': result.packet_loss,
+                    'min_rtt': result.min_rtt,
+                    'avg_rtt': result.avg_rtt,
+                    'max_rtt': result.max_rtt,
+                    'jitter': result.jitter
+                }
+            )
+        else:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                error_message=f"DNS resolution failed for {host}"
+                error_message=f"No packets received from {host} (100% packet loss)"
             )
-        except ICMPLibError as e:
+
+    def _error_result(self, host: str, error: Exception) -> MonitorResult:
+        """Convert a ping exception into a MonitorResult"""
+        if isinstance(error, NameLookupError):
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                error_message=f"ICMP error: {str(e)}"
+                error_message=f"DNS resolution failed for {host}"
             )
-        except Exception as e:
-            logger.error(f"Ping monitor '{self.name}' failed: {e}")
+        if isinstance(error, ICMPLibError):
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                error_message=f"Ping failed: {str(e)}"
+                error_message=f"ICMP error: {str(error)}"
             )
+
+        logger.error("Ping monitor '%s' failed: %s", self.name, error)
+        return MonitorResult(
+            status=MonitorStatus.DOWN,
+            error_message=f"Ping failed: {str(error)}"
+        )
@@ -4,7 +4,7 @@ Push-based passive monitor.
 
 from datetime import datetime, timedelta
 from uptime_monitor.monitors.base import Monitor, MonitorResult, MonitorStatus
-from uptime_monitor.database import get_session, PushMonitor as PushMonitorModel
+from uptime_monitor.database import get_session, MonitorModel, PushMonitor as PushMonitorModel
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,10 +20,15 @@ class PushMonitor(Monitor):
     is marked as down.
     """
 
-    def check(self) -> MonitorResult:
+    def check(self, session=None) -> MonitorResult:
         """
         Check if push monitor has received recent updates.
 
+        Args:
+            session: Optional database session to use, so a batch of push
+                monitors can share one. A session is opened (and closed)
+                for this check if not given.
+
         Returns:
             MonitorResult based on last push time
         """
@@ -31,24 +36,26 @@ class PushMonitor(Monitor):
         grace_period = self.config.get('grace_period', 3600)  # Default 1 hour
         require_payload = self.config.get('require_payload', False)
 
+        own_session = session is None
+
         try:
-            session = get_session()
+            if own_session:
+                session = get_session()
 
-            # Find push monitor record by name
+            # Find monitor and its push record by name in one query
             # Note: This requires the monitor to be in the database first
-            from uptime_monitor.database import MonitorModel
-
-            monitor = session.query(MonitorModel).filter_by(name=self.name).first()
+            row = session.query(MonitorModel, PushMonitorModel)\
+                .outerjoin(PushMonitorModel, PushMonitorModel.monitor_id == MonitorModel.id)\
+                .filter(MonitorModel.name == self.name)\
+                .first()
 
-            if not monitor:
+            if not row:
                 return MonitorResult(
                     status=MonitorStatus.UNKNOWN,
                     error_message="Monitor not found in database"
                 )
 
-            push_monitor = session.query(PushMonitorModel).filter_by(
-                monitor_id=monitor.id
-            ).first()
+            monitor, push_monitor = row
 
             if not push_monitor:
                 # Push monitor not initialized yet - this is the first check
@@ -113,11 +120,14 @@ class PushMonitor(Monitor):
                 )
 
         except Exception as e:
-            logger.error(f"Push monitor '{self.name}' check failed: {e}")
+            logger.error("Push monitor '%s' check failed: %s", self.name, e)
+            if session is not None:
+                # Leave a shared session usable for the rest of the batch
+                session.rollback()
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"Push monitor check failed: {str(e)}"
             )
         finally:
-            if 'session' in locals():
+            if own_session and session is not None:
                 session.close()
@@ -2,13 +2,241 @@
 TCP port connectivity monitor.
 """
 
+import asyncio
+import errno
+import selectors
 import socket
 import time
+from typing import Dict, List, Optional, Tuple
 from uptime_monitor.monitors.base import Monitor, MonitorResult, MonitorStatus
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Address family and sockaddr that last accepted a connection, keyed by
+# (host, port): (family, sockaddr, expires_at monotonic)
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[int, tuple, float]] = {}
+DNS_CACHE_TTL = 300  # seconds
+
+
+def _resolve(host: str, port: int) -> Tuple[List[Tuple[int, tuple]], Optional[float]]:
+    """
+    Resolve a host to the addresses to try, in order.
+
+    IPv4 and IPv6 addresses are both returned, in the order getaddrinfo
+    prefers them. If an address recently accepted a connection, only that
+    one is returned and no lookup is made.
+
+    Args:
+        host: Hostname or IP address
+        port: Port
+
+    Returns:
+        Tuple of (addresses, dns_time) where addresses is a list of
+        (family, sockaddr) and dns_time is the lookup time in milliseconds,
+        or None on a cache hit
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    cached = _DNS_CACHE.get((host, port))
+    if cached and time.monotonic() < cached[2]:
+        return [(cached[0], cached[1])], None
+
+    start_time = time.perf_counter()
+    addrinfo = socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    dns_time = (time.perf_counter() - start_time) * 1000
+
+    return [(family, sockaddr) for family, _, _, _, sockaddr in addrinfo], dns_time
+
+
+def _remember(host: str, port: int, family: int, sockaddr: tuple,
+              ttl: float = DNS_CACHE_TTL) -> None:
+    """Lock onto an address that accepted a connection for the next checks"""
+    _DNS_CACHE[(host, port)] = (family, sockaddr, time.monotonic() + ttl)
+
+
+def _forget(host: str, port: int) -> None:
+    """Drop a cached address; the host may have moved, so re-resolve next time"""
+    _DNS_CACHE.pop((host, port), None)
+
+
+# Probe sockets never carry data, so keep their buffers minimal
+_PROBE_BUFFER_SIZE = 4096
+
+
+def _probe_socket(family: int, timeout: float) -> socket.socket:
+    """
+    Create a TCP socket tuned for a connect-only probe.
+
+    Args:
+        family: Address family
+        timeout: Check timeout in seconds, also used as TCP_USER_TIMEOUT
+
+    Returns:
+        New socket
+    """
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _PROBE_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _PROBE_BUFFER_SIZE)
+        if hasattr(socket, 'TCP_USER_TIMEOUT'):
+            # Linux only
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, int(timeout * 1000))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _connect(addresses: List[Tuple[int, tuple]], timeout: float) -> Tuple[int, Optional[Tuple[int, tuple]]]:
+    """
+    Try each address in turn until one accepts a connection.
+
+    All attempts share one timeout, so falling back from an unreachable
+    IPv6 address to IPv4 (or between A records) never exceeds it.
+
+    Args:
+        addresses: List of (family, sockaddr) to try
+        timeout: Total timeout in seconds
+
+    Returns:
+        Tuple of (error, address): error is 0 with the address that
+        connected, or the last connect_ex error code with None
+
+    Raises:
+        socket.timeout: If the timeout ran out before all addresses were tried
+    """
+    deadline = time.perf_counter() + timeout
+    error = 0
+
+    for family, sockaddr in addresses:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise socket.timeout()
+
+        sock = _probe_socket(family, timeout)
+        try:
+            sock.settimeout(remaining)
+            error = sock.connect_ex(sockaddr)
+        finally:
+            sock.close()
+
+        if error == 0:
+            return 0, (family, sockaddr)
+
+    return error, None
+
+
+def _connect_result(monitor: "TCPMonitor", address: Optional[Tuple[int, tuple]], error: int,
+                    response_time: float, dns_time: Optional[float]) -> MonitorResult:
+    """Build the result for a finished connect given its error code (0 on success)"""
+    host = monitor.config.get('host')
+    port = monitor.config.get('port')
+
+    if error == 0:
+        _remember(host, port, *address)
+        metadata = {
+            'host': host,
+            'port': port
+        }
+        if dns_time is not None:
+            metadata['dns_time'] = dns_time
+        return MonitorResult(
+            status=MonitorStatus.UP,
+            response_time=response_time,
+            metadata=metadata
+        )
+
+    _forget(host, port)
+    return MonitorResult(
+        status=MonitorStatus.DOWN,
+        response_time=response_time,
+        error_message=f"Connection to {host}:{port} failed (error code: {error})"
+    )
+
+
+# Head start each address gets before the next one is tried (RFC 8305)
+HAPPY_EYEBALLS_DELAY = 0.25  # seconds
+
+
+def _interleave(addresses: List[Tuple[int, tuple]]) -> List[Tuple[int, tuple]]:
+    """Alternate address families, keeping getaddrinfo's order within each"""
+    by_family: Dict[int, List[Tuple[int, tuple]]] = {}
+    for address in addresses:
+        by_family.setdefault(address[0], []).append(address)
+
+    groups = list(by_family.values())
+    return [
+        group[i]
+        for i in range(max(len(group) for group in groups))
+        for group in groups
+        if i < len(group)
+    ]
+
+
+async def _attempt_async(family: int, sockaddr: tuple, timeout: float) -> Tuple[int, Optional[Tuple[int, tuple]]]:
+    """Connect one probe socket without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    sock = _probe_socket(family, timeout)
+    try:
+        sock.setblocking(False)
+        await loop.sock_connect(sock, sockaddr)
+        return 0, (family, sockaddr)
+    except OSError as e:
+        return e.errno or -1, None
+    finally:
+        sock.close()
+
+
+async def _connect_async(addresses: List[Tuple[int, tuple]], timeout: float) -> Tuple[int, Optional[Tuple[int, tuple]]]:
+    """
+    Connect to the first address that answers, Happy Eyeballs style.
+
+    A new attempt starts every HAPPY_EYEBALLS_DELAY seconds (or as soon as
+    one fails) while earlier attempts keep running, alternating IPv6 and
+    IPv4, so a host with a slow or broken path for one family isn't
+    penalized by the full timeout before falling back.
+
+    Args:
+        addresses: List of (family, sockaddr) to try
+        timeout: Total timeout in seconds
+
+    Returns:
+        Tuple of (error, address) as for _connect()
+
+    Raises:
+        socket.timeout: If no attempt succeeded within the timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    remaining_addresses = _interleave(addresses)
+    pending = set()
+    error = 0
+
+    try:
+        while True:
+            if remaining_addresses:
+                family, sockaddr = remaining_addresses.pop(0)
+                pending.add(loop.create_task(_attempt_async(family, sockaddr, timeout)))
+            elif not pending:
+                return error, None
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise socket.timeout()
+
+            wait = min(HAPPY_EYEBALLS_DELAY, remaining) if remaining_addresses else remaining
+            done, pending = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                error, address = task.result()
+                if error == 0:
+                    return 0, address
+    finally:
+        for task in pending:
+            task.cancel()
+
 
 class TCPMonitor(Monitor):
     """TCP port connectivity monitor"""
@@ -29,50 +257,285 @@ class TCPMonitor(Monitor):
                 error_message="Missing host or port configuration"
             )
 
-        start_time = time.time()
+        # Resolve outside the timed section so DNS doesn't skew response time
+        try:
+            addresses, dns_time = _resolve(host, port)
+        except socket.gaierror as e:
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message=f"DNS resolution failed for {host}: {str(e)}"
+            )
+
+        start_time = time.perf_counter()
 
         try:
-            # Create socket and attempt connection
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
+            result, address = _connect(addresses, self.timeout)
+            response_time = (time.perf_counter() - start_time) * 1000
 
-            result = sock.connect_ex((host, port))
-            response_time = (time.time() - start_time) * 1000
+            return _connect_result(self, address, result, response_time, dns_time)
 
-            sock.close()
+        except socket.timeout:
+            _forget(host, port)
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                response_time=(time.perf_counter() - start_time) * 1000,
+                error_message=f"Connection to {host}:{port} timed out after {self.timeout}s"
+            )
+        except Exception as e:
+            logger.error("TCP monitor '%s' failed: %s", self.name, e)
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message=f"TCP check failed: {str(e)}"
+            )
 
-            if result == 0:
-                # Connection successful
-                return MonitorResult(
-                    status=MonitorStatus.UP,
-                    response_time=response_time,
-                    metadata={
-                        'host': host,
-                        'port': port
-                    }
-                )
-            else:
-                # Connection failed
-                return MonitorResult(
-                    status=MonitorStatus.DOWN,
-                    response_time=response_time,
-                    error_message=f"Connection to {host}:{port} failed (error code: {result})"
-                )
+    async def check_async(self) -> MonitorResult:
+        """
+        Perform TCP port check on the event loop.
+
+        Unlike check(), which tries addresses one after another, all
+        resolved addresses are raced Happy Eyeballs style.
 
+        Returns:
+            MonitorResult with status and response time
+        """
+        host = self.config.get('host')
+        port = self.config.get('port')
+
+        if not host or not port:
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message="Missing host or port configuration"
+            )
+
+        loop = asyncio.get_running_loop()
+        try:
+            addresses, dns_time = await loop.run_in_executor(None, _resolve, host, port)
+        except socket.gaierror as e:
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message=f"DNS resolution failed for {host}: {str(e)}"
+            )
+
+        start_time = time.perf_counter()
+
+        try:
+            error, address = await _connect_async(addresses, self.timeout)
+            return _connect_result(
+                self, address, error, (time.perf_counter() - start_time) * 1000, dns_time
+            )
         except socket.timeout:
+            _forget(host, port)
             return MonitorResult(
                 status=MonitorStatus.DOWN,
-                response_time=(time.time() - start_time) * 1000,
+                response_time=(time.perf_counter() - start_time) * 1000,
                 error_message=f"Connection to {host}:{port} timed out after {self.timeout}s"
             )
+        except Exception as e:
+            logger.error("TCP monitor '%s' failed: %s", self.name, e)
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message=f"TCP check failed: {str(e)}"
+            )
+
+
+class _BatchCheck:
+    """Connect attempts in flight for one monitor of a TCPMonitorBatch"""
+
+    __slots__ = ('index', 'monitor', 'addresses', 'dns_time', 'start_time',
+                 'deadline', 'next_attempt', 'error', 'sockets')
+
+    def __init__(self, index: int, monitor: "TCPMonitor",
+                 addresses: List[Tuple[int, tuple]], dns_time: Optional[float]):
+        self.index = index
+        self.monitor = monitor
+        self.addresses = _interleave(addresses)
+        self.dns_time = dns_time
+        self.start_time = time.perf_counter()
+        self.deadline = self.start_time + monitor.timeout
+        self.next_attempt = self.start_time
+        self.error = 0
+        self.sockets: List[socket.socket] = []
+
+
+class TCPMonitorBatch:
+    """Run many TCP checks at once with non-blocking connects"""
+
+    @classmethod
+    def check_many(cls, monitors: List[TCPMonitor]) -> List[MonitorResult]:
+        """
+        Check a batch of TCP monitors concurrently on the calling thread.
+
+        Every connection is started non-blocking and registered with a
+        selector, so the batch waits on all sockets at once instead of
+        parking one thread per check. Each monitor keeps its own timeout,
+        and its resolved addresses are tried Happy Eyeballs style as in
+        TCPMonitor.check_async(), so a broken IPv6 path falls back to IPv4.
+
+        Args:
+            monitors: TCP monitors to check
+
+        Returns:
+            List of MonitorResult in the same order as monitors
+        """
+        results: List[Optional[MonitorResult]] = [None] * len(monitors)
+        selector = selectors.DefaultSelector()
+
+        try:
+            for index, monitor in enumerate(monitors):
+                results[index] = cls._start(selector, index, monitor)
+
+            while selector.get_map():
+                checks = {key.data[0] for key in selector.get_map().values()}
+                wake_at = min(
+                    min(check.deadline, check.next_attempt) if check.addresses else check.deadline
+                    for check in checks
+                )
+
+                for key, _ in selector.select(max(0.0, wake_at - time.perf_counter())):
+                    check, address = key.data
+                    if results[check.index] is not None:
+                        continue  # Another address already settled this check
+
+                    error = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if error == 0:
+                        results[check.index] = cls._finish(selector, check, address, 0)
+                        continue
+
+                    # Fall through to the next address right away
+                    check.error = error
+                    check.sockets.remove(key.fileobj)
+                    cls._close(selector, key.fileobj)
+                    results[check.index] = cls._advance(selector, check)
+
+                now = time.perf_counter()
+                for check in checks:
+                    if results[check.index] is not None:
+                        continue
+                    if now >= check.deadline:
+                        results[check.index] = cls._time_out(selector, check)
+                    elif check.addresses and now >= check.next_attempt:
+                        # The current attempt is slow; start the next one alongside it
+                        results[check.index] = cls._advance(selector, check)
+        finally:
+            for key in list(selector.get_map().values()):
+                cls._close(selector, key.fileobj)
+            selector.close()
+
+        return results
+
+    @classmethod
+    def _start(cls, selector: selectors.BaseSelector, index: int,
+               monitor: TCPMonitor) -> Optional[MonitorResult]:
+        """
+        Resolve a monitor's host and begin connecting to it.
+
+        Returns:
+            A final MonitorResult if the check finished (or failed) before
+            waiting was needed, otherwise None
+        """
+        host = monitor.config.get('host')
+        port = monitor.config.get('port')
+
+        if not host or not port:
+            return MonitorResult(
+                status=MonitorStatus.DOWN,
+                error_message="Missing host or port configuration"
+            )
+
+        try:
+            addresses, dns_time = _resolve(host, port)
         except socket.gaierror as e:
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"DNS resolution failed for {host}: {str(e)}"
             )
+
+        return cls._advance(selector, _BatchCheck(index, monitor, addresses, dns_time))
+
+    @classmethod
+    def _advance(cls, selector: selectors.BaseSelector,
+                 check: _BatchCheck) -> Optional[MonitorResult]:
+        """
+        Begin a non-blocking connect to the check's next untried address.
+
+        Addresses that fail immediately are skipped until one is left
+        connecting in the background.
+
+        Returns:
+            A final MonitorResult if the check is settled, otherwise None
+        """
+        try:
+            while check.addresses:
+                address = check.addresses.pop(0)
+                try:
+                    sock = _probe_socket(address[0], check.monitor.timeout)
+                except OSError as e:
+                    # e.g. no IPv6 support on this host
+                    check.error = e.errno or -1
+                    continue
+
+                try:
+                    sock.setblocking(False)
+                    error = sock.connect_ex(address[1])
+                    if error in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, (check, address))
+                        check.sockets.append(sock)
+                        check.next_attempt = time.perf_counter() + HAPPY_EYEBALLS_DELAY
+                        return None
+                except Exception:
+                    sock.close()
+                    raise
+
+                # Connected (or refused) immediately, e.g. on loopback
+                sock.close()
+                if error == 0:
+                    return cls._finish(selector, check, address, 0)
+                check.error = error
         except Exception as e:
-            logger.error(f"TCP monitor '{self.name}' failed: {e}")
+            cls._abandon(selector, check)
+            logger.error("TCP monitor '%s' failed: %s", check.monitor.name, e)
             return MonitorResult(
                 status=MonitorStatus.DOWN,
                 error_message=f"TCP check failed: {str(e)}"
             )
+
+        if check.sockets:
+            return None  # Earlier attempts are still connecting
+        return cls._finish(selector, check, None, check.error)
+
+    @classmethod
+    def _finish(cls, selector: selectors.BaseSelector, check: _BatchCheck,
+                address: Optional[Tuple[int, tuple]], error: int) -> MonitorResult:
+        """Settle a check with the outcome of its connect attempts"""
+        cls._abandon(selector, check)
+        return _connect_result(
+            check.monitor, address, error,
+            (time.perf_counter() - check.start_time) * 1000, check.dns_time
+        )
+
+    @classmethod
+    def _time_out(cls, selector: selectors.BaseSelector, check: _BatchCheck) -> MonitorResult:
+        """Settle a check whose timeout passed before any address answered"""
+        cls._abandon(selector, check)
+        host = check.monitor.config.get('host')
+        port = check.monitor.config.get('port')
+        _forget(host, port)
+        return MonitorResult(
+            status=MonitorStatus.DOWN,
+            response_time=(time.perf_counter() - check.start_time) * 1000,
+            error_message=f"Connection to {host}:{port} timed out after {check.monitor.timeout}s"
+        )
+
+    @classmethod
+    def _abandon(cls, selector: selectors.BaseSelector, check: _BatchCheck) -> None:
+        """Close every socket the check still has connecting"""
+        check.addresses = []
+        for sock in check.sockets:
+            cls._close(selector, sock)
+        check.sockets = []
+
+    @staticmethod
+    def _close(selector: selectors.BaseSelector, sock: socket.socket):
+        """Unregister and close a socket"""
+        selector.unregister(sock)
+        sock.close()
@@ -2,6 +2,6 @@
 Notification implementations for various channels.
 """
 
-from uptime_monitor.notifications.base import Notifier, NotificationEvent
+from uptime_monitor.notifications.base import Notifier, NotificationEvent, RateLimited
 
-__all__ = ['Notifier', 'NotificationEvent']
+__all__ = ['Notifier', 'NotificationEvent', 'RateLimited']
@@ -3,14 +3,91 @@ Base notifier class that all notification implementations inherit from.
 """
 
 from abc import ABC, abstractmethod
+from collections import Counter, deque
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 from datetime import datetime
+import json
+import random
+import threading
+import time
 import logging
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Backoff between send attempts: base * 2**(attempt-1), capped, +/-50% jitter
+RETRY_BACKOFF_BASE = 0.5  # seconds
+RETRY_BACKOFF_CAP = 10  # seconds
+RETRY_AFTER_MAX = 60  # longest server-requested wait we honor (seconds)
+
+WEBHOOK_TIMEOUT = 30  # seconds
+
+# Events are sent once no new event has arrived for BATCH_WINDOW seconds,
+# but never later than BATCH_MAX_WAIT after the first one in the batch
+BATCH_WINDOW = 0.25  # seconds
+BATCH_MAX_WAIT = 0.5  # seconds
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the HTTP session shared by webhook notifiers.
+
+    Keeping one pooled session means repeated posts to the same webhook
+    host (discord.com, hooks.slack.com) reuse the TLS connection.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _http_session = session
+    return _http_session
+
+
+def post_json(url: str, payload: Dict[str, Any]) -> requests.Response:
+    """
+    POST a JSON payload over the shared webhook session.
+
+    The body is serialized with orjson when available instead of letting
+    requests run the stdlib json encoder.
+
+    Args:
+        url: Webhook URL
+        payload: JSON-serializable payload
+
+    Returns:
+        The HTTP response
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload).encode('utf-8')
+
+    return get_http_session().post(
+        url,
+        data=body,
+        headers={'Content-Type': 'application/json'},
+        timeout=WEBHOOK_TIMEOUT
+    )
+
 
 class NotificationEvent(Enum):
     """Types of notification events"""
@@ -20,9 +97,77 @@ class NotificationEvent(Enum):
     DEGRADED = "degraded"      # Service is degraded
 
 
-@dataclass
+EVENT_EMOJI = {
+    NotificationEvent.DOWN: "🔴",
+    NotificationEvent.UP: "🟢",
+    NotificationEvent.SSL_EXPIRE: "⚠️",
+    NotificationEvent.DEGRADED: "🟡"
+}
+
+
+# How each event type is counted in batch summaries ("3 down, 1 recovered")
+_SUMMARY_LABELS = {
+    NotificationEvent.DOWN: "down",
+    NotificationEvent.UP: "recovered",
+    NotificationEvent.SSL_EXPIRE: "SSL expiring",
+    NotificationEvent.DEGRADED: "degraded"
+}
+
+
+def summarize_events(contexts: List['NotificationContext']) -> str:
+    """
+    Summarize a batch of events by type, e.g. "8 down, 12 recovered".
+
+    Args:
+        contexts: Notification contexts
+
+    Returns:
+        Summary text, with event types in NotificationEvent order
+    """
+    counts = Counter(context.event_type for context in contexts)
+    return ", ".join(
+        f"{counts[event]} {label}"
+        for event, label in _SUMMARY_LABELS.items()
+        if counts[event]
+    )
+
+
+class RateLimited(Exception):
+    """Raised by send() when the channel rejects a message for rate limiting"""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        """
+        Args:
+            retry_after: Seconds the server asked us to wait, if given
+        """
+        super().__init__(f"Rate limited (retry after {retry_after}s)" if retry_after is not None else "Rate limited")
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait, or None if missing or not a number
+    """
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
 class NotificationContext:
-    """Context information for a notification"""
+    """
+    Context information for a notification.
+
+    Contexts are immutable and hashable so formatters can memoize the
+    messages they build for an event across retries and channels.
+    """
     monitor_name: str
     event_type: NotificationEvent
     status: str
@@ -31,6 +176,20 @@ class NotificationContext:
     metadata: Dict[str, Any]
     incident_id: Optional[int] = None
 
+    def __hash__(self) -> int:
+        # metadata is a dict and can't be hashed; equality still compares it
+        return hash((self.monitor_name, self.event_type, self.timestamp, self.incident_id))
+
+    @cached_property
+    def formatted_timestamp(self) -> str:
+        """Timestamp as shown in messages, formatted once per context"""
+        return self.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')
+
+    @cached_property
+    def event_type_upper(self) -> str:
+        """Event type as shown in message titles (e.g. DOWN)"""
+        return self.event_type.value.upper()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -78,12 +237,13 @@ class Notifier(ABC):
         """
         pass
 
-    def send_with_retry(self, context: NotificationContext, retry_count: int = 3) -> bool:
+    def send_with_retry(self, context_factory: Callable[[], NotificationContext], retry_count: int = 3) -> bool:
         """
         Send notification with retry logic.
 
         Args:
-            context: Notification context
+            context_factory: Returns the notification context; only called
+                if the notifier is enabled
             retry_count: Number of retry attempts
 
         Returns:
@@ -93,7 +253,10 @@ class Notifier(ABC):
             logger.debug(f"Notifier '{self.name}' is disabled, skipping")
             return False
 
+        context = context_factory()
+
         for attempt in range(1, retry_count + 1):
+            retry_after = None
             try:
                 logger.info(f"Sending notification via '{self.name}' (attempt {attempt}/{retry_count})")
                 success = self.send(context)
@@ -104,22 +267,48 @@ class Notifier(ABC):
                 else:
                     logger.warning(f"Notification via '{self.name}' failed (attempt {attempt}/{retry_count})")
 
+            except RateLimited as e:
+                logger.warning(f"Notification via '{self.name}' was rate limited (attempt {attempt}/{retry_count})")
+                retry_after = e.retry_after
+
             except Exception as e:
                 logger.error(f"Notification via '{self.name}' failed with exception: {e}")
 
             # Don't sleep after the last attempt
             if attempt < retry_count:
-                import time
-                time.sleep(2)  # Wait 2 seconds between retries
+                if retry_after is not None:
+                    time.sleep(min(retry_after, RETRY_AFTER_MAX))
+                else:
+                    time.sleep(self._backoff_delay(attempt))
 
         logger.error(f"All notification attempts via '{self.name}' failed")
         return False
 
-    def format_message(self, context: NotificationContext) -> str:
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """
+        Get the wait before the next send attempt (exponential, jittered).
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            Delay in seconds
+        """
+        return min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+    def close(self) -> None:
+        """Release any connections held by the notifier (no-op by default)"""
+        pass
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def format_message(context: NotificationContext) -> str:
         """
         Format a basic notification message.
 
-        Can be overridden by subclasses for custom formatting.
+        Can be overridden by subclasses for custom formatting. The text only
+        depends on the context, so it is cached per context, not per notifier.
 
         Args:
             context: Notification context
@@ -127,18 +316,11 @@ class Notifier(ABC):
         Returns:
             Formatted message string
         """
-        event_emoji = {
-            NotificationEvent.DOWN: "🔴",
-            NotificationEvent.UP: "🟢",
-            NotificationEvent.SSL_EXPIRE: "⚠️",
-            NotificationEvent.DEGRADED: "🟡"
-        }
-
-        emoji = event_emoji.get(context.event_type, "ℹ️")
+        emoji = EVENT_EMOJI.get(context.event_type, "ℹ️")
 
-        message = f"{emoji} **{context.monitor_name}** - {context.event_type.value.upper()}\n\n"
+        message = f"{emoji} **{context.monitor_name}** - {context.event_type_upper}\n\n"
         message += f"{context.message}\n\n"
-        message += f"Time: {context.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+        message += f"Time: {context.formatted_timestamp}\n"
 
         if context.metadata:
             message += "\nDetails:\n"
@@ -149,3 +331,106 @@ class Notifier(ABC):
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(name='{self.name}', enabled={self.enabled})>"
+
+
+class _PendingBatch:
+    """Contexts waiting to go out together in one webhook call"""
+
+    def __init__(self):
+        self.contexts: Deque[NotificationContext] = deque()
+        self.deadline = time.monotonic() + BATCH_MAX_WAIT
+        self.timer: Optional[threading.Timer] = None
+        self.flushed = False
+        self.done = threading.Event()
+        self.success = False
+        self.error: Optional[Exception] = None
+
+
+class BatchingNotifier(Notifier):
+    """
+    Notifier that coalesces events arriving close together into one call.
+
+    When an upstream dependency fails, many monitors change state in the
+    same scheduler tick. Events are debounced: a batch goes out once
+    BATCH_WINDOW passes without another event, BATCH_MAX_WAIT after its
+    first event at the latest, or as soon as it holds max_batch_size
+    events. Each batch is sent as a single webhook message.
+
+    Each send() call still blocks until its batch has been delivered and
+    returns (or raises) that batch's outcome, so retries and notification
+    logging work as for any other notifier.
+
+    Subclasses implement send_batch() instead of send().
+    """
+
+    max_batch_size = 10
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._batch_lock = threading.Lock()
+        self._pending: Optional[_PendingBatch] = None
+
+    @abstractmethod
+    def send_batch(self, contexts: List[NotificationContext]) -> bool:
+        """
+        Send several notifications as one message.
+
+        Args:
+            contexts: Notification contexts, at most max_batch_size
+
+        Returns:
+            True if the message was sent successfully, False otherwise
+        """
+        pass
+
+    def send(self, context: NotificationContext) -> bool:
+        """
+        Send a notification, batching it with others arriving alongside it.
+
+        Args:
+            context: Notification context
+
+        Returns:
+            True if the batch carrying this notification was sent successfully
+        """
+        with self._batch_lock:
+            batch = self._pending
+            if batch is None:
+                batch = self._pending = _PendingBatch()
+            else:
+                batch.timer.cancel()
+            batch.contexts.append(context)
+
+            if len(batch.contexts) >= self.max_batch_size:
+                # Full: send now and start a new batch with the next event
+                self._pending = None
+                delay = 0.0
+            else:
+                delay = max(0.0, min(BATCH_WINDOW, batch.deadline - time.monotonic()))
+
+            batch.timer = threading.Timer(delay, self._flush, args=(batch,))
+            batch.timer.daemon = True
+            batch.timer.start()
+
+        batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.success
+
+    def _flush(self, batch: _PendingBatch) -> None:
+        """Send a pending batch and wake up everyone waiting on it"""
+        with self._batch_lock:
+            # A timer cancelled while already running can get here after
+            # the batch went out with a later timer
+            if batch.flushed:
+                return
+            batch.flushed = True
+            if self._pending is batch:
+                self._pending = None
+
+        try:
+            batch.success = self.send_batch(list(batch.contexts))
+        except Exception as e:
+            batch.error = e
+        finally:
+            batch.done.set()
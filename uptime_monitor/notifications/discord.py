@@ -2,22 +2,37 @@
 Discord webhook notification handler.
 """
 
-from discord_webhook import DiscordWebhook, DiscordEmbed
-from uptime_monitor.notifications.base import Notifier, NotificationContext, NotificationEvent
+from functools import lru_cache
+from typing import Any, Dict, List
+from uptime_monitor.notifications.base import (
+    BatchingNotifier, NotificationContext, NotificationEvent, RateLimited,
+    parse_retry_after, post_json, summarize_events
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Embed color per event type
+_COLORS = {
+    NotificationEvent.DOWN: 0xDC3545,      # Red
+    NotificationEvent.UP: 0x28A745,        # Green
+    NotificationEvent.SSL_EXPIRE: 0xFFC107,  # Yellow
+    NotificationEvent.DEGRADED: 0xFD7E14    # Orange
+}
 
-class DiscordNotifier(Notifier):
+
+class DiscordNotifier(BatchingNotifier):
     """Discord webhook notification"""
 
-    def send(self, context: NotificationContext) -> bool:
+    # Discord accepts up to 10 embeds per message
+    max_batch_size = 10
+
+    def send_batch(self, contexts: List[NotificationContext]) -> bool:
         """
-        Send Discord notification.
+        Send Discord notification with one embed per event.
 
         Args:
-            context: Notification context
+            contexts: Notification contexts
 
         Returns:
             True if notification sent successfully
@@ -31,63 +46,58 @@ class DiscordNotifier(Notifier):
             return False
 
         try:
-            webhook = DiscordWebhook(url=webhook_url, username=username)
-
-            # Create embed
-            embed = self._create_embed(context)
-            webhook.add_embed(embed)
-
-            # Add role mention if configured and event is DOWN
-            if mention_role_id and context.event_type == NotificationEvent.DOWN:
-                webhook.set_content(f"<@&{mention_role_id}>")
-
-            # Send webhook
-            response = webhook.execute()
+            payload = {
+                'username': username,
+                'embeds': [self._create_embed(context) for context in contexts]
+            }
+
+            # Summarize batches above the embeds, and add a role mention if
+            # configured and any event is DOWN
+            content = []
+            if mention_role_id and any(c.event_type == NotificationEvent.DOWN for c in contexts):
+                content.append(f"<@&{mention_role_id}>")
+            if len(contexts) > 1:
+                content.append(summarize_events(contexts))
+            if content:
+                payload['content'] = " ".join(content)
+
+            # Send webhook over the shared keep-alive session
+            response = post_json(webhook_url, payload)
 
             if response.status_code in [200, 204]:
                 logger.info("Discord notification sent successfully")
                 return True
+            elif response.status_code == 429:
+                raise RateLimited(parse_retry_after(response.headers.get('Retry-After')))
             else:
                 logger.error(f"Discord webhook returned status code {response.status_code}")
                 return False
 
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to send Discord notification: {e}")
             return False
 
-    def _create_embed(self, context: NotificationContext) -> DiscordEmbed:
-        """Create Discord embed"""
-        # Color based on event type
-        colors = {
-            NotificationEvent.DOWN: 0xDC3545,      # Red
-            NotificationEvent.UP: 0x28A745,        # Green
-            NotificationEvent.SSL_EXPIRE: 0xFFC107,  # Yellow
-            NotificationEvent.DEGRADED: 0xFD7E14    # Orange
-        }
-        color = colors.get(context.event_type, 0x6C757D)
-
-        # Create embed
-        embed = DiscordEmbed(
-            title=f"{context.event_type.value.upper()}: {context.monitor_name}",
-            description=context.message,
-            color=color
-        )
-
-        # Add fields
-        embed.add_embed_field(name="Status", value=context.status, inline=True)
-        embed.add_embed_field(
-            name="Time",
-            value=context.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC'),
-            inline=True
-        )
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _create_embed(context: NotificationContext) -> Dict[str, Any]:
+        """Create Discord embed (as Discord's JSON embed object)"""
+        fields = [
+            {'name': "Status", 'value': context.status, 'inline': True},
+            {'name': "Time", 'value': context.formatted_timestamp, 'inline': True}
+        ]
 
         # Add metadata fields
         if context.metadata:
             for key, value in list(context.metadata.items())[:5]:  # Limit to 5 additional fields
-                embed.add_embed_field(name=key.replace('_', ' ').title(), value=str(value), inline=True)
-
-        # Add footer
-        embed.set_footer(text="Simple Uptime Monitor")
-        embed.set_timestamp(context.timestamp)
-
-        return embed
+                fields.append({'name': key.replace('_', ' ').title(), 'value': str(value), 'inline': True})
+
+        return {
+            'title': f"{context.event_type_upper}: {context.monitor_name}",
+            'description': context.message,
+            'color': _COLORS.get(context.event_type, 0x6C757D),
+            'fields': fields,
+            'footer': {'text': "Simple Uptime Monitor"},
+            'timestamp': context.timestamp.isoformat()
+        }
@@ -2,19 +2,162 @@
 Email (SMTP) notification handler.
 """
 
+import atexit
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List
-from uptime_monitor.notifications.base import Notifier, NotificationContext
+import threading
+import weakref
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from functools import lru_cache
+from html import escape as html_escape
+from typing import List, Optional
+from uptime_monitor.notifications.base import (
+    Notifier, NotificationContext, NotificationEvent, EVENT_EMOJI
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Header color per event type
+_STATUS_COLORS = {
+    NotificationEvent.DOWN: '#dc3545',
+    NotificationEvent.UP: '#28a745',
+    NotificationEvent.SSL_EXPIRE: '#ffc107',
+    NotificationEvent.DEGRADED: '#fd7e14'
+}
+
+# Filled positionally: color, event type, monitor name, message, monitor
+# name, status, time, details
+_HTML_TEMPLATE = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+                .header { background-color: %s; color: white; padding: 15px; border-radius: 5px 5px 0 0; }
+                .content { background-color: #f8f9fa; padding: 20px; border: 1px solid #dee2e6; border-top: none; border-radius: 0 0 5px 5px; }
+                .footer { margin-top: 20px; padding-top: 20px; border-top: 1px solid #dee2e6; font-size: 12px; color: #6c757d; }
+                .details { background-color: white; padding: 15px; border-radius: 5px; margin-top: 15px; }
+                .detail-item { margin: 8px 0; }
+                .label { font-weight: bold; color: #495057; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h2 style="margin: 0;">%s: %s</h2>
+                </div>
+                <div class="content">
+                    <p style="font-size: 16px; margin-top: 0;">%s</p>
+
+                    <div class="details">
+                        <div class="detail-item">
+                            <span class="label">Monitor:</span> %s
+                        </div>
+                        <div class="detail-item">
+                            <span class="label">Status:</span> %s
+                        </div>
+                        <div class="detail-item">
+                            <span class="label">Time:</span> %s
+                        </div>
+%s
+                    </div>
+
+                    <div class="footer">
+                        <p style="margin: 0;">This is an automated notification from Simple Uptime Monitor.</p>
+                    </div>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+_METADATA_HEADER = """
+                        <div class="detail-item" style="margin-top: 15px;">
+                            <span class="label">Additional Details:</span>
+                        </div>
+"""
+
+_METADATA_ROW = """
+                        <div class="detail-item" style="margin-left: 20px;">
+                            <span class="label">%s:</span> %s
+                        </div>"""
+
+# Live notifiers, so their SMTP connections can be closed at exit
+_open_notifiers = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all() -> None:
+    """Close pooled SMTP connections on interpreter exit"""
+    for notifier in list(_open_notifiers):
+        notifier.close()
+
 
 class EmailNotifier(Notifier):
     """Email notification via SMTP"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+        _open_notifiers.add(self)
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """
+        Get a logged-in SMTP connection, reusing the previous one if alive.
+
+        Must be called with self._lock held.
+
+        Returns:
+            Connected and authenticated SMTP client
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPServerDisconnected, OSError):
+                pass
+            self._discard_connection()
+
+        smtp_host = self.config.get('smtp_host')
+        smtp_port = self.config.get('smtp_port', 587)
+        smtp_use_tls = self.config.get('smtp_use_tls', True)
+
+        if smtp_use_tls:
+            server = smtplib.SMTP(smtp_host, smtp_port, timeout=30)
+            server.starttls()
+        else:
+            server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=30)
+
+        try:
+            server.login(self.config.get('smtp_user'), self.config.get('smtp_password'))
+        except Exception:
+            server.close()
+            raise
+
+        self._smtp = server
+        return server
+
+    def _discard_connection(self) -> None:
+        """Drop the pooled connection without waiting on the server"""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def close(self) -> None:
+        """Close the pooled SMTP connection"""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._discard_connection()
+
     def send(self, context: NotificationContext) -> bool:
         """
         Send email notification.
@@ -26,10 +169,8 @@ class EmailNotifier(Notifier):
             True if email sent successfully
         """
         smtp_host = self.config.get('smtp_host')
-        smtp_port = self.config.get('smtp_port', 587)
         smtp_user = self.config.get('smtp_user')
         smtp_password = self.config.get('smtp_password')
-        smtp_use_tls = self.config.get('smtp_use_tls', True)
         from_address = self.config.get('from_address', smtp_user)
         to_addresses = self.config.get('to_addresses', [])
 
@@ -42,32 +183,25 @@ class EmailNotifier(Notifier):
             return False
 
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
+            # Create message; the SMTP policy serializes straight to CRLF bytes
+            msg = EmailMessage(policy=SMTP_POLICY)
             msg['From'] = from_address
             msg['To'] = ', '.join(to_addresses)
             msg['Subject'] = self._create_subject(context)
 
-            # Create plain text and HTML versions
-            text_body = self.format_message(context)
-            html_body = self._create_html_body(context)
-
-            # Attach parts
-            part1 = MIMEText(text_body, 'plain')
-            part2 = MIMEText(html_body, 'html')
-            msg.attach(part1)
-            msg.attach(part2)
-
-            # Connect and send
-            if smtp_use_tls:
-                server = smtplib.SMTP(smtp_host, smtp_port, timeout=30)
-                server.starttls()
-            else:
-                server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=30)
+            # Plain text body with an HTML alternative
+            msg.set_content(self.format_message(context))
+            msg.add_alternative(self._create_html_body(context), subtype='html')
 
-            server.login(smtp_user, smtp_password)
-            server.sendmail(from_address, to_addresses, msg.as_string())
-            server.quit()
+            # Send over the pooled connection (connects and logs in if needed)
+            with self._lock:
+                try:
+                    server = self._get_connection()
+                    server.send_message(msg, from_address, to_addresses)
+                except Exception:
+                    # Don't reuse a connection in an unknown state
+                    self._discard_connection()
+                    raise
 
             logger.info(f"Email sent to {', '.join(to_addresses)}")
             return True
@@ -84,85 +218,33 @@ class EmailNotifier(Notifier):
 
     def _create_subject(self, context: NotificationContext) -> str:
         """Create email subject line"""
-        event_type = context.event_type.value.upper()
-        status_emoji = {
-            'down': '🔴',
-            'up': '🟢',
-            'ssl_expire': '⚠️',
-            'degraded': '🟡'
-        }
-        emoji = status_emoji.get(context.event_type.value, 'ℹ️')
+        event_type = context.event_type_upper
+        emoji = EVENT_EMOJI.get(context.event_type, 'ℹ️')
 
         return f"{emoji} [{event_type}] {context.monitor_name}"
 
-    def _create_html_body(self, context: NotificationContext) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _create_html_body(context: NotificationContext) -> str:
         """Create HTML email body"""
-        status_color = {
-            'down': '#dc3545',
-            'up': '#28a745',
-            'ssl_expire': '#ffc107',
-            'degraded': '#fd7e14'
-        }
-        color = status_color.get(context.event_type.value, '#6c757d')
-
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background-color: {color}; color: white; padding: 15px; border-radius: 5px 5px 0 0; }}
-                .content {{ background-color: #f8f9fa; padding: 20px; border: 1px solid #dee2e6; border-top: none; border-radius: 0 0 5px 5px; }}
-                .footer {{ margin-top: 20px; padding-top: 20px; border-top: 1px solid #dee2e6; font-size: 12px; color: #6c757d; }}
-                .details {{ background-color: white; padding: 15px; border-radius: 5px; margin-top: 15px; }}
-                .detail-item {{ margin: 8px 0; }}
-                .label {{ font-weight: bold; color: #495057; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2 style="margin: 0;">{context.event_type.value.upper()}: {context.monitor_name}</h2>
-                </div>
-                <div class="content">
-                    <p style="font-size: 16px; margin-top: 0;">{context.message}</p>
-
-                    <div class="details">
-                        <div class="detail-item">
-                            <span class="label">Monitor:</span> {context.monitor_name}
-                        </div>
-                        <div class="detail-item">
-                            <span class="label">Status:</span> {context.status}
-                        </div>
-                        <div class="detail-item">
-                            <span class="label">Time:</span> {context.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}
-                        </div>
-"""
-
-        # Add metadata if present
+        details = ''
         if context.metadata:
-            html += """
-                        <div class="detail-item" style="margin-top: 15px;">
-                            <span class="label">Additional Details:</span>
-                        </div>
-"""
-            for key, value in context.metadata.items():
-                html += f"""
-                        <div class="detail-item" style="margin-left: 20px;">
-                            <span class="label">{key}:</span> {value}
-                        </div>
-"""
-
-        html += """
-                    </div>
-
-                    <div class="footer">
-                        <p style="margin: 0;">This is an automated notification from Simple Uptime Monitor.</p>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        return html
+            rows = [
+                _METADATA_ROW % (html_escape(str(key)), html_escape(str(value)))
+                for key, value in context.metadata.items()
+            ]
+            details = _METADATA_HEADER + "".join(rows)
+
+        # Monitor names, messages and metadata can carry arbitrary text
+        # (error messages, response snippets), so escape them
+        monitor_name = html_escape(context.monitor_name)
+        return _HTML_TEMPLATE % (
+            _STATUS_COLORS.get(context.event_type, '#6c757d'),
+            context.event_type_upper,
+            monitor_name,
+            html_escape(context.message),
+            monitor_name,
+            html_escape(context.status),
+            context.formatted_timestamp,
+            details
+        )
@@ -2,23 +2,56 @@
 Slack webhook notification handler.
 """
 
-from slack_sdk.webhook import WebhookClient
-from slack_sdk.errors import SlackApiError
-from uptime_monitor.notifications.base import Notifier, NotificationContext, NotificationEvent
+from functools import lru_cache
+from typing import List
+from uptime_monitor.notifications.base import (
+    BatchingNotifier, NotificationContext, NotificationEvent, RateLimited,
+    parse_retry_after, post_json, summarize_events
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Header emoji per event type
+_EMOJI = {
+    NotificationEvent.DOWN: ':red_circle:',
+    NotificationEvent.UP: ':large_green_circle:',
+    NotificationEvent.SSL_EXPIRE: ':warning:',
+    NotificationEvent.DEGRADED: ':large_orange_circle:'
+}
+
+_DIVIDER_BLOCK = {
+    "type": "divider"
+}
+
+# Divider and footer closing every message
+_FOOTER_BLOCKS = (
+    _DIVIDER_BLOCK,
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "_Simple Uptime Monitor_"
+            }
+        ]
+    }
+)
 
-class SlackNotifier(Notifier):
+
+class SlackNotifier(BatchingNotifier):
     """Slack webhook notification"""
 
-    def send(self, context: NotificationContext) -> bool:
+    # Slack allows 50 blocks per message; each event takes up to 4 blocks
+    # plus a divider, and the footer adds 2: 9 * 5 - 1 + 2 = 46
+    max_batch_size = 9
+
+    def send_batch(self, contexts: List[NotificationContext]) -> bool:
         """
-        Send Slack notification.
+        Send Slack notification, separating events with dividers.
 
         Args:
-            context: Notification context
+            contexts: Notification contexts
 
         Returns:
             True if notification sent successfully
@@ -32,51 +65,50 @@ class SlackNotifier(Notifier):
             return False
 
         try:
-            webhook = WebhookClient(webhook_url)
-
             # Create message blocks
-            blocks = self._create_blocks(context)
+            blocks = []
+            for context in contexts:
+                if blocks:
+                    blocks.append(_DIVIDER_BLOCK)
+                blocks.extend(self._create_blocks(context))
+            blocks.extend(_FOOTER_BLOCKS)
+
+            if len(contexts) == 1:
+                text = f"{contexts[0].event_type_upper}: {contexts[0].monitor_name}"
+            else:
+                text = f"{len(contexts)} monitor events: {summarize_events(contexts)}"
 
-            # Send message
-            response = webhook.send(
-                text=f"{context.event_type.value.upper()}: {context.monitor_name}",  # Fallback text
-                blocks=blocks,
-                channel=channel,
-                username=username
-            )
+            payload = {
+                'text': text,  # Fallback text
+                'blocks': blocks,
+                'username': username
+            }
+            if channel:
+                payload['channel'] = channel
+
+            # Send message over the shared keep-alive session
+            response = post_json(webhook_url, payload)
 
             if response.status_code == 200:
                 logger.info("Slack notification sent successfully")
                 return True
+            elif response.status_code == 429:
+                raise RateLimited(parse_retry_after(response.headers.get('Retry-After')))
             else:
-                logger.error(f"Slack webhook returned status code {response.status_code}")
+                logger.error(f"Slack webhook returned status code {response.status_code}: {response.text}")
                 return False
 
-        except SlackApiError as e:
-            logger.error(f"Slack API error: {e.response['error']}")
-            return False
+        except RateLimited:
+            raise
         except Exception as e:
             logger.error(f"Failed to send Slack notification: {e}")
             return False
 
-    def _create_blocks(self, context: NotificationContext) -> list:
-        """Create Slack message blocks"""
-        # Emoji and color based on event type
-        emoji_map = {
-            NotificationEvent.DOWN: ':red_circle:',
-            NotificationEvent.UP: ':large_green_circle:',
-            NotificationEvent.SSL_EXPIRE: ':warning:',
-            NotificationEvent.DEGRADED: ':large_orange_circle:'
-        }
-        emoji = emoji_map.get(context.event_type, ':information_source:')
-
-        color_map = {
-            NotificationEvent.DOWN: '#dc3545',
-            NotificationEvent.UP: '#28a745',
-            NotificationEvent.SSL_EXPIRE: '#ffc107',
-            NotificationEvent.DEGRADED: '#fd7e14'
-        }
-        color = color_map.get(context.event_type, '#6c757d')
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _create_blocks(context: NotificationContext) -> list:
+        """Create Slack message blocks for one event (without the footer)"""
+        emoji = _EMOJI.get(context.event_type, ':information_source:')
 
         # Build blocks
         blocks = [
@@ -84,7 +116,7 @@ class SlackNotifier(Notifier):
                 "type": "header",
                 "text": {
                     "type": "plain_text",
-                    "text": f"{emoji} {context.event_type.value.upper()}: {context.monitor_name}"
+                    "text": f"{emoji} {context.event_type_upper}: {context.monitor_name}"
                 }
             },
             {
@@ -103,7 +135,7 @@ class SlackNotifier(Notifier):
                     },
                     {
                         "type": "mrkdwn",
-                        "text": f"*Time:*\n{context.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+                        "text": f"*Time:*\n{context.formatted_timestamp}"
                     }
                 ]
             }
@@ -124,20 +156,4 @@ class SlackNotifier(Notifier):
                 "fields": metadata_fields
             })
 
-        # Add divider and footer
-        blocks.extend([
-            {
-                "type": "divider"
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": "_Simple Uptime Monitor_"
-                    }
-                ]
-            }
-        ])
-
         return blocks
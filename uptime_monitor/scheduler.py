@@ -2,67 +2,125 @@
 Monitoring scheduler - coordinates monitor execution and manages incidents.
 """
 
+import asyncio
+import heapq
+import importlib
+import queue
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
 import logging
 
-from uptime_monitor.config import get_config
+from sqlalchemy import DateTime, literal, select, update
+
+from uptime_monitor.config import get_config, get_monitor_target, load_config
+from uptime_monitor.executor import MonitoringExecutor
 from uptime_monitor.database import (
-    get_session, MonitorModel, CheckResult as CheckResultModel,
-    Incident, NotificationLog
+    get_database, get_session, MonitorModel, CheckResult as CheckResultModel,
+    Incident, NotificationLog, seconds_between
 )
-from uptime_monitor.monitors.base import Monitor, MonitorStatus
-from uptime_monitor.monitors.http import HTTPMonitor
-from uptime_monitor.monitors.tcp import TCPMonitor
-from uptime_monitor.monitors.ping import PingMonitor
-from uptime_monitor.monitors.dns import DNSMonitor
-from uptime_monitor.monitors.websocket import WebSocketMonitor
-from uptime_monitor.monitors.docker_health import DockerMonitor
-from uptime_monitor.monitors.push import PushMonitor
+from uptime_monitor.monitors.base import Monitor, MonitorStatus, run_checks
+from uptime_monitor.monitors.tcp import TCPMonitorBatch
 from uptime_monitor.notifications.base import Notifier, NotificationContext, NotificationEvent
-from uptime_monitor.notifications.email import EmailNotifier
-from uptime_monitor.notifications.discord import DiscordNotifier
-from uptime_monitor.notifications.slack import SlackNotifier
 
 logger = logging.getLogger(__name__)
 
+# Shortest check interval (seconds) the scheduler will run a monitor at
+_MIN_INTERVAL = 1
+
+
+@lru_cache(maxsize=None)
+def _load_class(path: str) -> Type:
+    """
+    Import a class given as 'package.module:ClassName'.
+
+    Monitor and notifier modules pull in their client libraries (docker,
+    dnspython, websocket-client, ...), so they are only imported once a
+    configured monitor or channel needs them.
+
+    Args:
+        path: Module path and class name separated by a colon
+
+    Returns:
+        The class
+    """
+    module_path, class_name = path.split(':')
+    return getattr(importlib.import_module(module_path), class_name)
+
 
 class MonitorScheduler:
     """Coordinates monitor execution and incident management"""
 
+    # Implementations by type, imported on first use (see _load_class)
     MONITOR_CLASSES = {
-        'http': HTTPMonitor,
-        'tcp': TCPMonitor,
-        'ping': PingMonitor,
-        'dns': DNSMonitor,
-        'websocket': WebSocketMonitor,
-        'docker': DockerMonitor,
-        'push': PushMonitor
+        'http': 'uptime_monitor.monitors.http:HTTPMonitor',
+        'tcp': 'uptime_monitor.monitors.tcp:TCPMonitor',
+        'ping': 'uptime_monitor.monitors.ping:PingMonitor',
+        'dns': 'uptime_monitor.monitors.dns:DNSMonitor',
+        'websocket': 'uptime_monitor.monitors.websocket:WebSocketMonitor',
+        'docker': 'uptime_monitor.monitors.docker_health:DockerMonitor',
+        'push': 'uptime_monitor.monitors.push:PushMonitor'
     }
 
     NOTIFIER_CLASSES = {
-        'email': EmailNotifier,
-        'discord': DiscordNotifier,
-        'slack': SlackNotifier
+        'email': 'uptime_monitor.notifications.email:EmailNotifier',
+        'discord': 'uptime_monitor.notifications.discord:DiscordNotifier',
+        'slack': 'uptime_monitor.notifications.slack:SlackNotifier'
     }
 
+    # How often HTTPS monitors re-read their SSL certificate (seconds)
+    SSL_REFRESH_INTERVAL = 86400
+
+    # Check results are written in batches by a single writer thread
+    RESULT_BATCH_SIZE = 1000
+    RESULT_FLUSH_INTERVAL = 1.0  # seconds
+
+    # Threads sending notifications, kept apart from the check workers
+    NOTIFICATION_WORKERS = 4
+
+    # Most checks in flight at once on the shared event loop
+    MAX_ASYNC_CHECKS = 256
+
     def __init__(self, max_workers: int = 10):
         """
         Initialize scheduler.
 
         Args:
-            max_workers: Maximum number of concurrent monitor checks
+            max_workers: Number of concurrent monitor checks; the pool can grow
+                to twice this while checks are queueing up
         """
         self.config = get_config()
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._default_interval = self.config.get_default_interval()
+        self._schedule: List[Tuple[str, int, dict]] = []
+        self.executor = MonitoringExecutor(min_workers=max_workers, max_workers=2 * max_workers)
+        self.notif_executor = ThreadPoolExecutor(
+            max_workers=self.NOTIFICATION_WORKERS,
+            thread_name_prefix="notif"
+        )
         self.monitors: Dict[str, Monitor] = {}
         self.notifiers: Dict[str, Notifier] = {}
         self.monitor_last_run: Dict[str, float] = {}
+        self._last_status: Dict[str, MonitorStatus] = {}
+        self._monitor_ids: Dict[str, int] = {}
+        self.ssl_last_refresh = time.time()
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self._result_queue: queue.Queue = queue.Queue()
+        self._wakeup = threading.Event()
+        self._reschedule = False
+        # Serializes full reloads and single-monitor changes
+        self._reload_lock = threading.RLock()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._check_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._check_loop_thread: Optional[threading.Thread] = None
+        self._check_semaphore: Optional[asyncio.Semaphore] = None
+        self._async_batches: Set[Future] = set()
+        # Batch futures are discarded from the event loop thread
+        self._async_batches_lock = threading.Lock()
 
         # Load monitors and notifiers
         self._load_monitors()
@@ -72,6 +130,7 @@ class MonitorScheduler:
         """Load monitors from configuration"""
         logger.info("Loading monitors from configuration...")
 
+        loaded_configs = []
         for monitor_config in self.config.monitors:
             if not monitor_config.get('enabled', True):
                 logger.info(f"Skipping disabled monitor: {monitor_config['name']}")
@@ -80,24 +139,103 @@ class MonitorScheduler:
             try:
                 monitor = self._create_monitor(monitor_config)
                 self.monitors[monitor_config['name']] = monitor
-
-                # Sync monitor to database
-                self._sync_monitor_to_db(monitor_config)
+                loaded_configs.append(monitor_config)
 
             except Exception as e:
                 logger.error(f"Failed to load monitor '{monitor_config['name']}': {e}")
 
+        # Sync monitors to database
+        try:
+            self._sync_monitors_to_db(loaded_configs)
+        except Exception as e:
+            logger.error(f"Failed to sync monitors to the database: {e}")
+
+        self._cache_schedule()
+        self._prime_last_status(self.monitors.keys())
+        self._stagger_first_runs()
         logger.info(f"Loaded {len(self.monitors)} monitors")
 
+    def _stagger_first_runs(self) -> None:
+        """
+        Spread the first checks after startup across each monitor's interval.
+
+        Without this every monitor would be due at once when the process
+        starts. Each monitor gets a fixed slot within its interval, derived
+        from its name; monitors whose persisted last run is more recent
+        than that keep their regular schedule.
+        """
+        now = time.time()
+        for monitor_name, interval, _ in self._schedule:
+            offset = zlib.crc32(monitor_name.encode('utf-8')) % max(int(interval), 1)
+            self.monitor_last_run[monitor_name] = max(self.monitor_last_run.get(monitor_name, 0), now - offset)
+
+    def _cache_schedule(self) -> None:
+        """
+        Precompute (name, interval, config) for every loaded monitor.
+
+        Disabled monitors and ones that failed to load are left out, so the
+        scheduler loop never has to look at them. Intervals are clamped to
+        _MIN_INTERVAL so a zero or negative value can't spin the loop.
+        """
+        self._schedule = [
+            (
+                monitor_config['name'],
+                max(_MIN_INTERVAL, monitor_config.get('interval', self._default_interval)),
+                monitor_config
+            )
+            for monitor_config in self.config.monitors
+            if monitor_config.get('enabled', True) and monitor_config['name'] in self.monitors
+        ]
+
+    def _prime_last_status(self, monitor_names: Iterable[str]) -> None:
+        """
+        Load the most recent stored status of each monitor.
+
+        State changes are detected against these in-memory statuses, so
+        this only has to hit the database once, at load time.
+
+        Args:
+            monitor_names: Monitors to load the status for
+        """
+        monitor_names = list(monitor_names)
+        if not monitor_names:
+            return
+
+        session = get_session()
+        try:
+            # Correlated per-monitor seek on the (monitor_id, timestamp)
+            # index, so only the requested monitors' latest rows are read
+            latest_id = select(CheckResultModel.id)\
+                .where(CheckResultModel.monitor_id == MonitorModel.id)\
+                .order_by(CheckResultModel.timestamp.desc())\
+                .limit(1)\
+                .correlate(MonitorModel)\
+                .scalar_subquery()
+
+            rows = session.execute(
+                select(MonitorModel.name, CheckResultModel.status)
+                .join(CheckResultModel, CheckResultModel.monitor_id == MonitorModel.id)
+                .where(CheckResultModel.id.in_(
+                    select(latest_id).where(MonitorModel.name.in_(monitor_names))
+                ))
+            ).all()
+
+            for monitor_name, status in rows:
+                self._last_status[monitor_name] = MonitorStatus(status)
+        finally:
+            session.close()
+
     def _create_monitor(self, monitor_config: dict) -> Monitor:
         """Create monitor instance from configuration"""
         monitor_type = monitor_config['type']
-        monitor_class = self.MONITOR_CLASSES.get(monitor_type)
+        monitor_class_path = self.MONITOR_CLASSES.get(monitor_type)
 
-        if not monitor_class:
+        if not monitor_class_path:
             raise ValueError(f"Unknown monitor type: {monitor_type}")
 
-        return monitor_class(
+        monitor_class = _load_class(monitor_class_path)
+
+        monitor = monitor_class(
             name=monitor_config['name'],
             config=monitor_config.get('config', {}),
             timeout=monitor_config.get('timeout', 10),
@@ -105,39 +243,47 @@ class MonitorScheduler:
             retry_delay=monitor_config.get('retry_delay', 5)
         )
 
-    def _sync_monitor_to_db(self, monitor_config: dict) -> None:
-        """Sync monitor configuration to database"""
-        session = get_session()
-        try:
-            monitor = session.query(MonitorModel).filter_by(name=monitor_config['name']).first()
-
-            if monitor:
-                # Update existing
-                monitor.type = monitor_config['type']
-                monitor.enabled = monitor_config.get('enabled', True)
-                monitor.group_name = monitor_config.get('group')
-                monitor.interval = monitor_config.get('interval', self.config.get_default_interval())
-                monitor.timeout = monitor_config.get('timeout', 10)
-                monitor.retry_count = monitor_config.get('retry_count', 1)
-                monitor.config = monitor_config.get('config', {})
-                monitor.updated_at = datetime.utcnow()
-            else:
-                # Create new
-                monitor = MonitorModel(
-                    name=monitor_config['name'],
-                    type=monitor_config['type'],
-                    enabled=monitor_config.get('enabled', True),
-                    group_name=monitor_config.get('group'),
-                    interval=monitor_config.get('interval', self.config.get_default_interval()),
-                    timeout=monitor_config.get('timeout', 10),
-                    retry_count=monitor_config.get('retry_count', 1),
-                    config=monitor_config.get('config', {})
-                )
-                session.add(monitor)
+        # Resolve notification routing once instead of on every event
+        monitor.alert_on = frozenset(monitor_config.get('alert_on', ('down', 'up')))
+        monitor.notification_names = tuple(monitor_config.get('notifications', ()))
+        return monitor
 
-            session.commit()
-        finally:
-            session.close()
+    def _sync_monitors_to_db(self, monitor_configs: List[dict]) -> None:
+        """
+        Sync monitor configurations to the database with one upsert.
+
+        Args:
+            monitor_configs: Configurations of the monitors to sync
+        """
+        if not monitor_configs:
+            return
+
+        synced_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = [
+            {
+                'name': monitor_config['name'],
+                'type': monitor_config['type'],
+                'enabled': monitor_config.get('enabled', True),
+                'group_name': monitor_config.get('group'),
+                'interval': monitor_config.get('interval', self._default_interval),
+                'timeout': monitor_config.get('timeout', 10),
+                'retry_count': monitor_config.get('retry_count', 1),
+                'config': monitor_config.get('config', {}),
+                'target_display': get_monitor_target(monitor_config['type'], monitor_config.get('config', {})),
+                'updated_at': synced_at
+            }
+            for monitor_config in monitor_configs
+        ]
+
+        synced = get_database().upsert_monitors(rows)
+
+        for monitor_name, (monitor_id, last_run_at) in synced.items():
+            # Remember the id so checks never have to look it up by name
+            self._monitor_ids[monitor_name] = monitor_id
+
+            # Resume the schedule from the last stored check after a restart
+            if last_run_at is not None and monitor_name not in self.monitor_last_run:
+                self.monitor_last_run[monitor_name] = last_run_at.replace(tzinfo=timezone.utc).timestamp()
 
     def _load_notifiers(self) -> None:
         """Load notifiers from configuration"""
@@ -155,11 +301,13 @@ class MonitorScheduler:
     def _create_notifier(self, notif_config: dict) -> Notifier:
         """Create notifier instance from configuration"""
         notif_type = notif_config['type']
-        notifier_class = self.NOTIFIER_CLASSES.get(notif_type)
+        notifier_class_path = self.NOTIFIER_CLASSES.get(notif_type)
 
-        if not notifier_class:
+        if not notifier_class_path:
             raise ValueError(f"Unknown notifier type: {notif_type}")
 
+        notifier_class = _load_class(notifier_class_path)
+
         return notifier_class(
             name=notif_config['name'],
             config=notif_config.get('config', {}),
@@ -173,6 +321,11 @@ class MonitorScheduler:
             return
 
         self.running = True
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        self._check_loop = asyncio.new_event_loop()
+        self._check_loop_thread = threading.Thread(target=self._check_loop.run_forever, name="check-loop", daemon=True)
+        self._check_loop_thread.start()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
         logger.info("Monitor scheduler started")
@@ -184,11 +337,33 @@ class MonitorScheduler:
 
         logger.info("Stopping monitor scheduler...")
         self.running = False
+        self._wakeup.set()
 
         if self.thread:
             self.thread.join(timeout=30)
 
+        # Shut down in dependency order: checks on the worker pool may
+        # still hand retries to the event loop, so drain the pool first,
+        # then let the loop's batches finish before stopping it
         self.executor.shutdown(wait=True)
+
+        with self._async_batches_lock:
+            async_batches = list(self._async_batches)
+        wait(async_batches, timeout=30)
+        self._check_loop.call_soon_threadsafe(self._check_loop.stop)
+        self._check_loop_thread.join(timeout=30)
+        self._check_loop.close()
+
+        self.notif_executor.shutdown(wait=True)
+
+        # Flush check results still waiting to be written
+        self._result_queue.put(None)
+        if self._writer_thread:
+            self._writer_thread.join(timeout=30)
+
+        for notifier in self.notifiers.values():
+            notifier.close()
+
         logger.info("Monitor scheduler stopped")
 
     def reload_monitors(self) -> None:
@@ -197,11 +372,16 @@ class MonitorScheduler:
 
         This allows hot-reloading of monitor configuration changes.
         """
+        with self._reload_lock:
+            self._reload_monitors()
+
+    def _reload_monitors(self) -> None:
+        """Reload monitors from configuration (call with _reload_lock held)"""
         logger.info("Reloading monitor configuration...")
 
         # Reload config from file
-        from uptime_monitor.config import load_config
         self.config = load_config('config.yaml')
+        self._default_interval = self.config.get_default_interval()
 
         # Get current monitor names
         old_monitor_names = set(self.monitors.keys())
@@ -218,8 +398,10 @@ class MonitorScheduler:
             del self.monitors[monitor_name]
             if monitor_name in self.monitor_last_run:
                 del self.monitor_last_run[monitor_name]
+            self._last_status.pop(monitor_name, None)
 
         # Add new monitors
+        changed_configs = []
         for monitor_config in self.config.monitors:
             monitor_name = monitor_config['name']
 
@@ -235,7 +417,7 @@ class MonitorScheduler:
                     logger.info(f"Adding new monitor: {monitor_name}")
                     monitor = self._create_monitor(monitor_config)
                     self.monitors[monitor_name] = monitor
-                    self._sync_monitor_to_db(monitor_config)
+                    changed_configs.append(monitor_config)
                 except Exception as e:
                     logger.error(f"Failed to add monitor '{monitor_name}': {e}")
 
@@ -245,51 +427,187 @@ class MonitorScheduler:
                     logger.info(f"Updating monitor: {monitor_name}")
                     monitor = self._create_monitor(monitor_config)
                     self.monitors[monitor_name] = monitor
-                    self._sync_monitor_to_db(monitor_config)
+                    changed_configs.append(monitor_config)
                 except Exception as e:
                     logger.error(f"Failed to update monitor '{monitor_name}': {e}")
 
+        try:
+            self._sync_monitors_to_db(changed_configs)
+        except Exception as e:
+            logger.error(f"Failed to sync monitors to the database: {e}")
+
         # Reload notifiers as well
+        for notifier in self.notifiers.values():
+            notifier.close()
         self.notifiers.clear()
         self._load_notifiers()
 
+        self._prime_last_status(monitors_to_add & set(self.monitors))
+        self._publish_schedule()
+
         logger.info(f"Configuration reloaded: {len(self.monitors)} monitors active")
 
+    def add_monitor(self, monitor_config: dict) -> None:
+        """
+        Start running one new monitor without reloading the others.
+
+        Args:
+            monitor_config: Configuration of the monitor, as saved to config.yaml
+        """
+        with self._reload_lock:
+            logger.info(f"Adding new monitor: {monitor_config['name']}")
+            self.config.set_monitor(monitor_config)
+            self._load_monitor(monitor_config)
+            self._prime_last_status([monitor_config['name']])
+            self._publish_schedule()
+
+    def update_monitor(self, old_name: str, monitor_config: dict) -> None:
+        """
+        Replace one monitor without reloading the others.
+
+        Args:
+            old_name: Name of the monitor before the change
+            monitor_config: New configuration of the monitor, as saved to config.yaml
+        """
+        with self._reload_lock:
+            monitor_name = monitor_config['name']
+            logger.info(f"Updating monitor: {monitor_name}")
+            self.config.set_monitor(monitor_config, old_name)
+            if old_name != monitor_name:
+                self._unload_monitor(old_name)
+            self._load_monitor(monitor_config)
+            if old_name != monitor_name:
+                self._prime_last_status([monitor_name])
+            self._publish_schedule()
+
+    def remove_monitor(self, monitor_name: str) -> None:
+        """
+        Stop running one monitor without reloading the others.
+
+        Args:
+            monitor_name: Name of the monitor to remove
+        """
+        with self._reload_lock:
+            logger.info(f"Removing monitor: {monitor_name}")
+            self.config.remove_monitor(monitor_name)
+            self._unload_monitor(monitor_name)
+            self._publish_schedule()
+
+    def _load_monitor(self, monitor_config: dict) -> None:
+        """Create (or disable) the instance for one monitor and sync it to the database"""
+        monitor_name = monitor_config['name']
+
+        if not monitor_config.get('enabled', True):
+            if self.monitors.pop(monitor_name, None) is not None:
+                logger.info(f"Disabling monitor: {monitor_name}")
+            return
+
+        try:
+            self.monitors[monitor_name] = self._create_monitor(monitor_config)
+        except Exception as e:
+            self.monitors.pop(monitor_name, None)
+            logger.error(f"Failed to load monitor '{monitor_name}': {e}")
+            return
+
+        try:
+            self._sync_monitors_to_db([monitor_config])
+        except Exception as e:
+            logger.error(f"Failed to sync monitors to the database: {e}")
+
+    def _unload_monitor(self, monitor_name: str) -> None:
+        """Forget one monitor's instance and scheduling state"""
+        self.monitors.pop(monitor_name, None)
+        self.monitor_last_run.pop(monitor_name, None)
+        self._last_status.pop(monitor_name, None)
+
+    def _publish_schedule(self) -> None:
+        """Have the scheduler loop pick up new, removed and changed intervals"""
+        self._cache_schedule()
+        self._reschedule = True
+        self._wakeup.set()
+
+    def _build_schedule(self) -> List[tuple]:
+        """
+        Build the heap of upcoming checks from the current configuration.
+
+        Returns:
+            Heap of (next_run_time, monitor_name, interval, monitor_config) tuples
+        """
+        last_run = self.monitor_last_run
+        heap = [
+            (last_run.get(monitor_name, 0) + interval, monitor_name, interval, monitor_config)
+            for monitor_name, interval, monitor_config in self._schedule
+        ]
+        heapq.heapify(heap)
+        return heap
+
     def _run_loop(self) -> None:
-        """Main scheduler loop"""
+        """
+        Main scheduler loop.
+
+        Upcoming checks are kept in a min-heap keyed on their next run
+        time, so the loop only wakes when a check is due (or on reload and
+        shutdown) and dispatching costs O(log M) per check.
+        """
         logger.info("Scheduler loop starting...")
 
+        heap = self._build_schedule()
+
         while self.running:
             try:
-                current_time = time.time()
+                if self._reschedule:
+                    self._reschedule = False
+                    heap = self._build_schedule()
 
-                # Get monitor configs with their intervals
-                for monitor_config in self.config.monitors:
-                    if not monitor_config.get('enabled', True):
-                        continue
+                current_time = time.time()
+                due_push_checks = []
+                due_ping_checks = []
+                due_tcp_checks = []
 
-                    monitor_name = monitor_config['name']
+                # Pop every monitor that is due
+                while heap and heap[0][0] <= current_time:
+                    _, monitor_name, interval, monitor_config = heapq.heappop(heap)
 
-                    # Skip if monitor type is 'push' (passive monitoring)
                     if monitor_config['type'] == 'push':
-                        # Push monitors still need to be checked for deadline expiration
-                        pass
-
-                    # Check if it's time to run this monitor
-                    interval = monitor_config.get('interval', self.config.get_default_interval())
-                    last_run = self.monitor_last_run.get(monitor_name, 0)
-
-                    if current_time - last_run >= interval:
+                        # Push monitors only read the database; check them together
+                        due_push_checks.append((monitor_name, monitor_config))
+                    elif monitor_config['type'] == 'ping':
+                        # Pings are fired concurrently from the shared event loop
+                        due_ping_checks.append((monitor_name, monitor_config))
+                    elif monitor_config['type'] == 'tcp':
+                        # TCP connects share one selector instead of a thread each
+                        due_tcp_checks.append((monitor_name, monitor_config))
+                    else:
                         # Submit monitor check to thread pool
                         self.executor.submit(self._run_monitor_check, monitor_name, monitor_config)
-                        self.monitor_last_run[monitor_name] = current_time
+                    self.monitor_last_run[monitor_name] = current_time
+
+                    heapq.heappush(heap, (current_time + interval, monitor_name, interval, monitor_config))
+
+                if due_push_checks:
+                    self.executor.submit(self._run_push_checks, due_push_checks)
+                if due_ping_checks:
+                    self._run_async_checks(due_ping_checks)
+                if due_tcp_checks:
+                    self.executor.submit(self._run_tcp_checks, due_tcp_checks)
+
+                # Certificates change rarely; refresh them on their own schedule
+                next_ssl_refresh = self.ssl_last_refresh + self.SSL_REFRESH_INTERVAL
+                if current_time >= next_ssl_refresh:
+                    self.executor.submit(self._refresh_ssl_certificates)
+                    self.ssl_last_refresh = current_time
+                    next_ssl_refresh = current_time + self.SSL_REFRESH_INTERVAL
 
-                # Sleep for 1 second (scheduler resolution)
-                time.sleep(1)
+                # Sleep until the next check is due; reload and stop wake us early
+                next_wakeup = min(heap[0][0], next_ssl_refresh) if heap else next_ssl_refresh
+                self._wakeup.wait(max(0.0, next_wakeup - current_time))
+                self._wakeup.clear()
 
             except Exception as e:
                 logger.error(f"Error in scheduler loop: {e}")
-                time.sleep(5)  # Back off on error
+                # Back off on error, but still stop right away when asked to
+                self._wakeup.wait(5)
+                self._wakeup.clear()
 
         logger.info("Scheduler loop ended")
 
@@ -309,130 +627,396 @@ class MonitorScheduler:
         try:
             # Perform check with retry logic
             result = monitor.check_with_retry()
+        except Exception as e:
+            logger.error(f"Failed to run check for monitor '{monitor_name}': {e}")
+            return
 
-            # Save result to database
-            self._save_check_result(monitor_name, result)
+        # Save result and handle state changes
+        self._record_results([(monitor_name, monitor_config, result)])
 
-            # Check for state changes and handle incidents
-            self._handle_state_change(monitor_name, monitor_config, result)
+    def _run_push_checks(self, batch: List[tuple]) -> None:
+        """
+        Run a batch of push monitor checks on one shared database session.
 
-        except Exception as e:
-            logger.error(f"Failed to run check for monitor '{monitor_name}': {e}")
+        Push checks only compare the last push time against the deadline,
+        so they are run once without retries.
 
-    def _save_check_result(self, monitor_name: str, result) -> None:
-        """Save check result to database"""
+        Args:
+            batch: List of (monitor_name, monitor_config) tuples
+        """
+        results = []
         session = get_session()
         try:
-            # Get monitor from database
-            monitor = session.query(MonitorModel).filter_by(name=monitor_name).first()
+            for monitor_name, monitor_config in batch:
+                monitor = self.monitors.get(monitor_name)
+                if not monitor:
+                    logger.error(f"Monitor '{monitor_name}' not found")
+                    continue
+                results.append((monitor_name, monitor_config, monitor.check(session=session)))
+        except Exception as e:
+            logger.error(f"Failed to run push monitor checks: {e}")
+        finally:
+            session.close()
+
+        self._record_results(results)
+
+    def _run_async_checks(self, batch: List[tuple], first_attempt: int = 1) -> None:
+        """
+        Run a batch of monitor checks on the shared event loop.
+
+        The checks run concurrently as coroutines on one long-lived loop
+        (at most MAX_ASYNC_CHECKS at a time across all batches), so N
+        hosts take about as long as the slowest one and no worker thread
+        waits on them. Once the batch is done its results are recorded on
+        the worker pool (or directly, if the scheduler is stopping). Monitors without a native check_async() fall back
+        to running check() in the loop's default executor.
+
+        Args:
+            batch: List of (monitor_name, monitor_config) tuples
+            first_attempt: Retry attempt to start at, when earlier attempts
+                already ran elsewhere
+        """
+        checks = []
+        for monitor_name, monitor_config in batch:
+            monitor = self.monitors.get(monitor_name)
             if not monitor:
-                logger.error(f"Monitor '{monitor_name}' not found in database")
+                logger.error(f"Monitor '{monitor_name}' not found")
+                continue
+            checks.append((monitor_name, monitor_config, monitor))
+
+        if not checks:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._check_many_async([monitor for _, _, monitor in checks], first_attempt),
+            self._check_loop
+        )
+        with self._async_batches_lock:
+            self._async_batches.add(future)
+
+        def record(done: Future) -> None:
+            with self._async_batches_lock:
+                self._async_batches.discard(done)
+            try:
+                check_results = done.result()
+            except Exception as e:
+                logger.error(f"Failed to run async monitor checks: {e}")
                 return
 
-            # Create check result record
-            check_result = CheckResultModel(
-                monitor_id=monitor.id,
-                timestamp=result.timestamp,
-                status=result.status.value,
-                response_time=result.response_time,
-                status_code=result.status_code,
-                error_message=result.error_message,
-                check_metadata=result.metadata
-            )
+            results = [
+                (monitor_name, monitor_config, result)
+                for (monitor_name, monitor_config, _), result in zip(checks, check_results)
+            ]
+            try:
+                self.executor.submit(self._record_results, results)
+            except RuntimeError:
+                # The worker pool is already shut down (scheduler stopping)
+                self._record_results(results)
+
+        future.add_done_callback(record)
+
+    async def _check_many_async(self, monitors: List[Monitor], first_attempt: int = 1) -> List:
+        """Check monitors concurrently, bounded by the scheduler-wide semaphore"""
+        # Created here so it belongs to the check loop (Python < 3.10 binds
+        # semaphores to the loop current at construction)
+        if self._check_semaphore is None:
+            self._check_semaphore = asyncio.Semaphore(self.MAX_ASYNC_CHECKS)
+        return await run_checks(monitors, semaphore=self._check_semaphore, first_attempt=first_attempt)
+
+    def _run_tcp_checks(self, batch: List[tuple]) -> None:
+        """
+        Run a batch of TCP monitor checks with non-blocking connects.
+
+        All connects in the batch are waited on from one selector, so the
+        batch takes one thread instead of one per monitor. Failed connects
+        on monitors with retries configured are confirmed through the
+        retrying async check on the event loop before they are recorded.
+
+        Args:
+            batch: List of (monitor_name, monitor_config) tuples
+        """
+        checks = []
+        for monitor_name, monitor_config in batch:
+            monitor = self.monitors.get(monitor_name)
+            if not monitor:
+                logger.error(f"Monitor '{monitor_name}' not found")
+                continue
+            checks.append((monitor_name, monitor_config, monitor))
+
+        try:
+            check_results = TCPMonitorBatch.check_many([monitor for _, _, monitor in checks])
+        except Exception as e:
+            logger.error(f"Failed to run TCP monitor checks: {e}")
+            return
+
+        results = []
+        retries = []
+        for (monitor_name, monitor_config, monitor), result in zip(checks, check_results):
+            if (result.status != MonitorStatus.UP and result.retriable
+                    and monitor.retry_count > 1):
+                retries.append((monitor_name, monitor_config))
+            else:
+                results.append((monitor_name, monitor_config, result))
+
+        self._record_results(results)
+
+        if retries:
+            # Confirm failures with the retrying async check. The batched
+            # connect counts as the first attempt
+            self._run_async_checks(retries, first_attempt=2)
+
+    def _refresh_ssl_certificates(self) -> None:
+        """Refresh cached SSL certificate info for all HTTP monitors"""
+        http_monitor_class = _load_class(self.MONITOR_CLASSES['http'])
+        for monitor_name, monitor in list(self.monitors.items()):
+            if not isinstance(monitor, http_monitor_class):
+                continue
+            try:
+                monitor.refresh_ssl_info()
+            except Exception as e:
+                logger.error(f"Failed to refresh SSL certificate for monitor '{monitor_name}': {e}")
+
+    def _record_results(self, results: List[tuple]) -> None:
+        """
+        Save results from a batch of checks and handle state changes.
+
+        All incident changes for the batch share one session and commit;
+        each monitor's changes run in a savepoint so one failure doesn't
+        undo the others. Notifications are handed to the notification pool
+        after that commit, so slow webhooks and SMTP servers hold neither a
+        write transaction nor a check worker.
+
+        Args:
+            results: List of (monitor_name, monitor_config, result) tuples
+        """
+        # Most checks repeat the previous status (or are a monitor's first
+        # result); those need no incident handling, so only transitions
+        # touch the session
+        transitions = []
+        transitioning = set()
+        last_status = self._last_status
+        for monitor_name, monitor_config, result in results:
+            self._save_check_result(monitor_name, result)
+
+            previous_status = last_status.get(monitor_name)
+            if monitor_name not in transitioning and (previous_status is None or previous_status == result.status):
+                last_status[monitor_name] = result.status
+                continue
+            transitions.append((monitor_name, monitor_config, result))
+            transitioning.add(monitor_name)
+
+        if not transitions:
+            return
+
+        # New statuses are only published once their incidents are committed;
+        # a monitor whose savepoint or commit failed keeps its previous status,
+        # so the transition is retried on its next check
+        new_statuses = {}
+        pending_notifications = []
+        session = get_session()
+        try:
+            for monitor_name, monitor_config, result in transitions:
+                previous_status = new_statuses.get(monitor_name, last_status.get(monitor_name))
+                try:
+                    with session.begin_nested():
+                        event = self._handle_state_change(
+                            session, monitor_name, monitor_config, result, previous_status
+                        )
+                except Exception as e:
+                    logger.error(f"Failed to handle state change for monitor '{monitor_name}': {e}")
+                    continue
+
+                new_statuses[monitor_name] = result.status
+                if event is not None:
+                    pending_notifications.append((monitor_name, monitor_config, event, result))
 
-            session.add(check_result)
             session.commit()
+            last_status.update(new_statuses)
 
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to record check results: {e}")
+            return
         finally:
             session.close()
 
-    def _handle_state_change(self, monitor_name: str, monitor_config: dict, result) -> None:
-        """Handle monitor state changes and incidents"""
+        for monitor_name, monitor_config, event, result in pending_notifications:
+            self.notif_executor.submit(self._dispatch_notifications, monitor_name, monitor_config, event, result)
+
+    def _dispatch_notifications(self, monitor_name: str, monitor_config: dict, event: NotificationEvent, result) -> None:
+        """Send notifications for a monitor event and log them (runs on the notification pool)"""
         session = get_session()
         try:
-            # Get monitor from database
-            monitor = session.query(MonitorModel).filter_by(name=monitor_name).first()
-            if not monitor:
-                return
+            self._send_notifications(session, monitor_name, monitor_config, event, result)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to send notifications for monitor '{monitor_name}': {e}")
+        finally:
+            session.close()
 
-            # Get last check result (before current one)
-            last_result = session.query(CheckResultModel)\
-                .filter_by(monitor_id=monitor.id)\
-                .order_by(CheckResultModel.timestamp.desc())\
-                .offset(1)\
-                .first()
+    def _save_check_result(self, monitor_name: str, result) -> None:
+        """Queue a check result for the writer thread"""
+        monitor_id = self._monitor_ids.get(monitor_name)
+        if monitor_id is None:
+            logger.error(f"Dropped check result for monitor '{monitor_name}', which is not in the database")
+            return
 
-            current_status = result.status
-            previous_status = MonitorStatus(last_result.status) if last_result else None
+        self._result_queue.put({
+            'monitor_id': monitor_id,
+            'timestamp': result.utc_datetime,
+            'status': result.status.value,
+            'response_time': result.response_time,
+            'status_code': result.status_code,
+            'error_message': result.error_message,
+            'check_metadata': result.metadata
+        })
+
+    def _writer_loop(self) -> None:
+        """
+        Write queued check results to the database in batches.
 
-            # Check if state changed
-            if previous_status and previous_status != current_status:
-                logger.info(f"Monitor '{monitor_name}' state changed: {previous_status.value} -> {current_status.value}")
+        Waits for a result, then keeps collecting for up to
+        RESULT_FLUSH_INTERVAL seconds (or RESULT_BATCH_SIZE rows) and writes
+        the batch with one bulk insert and a single commit. A None item
+        flushes what is left and stops the thread.
+        """
+        stopping = False
+
+        while not stopping:
+            item = self._result_queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.RESULT_FLUSH_INTERVAL
+            while len(batch) < self.RESULT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._result_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
 
-                # Handle state transitions
-                if current_status == MonitorStatus.DOWN and previous_status == MonitorStatus.UP:
-                    # Service went down - create incident
-                    self._create_incident(session, monitor, result)
-                    self._send_notifications(monitor_name, monitor_config, NotificationEvent.DOWN, result)
+            self._write_results(batch)
 
-                elif current_status == MonitorStatus.UP and previous_status == MonitorStatus.DOWN:
-                    # Service recovered - close incident
-                    self._close_incident(session, monitor, result)
-                    self._send_notifications(monitor_name, monitor_config, NotificationEvent.UP, result)
+    def _write_results(self, batch: List[dict]) -> None:
+        """
+        Insert a batch of queued check results.
 
-        finally:
-            session.close()
+        Args:
+            batch: CheckResult column mappings
+        """
+        try:
+            get_database().bulk_record_checks(batch)
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} check results: {e}")
+
+    def _handle_state_change(self, session, monitor_name: str, monitor_config: dict,
+                             result, previous_status: Optional[MonitorStatus]) -> Optional[NotificationEvent]:
+        """
+        Handle monitor state changes and incidents.
+
+        Args:
+            session: Database session (inside the monitor's savepoint)
+            monitor_name: Name of the monitor
+            monitor_config: Monitor configuration
+            result: The check result
+            previous_status: Status the monitor had before this result
+
+        Returns:
+            The event to notify about, if the state changed
+        """
+        monitor_id = self._monitor_ids.get(monitor_name)
+        if monitor_id is None:
+            return None
+
+        current_status = result.status
 
-    def _create_incident(self, session, monitor: MonitorModel, result) -> None:
+        # Check if state changed
+        if previous_status and previous_status != current_status:
+            logger.info(f"Monitor '{monitor_name}' state changed: {previous_status.value} -> {current_status.value}")
+
+            # Handle state transitions
+            if current_status == MonitorStatus.DOWN and previous_status == MonitorStatus.UP:
+                # Service went down - create incident
+                self._create_incident(session, monitor_id, monitor_name, result)
+                return NotificationEvent.DOWN
+
+            elif current_status == MonitorStatus.UP and previous_status == MonitorStatus.DOWN:
+                # Service recovered - close incident
+                self._close_incident(session, monitor_id, monitor_name, result)
+                return NotificationEvent.UP
+
+        return None
+
+    def _create_incident(self, session, monitor_id: int, monitor_name: str, result) -> None:
         """Create a new incident"""
         incident = Incident(
-            monitor_id=monitor.id,
-            started_at=result.timestamp,
+            monitor_id=monitor_id,
+            started_at=result.utc_datetime,
             notified=False
         )
         session.add(incident)
-        session.commit()
-
-        logger.warning(f"Incident created for monitor '{monitor.name}' (ID: {incident.id})")
-
-    def _close_incident(self, session, monitor: MonitorModel, result) -> None:
-        """Close an ongoing incident"""
-        # Find ongoing incident
-        incident = session.query(Incident)\
-            .filter_by(monitor_id=monitor.id, ended_at=None)\
-            .order_by(Incident.started_at.desc())\
-            .first()
-
-        if incident:
-            incident.ended_at = result.timestamp
-            incident.duration = int((incident.ended_at - incident.started_at).total_seconds())
-            session.commit()
+        session.flush()
+
+        logger.warning(f"Incident created for monitor '{monitor_name}' (ID: {incident.id})")
+
+    def _close_incident(self, session, monitor_id: int, monitor_name: str, result) -> None:
+        """Close the monitor's ongoing incident with a single UPDATE"""
+        incidents = Incident.__table__
+        ended_at = result.utc_datetime
+        closed = session.execute(
+            update(incidents)
+            .where(incidents.c.monitor_id == monitor_id, incidents.c.ended_at.is_(None))
+            .values(
+                ended_at=ended_at,
+                duration=seconds_between(incidents.c.started_at, literal(ended_at, DateTime))
+            )
+        ).rowcount
 
-            logger.info(f"Incident {incident.id} closed for monitor '{monitor.name}' (duration: {incident.duration}s)")
+        if closed:
+            logger.info(f"Incident closed for monitor '{monitor_name}'")
 
-    def _send_notifications(self, monitor_name: str, monitor_config: dict, event: NotificationEvent, result) -> None:
+    def _send_notifications(self, session, monitor_name: str, monitor_config: dict, event: NotificationEvent, result) -> None:
         """Send notifications for a monitor event"""
+        monitor = self.monitors.get(monitor_name)
+        if monitor is None:
+            return
+
         # Check if this event should trigger notifications
-        alert_on = monitor_config.get('alert_on', ['down', 'up'])
-        if event.value not in alert_on:
+        if event.value not in monitor.alert_on:
             return
 
         # Get notification channel names
-        notification_names = monitor_config.get('notifications', [])
+        notification_names = monitor.notification_names
         if not notification_names:
             return
 
-        # Create notification context
-        context = NotificationContext(
-            monitor_name=monitor_name,
-            event_type=event,
-            status=result.status.value,
-            message=result.error_message or f"Monitor is {result.status.value}",
-            timestamp=result.timestamp,
-            metadata=result.metadata or {}
-        )
+        # Build the notification context on first use and share it between
+        # channels, so events for disabled channels cost nothing
+        context = None
+
+        def get_context() -> NotificationContext:
+            nonlocal context
+            if context is None:
+                context = NotificationContext(
+                    monitor_name=monitor_name,
+                    event_type=event,
+                    status=result.status.value,
+                    message=result.error_message or f"Monitor is {result.status.value}",
+                    timestamp=result.utc_datetime,
+                    metadata=result.metadata or {}
+                )
+            return context
 
         # Send to each configured channel
+        attempts = []
         for notif_name in notification_names:
             notifier = self.notifiers.get(notif_name)
             if not notifier:
@@ -440,36 +1024,50 @@ class MonitorScheduler:
                 continue
 
             # Send notification (with retry)
-            success = notifier.send_with_retry(context)
+            success = notifier.send_with_retry(get_context)
+            attempts.append((notif_name, notifier.config.get('type', 'unknown'), success))
 
-            # Log notification attempt
-            self._log_notification(monitor_name, notif_name, notifier.config.get('type', 'unknown'), event, success)
+        # Log notification attempts
+        self._log_notifications(session, monitor_name, event, attempts)
 
-    def _log_notification(self, monitor_name: str, notif_name: str, notif_type: str, event: NotificationEvent, success: bool) -> None:
-        """Log notification attempt to database"""
-        session = get_session()
-        try:
-            monitor = session.query(MonitorModel).filter_by(name=monitor_name).first()
-            if not monitor:
-                return
+    def _log_notifications(self, session, monitor_name: str, event: NotificationEvent,
+                           attempts: List[Tuple[str, str, bool]]) -> None:
+        """
+        Add notification attempts to the log (committed by the caller).
 
-            # Get current incident if any
-            incident = session.query(Incident)\
-                .filter_by(monitor_id=monitor.id, ended_at=None)\
-                .order_by(Incident.started_at.desc())\
-                .first()
-
-            log_entry = NotificationLog(
-                incident_id=incident.id if incident else None,
-                monitor_id=monitor.id,
-                notification_type=notif_type,
-                notification_name=notif_name,
-                event_type=event.value,
-                success=success
-            )
+        The log is append-only, so the rows go in with one Core INSERT on
+        the session's connection instead of through the ORM.
 
-            session.add(log_entry)
-            session.commit()
+        Args:
+            session: Session whose transaction the rows are written in
+            monitor_name: Monitor the notifications were about
+            event: Event that was notified
+            attempts: (notifier name, notifier type, success) per channel
+        """
+        if not attempts:
+            return
 
-        finally:
-            session.close()
+        monitor_id = self._monitor_ids.get(monitor_name)
+        if monitor_id is None:
+            return
+
+        # Get current incident if any
+        incidents = Incident.__table__
+        incident_id = session.execute(
+            select(incidents.c.id)
+            .where(incidents.c.monitor_id == monitor_id, incidents.c.ended_at.is_(None))
+            .order_by(incidents.c.started_at.desc())
+            .limit(1)
+        ).scalar()
+
+        session.execute(NotificationLog.__table__.insert(), [
+            {
+                'incident_id': incident_id,
+                'monitor_id': monitor_id,
+                'notification_type': notif_type,
+                'notification_name': notif_name,
+                'event_type': event.value,
+                'success': success
+            }
+            for notif_name, notif_type, success in attempts
+        ])
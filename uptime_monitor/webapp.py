@@ -2,25 +2,48 @@
 Flask web application for dashboard and API.
 """
 
-from flask import Flask, render_template, jsonify, request, redirect, url_for, flash
+from flask import (
+    Flask, Response, render_template, jsonify, request, redirect, url_for, flash,
+    make_response, stream_with_context
+)
+from collections import namedtuple
 from datetime import datetime, timedelta
-from sqlalchemy import func
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import DateTime, Row, and_, case, func, literal, or_, select, update
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import copy
+import hashlib
+import json
 import logging
+import mmap
+import shutil
+import tempfile
+import threading
+import time
 import yaml
 import os
+import sys
 
-from uptime_monitor.config import get_config
+from uptime_monitor.config import get_config, VALID_MONITOR_TYPES, _TARGET_EXTRACTORS, _unknown_target
 from uptime_monitor.database import (
-    get_session, MonitorModel, CheckResult, Incident,
+    get_database, get_session, add_seconds, MonitorModel, CheckResult, Incident,
     UptimeStats, PushMonitor as PushMonitorModel
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__,
             template_folder='templates',
             static_folder='../static')
 
+# Monitor scheduler, set by main() once it has been created
+app.scheduler = None
+
 
 def init_app():
     """Initialize Flask app with configuration"""
@@ -30,38 +53,92 @@ def init_app():
     app.config['SECRET_KEY'] = web_config['secret_key']
     app.config['JSON_SORT_KEYS'] = False
 
+    # Templates ship with the package and don't change while running: skip
+    # the per-render mtime check, keep compiled templates across restarts
+    # and compile them all now rather than on first request
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+    for template_name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(template_name)
+
     return app
 
 
-@app.route('/')
-def dashboard():
-    """Main dashboard view"""
-    session = get_session()
-    try:
-        config = get_config()
+@app.teardown_appcontext
+def remove_session(exception=None):
+    """Close the request's database session, returning its connection to the pool"""
+    get_database().remove_session()
 
-        # Get all monitors with their latest status
-        monitors = session.query(MonitorModel).filter_by(enabled=True).all()
 
-        # Organize monitors by group
-        groups = config.get_monitors_by_group()
-        group_order = config.get_group_display_order()
+def _json_default(value: Any) -> Any:
+    """Serialize values the stdlib json module can't (naive datetimes are UTC)"""
+    if isinstance(value, datetime):
+        return value.isoformat() + 'Z' if value.tzinfo is None else value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
-        # Get latest check results for each monitor
-        monitor_statuses = {}
-        for monitor in monitors:
-            latest_check = session.query(CheckResult)\
-                .filter_by(monitor_id=monitor.id)\
-                .order_by(CheckResult.timestamp.desc())\
-                .first()
 
-            # Check for ongoing incident
-            ongoing_incident = session.query(Incident)\
-                .filter_by(monitor_id=monitor.id, ended_at=None)\
-                .first()
+def _json_bytes(data: Any) -> bytes:
+    """
+    Encode data as JSON, using orjson when available.
+
+    Datetimes are emitted as ISO-8601 UTC with a 'Z' suffix, so API data
+    can carry datetime objects instead of formatting each one.
+
+    Args:
+        data: JSON-serializable data (may contain datetimes)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default, separators=(',', ':')).encode('utf-8')
 
-            # Extract target info from config based on monitor type
-            target_info = _get_monitor_target(monitor.type, monitor.config)
+
+def _json_response(data: Any) -> Response:
+    """Build a JSON response (see _json_bytes)"""
+    return Response(_json_bytes(data), mimetype='application/json')
+
+
+def _get_status_snapshot() -> Dict[str, Any]:
+    """
+    Get the current status of every enabled monitor.
+
+    The dashboard, its AJAX polling endpoint and the debug view all show
+    the same data, so one snapshot is built and shared between them for
+    SNAPSHOT_TTL seconds. Only one request builds it at a time; concurrent
+    requests wait and reuse the result.
+
+    Returns:
+        Dictionary with 'timestamp' (when the snapshot was built),
+        'monitors' (monitor name to status dict) and 'etag' (a digest of
+        the monitors, unchanged while their data is). Treat it as read-only.
+    """
+    global _snapshot
+
+    with _snapshot_lock:
+        if _snapshot is not None and _snapshot[0] > time.monotonic():
+            return _snapshot[1]
+
+        session = get_session()
+        # Read-only: fetch plain rows rather than mapped objects
+        monitors = session.execute(
+            select(
+                MonitorModel.id, MonitorModel.name, MonitorModel.type,
+                MonitorModel.group_name, MonitorModel.interval, MonitorModel.target_display
+            ).where(MonitorModel.enabled.is_(True))
+        ).all()
+
+        # Get latest check results, ongoing incidents and uptime for all monitors
+        monitor_ids = [monitor.id for monitor in monitors]
+        latest_checks = _get_latest_checks(session, monitor_ids)
+        ongoing_incidents = _get_ongoing_incidents(session, monitor_ids)
+        uptimes = _calculate_uptimes(session, monitor_ids)
+
+        monitor_statuses = {}
+        for monitor in monitors:
+            latest_check = latest_checks.get(monitor.id)
 
             monitor_statuses[monitor.name] = {
                 'id': monitor.id,
@@ -72,17 +149,55 @@ def dashboard():
                 'response_time': latest_check.response_time if latest_check else None,
                 'last_checked': latest_check.timestamp if latest_check else None,
                 'error_message': latest_check.error_message if latest_check else None,
-                'ongoing_incident': ongoing_incident.id if ongoing_incident else None,
-                'uptime_24h': _calculate_uptime(session, monitor.id, hours=24),
-                'uptime_7d': _calculate_uptime(session, monitor.id, days=7),
-                'uptime_30d': _calculate_uptime(session, monitor.id, days=30),
+                'ongoing_incident': ongoing_incidents.get(monitor.id),
+                'uptime_24h': uptimes[monitor.id]['24h'],
+                'uptime_7d': uptimes[monitor.id]['7d'],
+                'uptime_30d': uptimes[monitor.id]['30d'],
                 'interval': monitor.interval,
-                'target': target_info,
-                'config': monitor.config
+                'target': monitor.target_display or 'Unknown'
             }
 
+        snapshot = {
+            'timestamp': datetime.utcnow(),
+            'monitors': monitor_statuses,
+            'etag': hashlib.blake2b(_json_bytes(monitor_statuses), digest_size=16).hexdigest()
+        }
+        _snapshot = (time.monotonic() + SNAPSHOT_TTL, snapshot)
+        return snapshot
+
+
+def _conditional_response(etag: str, build: Callable[[], Any]) -> Response:
+    """
+    Answer with 304 Not Modified if the client already has this version.
+
+    Args:
+        etag: Entity tag of the current content
+        build: Callable producing the full response (only called on a miss)
+
+    Returns:
+        Response carrying the ETag header
+    """
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = make_response(build())
+    response.set_etag(etag)
+    return response
+
+
+@app.route('/')
+def dashboard():
+    """Main dashboard view"""
+    config = get_config()
+    snapshot = _get_status_snapshot()
+    monitor_statuses = snapshot['monitors']
+
+    # Organize monitors by group
+    group_order = list(config.get_group_display_order())
+
+    def render():
         # Calculate overall statistics
-        total_monitors = len(monitors)
+        total_monitors = len(monitor_statuses)
         up_count = sum(1 for m in monitor_statuses.values() if m['status'] == 'up')
         down_count = sum(1 for m in monitor_statuses.values() if m['status'] == 'down')
         overall_uptime = (up_count / total_monitors * 100) if total_monitors > 0 else 0
@@ -100,121 +215,107 @@ def dashboard():
                              total_monitors=total_monitors,
                              up_count=up_count,
                              down_count=down_count)
-    finally:
-        session.close()
+
+    # The page only changes with the monitors' data or the configured group order
+    group_digest = hashlib.blake2b('|'.join(group_order).encode('utf-8'), digest_size=8).hexdigest()
+    return _conditional_response(f"{snapshot['etag']}-{group_digest}", render)
 
 
 @app.route('/monitor/<int:monitor_id>')
 def monitor_detail(monitor_id):
     """Individual monitor detail page"""
     session = get_session()
-    try:
-        monitor = session.query(MonitorModel).filter_by(id=monitor_id).first()
-        if not monitor:
-            return "Monitor not found", 404
+    monitor = session.query(MonitorModel).filter_by(id=monitor_id).first()
+    if not monitor:
+        return "Monitor not found", 404
 
-        # Get latest check
-        latest_check = session.query(CheckResult)\
-            .filter_by(monitor_id=monitor.id)\
-            .order_by(CheckResult.timestamp.desc())\
-            .first()
-
-        # Get recent incidents
-        recent_incidents = session.query(Incident)\
-            .filter_by(monitor_id=monitor.id)\
-            .order_by(Incident.started_at.desc())\
-            .limit(20)\
-            .all()
-
-        # Get uptime statistics
-        uptime_stats = {
-            '24h': _calculate_uptime(session, monitor.id, hours=24),
-            '7d': _calculate_uptime(session, monitor.id, days=7),
-            '30d': _calculate_uptime(session, monitor.id, days=30)
-        }
+    # Get latest check
+    latest_check = session.query(CheckResult)\
+        .filter_by(monitor_id=monitor.id)\
+        .order_by(CheckResult.timestamp.desc())\
+        .first()
 
-        return render_template('monitor_detail.html',
-                             monitor=monitor,
-                             latest_check=latest_check,
-                             recent_incidents=recent_incidents,
-                             uptime_stats=uptime_stats)
-    finally:
-        session.close()
+    # Get recent incidents
+    recent_incidents = session.query(Incident)\
+        .filter_by(monitor_id=monitor.id)\
+        .order_by(Incident.started_at.desc())\
+        .limit(20)\
+        .all()
+
+    # Get uptime statistics
+    uptime_stats = _calculate_uptimes(session, [monitor.id])[monitor.id]
+
+    return render_template('monitor_detail.html',
+                         monitor=monitor,
+                         latest_check=latest_check,
+                         recent_incidents=recent_incidents,
+                         uptime_stats=uptime_stats)
 
 
 @app.route('/api/status')
 def api_status():
     """JSON API for dashboard status updates (AJAX polling)"""
-    session = get_session()
-    try:
-        monitors = session.query(MonitorModel).filter_by(enabled=True).all()
+    snapshot = _get_status_snapshot()
 
+    def build():
         result = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'monitors': []
+            'timestamp': snapshot['timestamp'],
+            'monitors': [
+                {
+                    'id': status['id'],
+                    'name': status['name'],
+                    'type': status['type'],
+                    'group': status['group'],
+                    'status': status['status'],
+                    'response_time': status['response_time'],
+                    'last_checked': status['last_checked'],
+                    'error_message': status['error_message'],
+                    'ongoing_incident_id': status['ongoing_incident']
+                }
+                for status in snapshot['monitors'].values()
+            ]
         }
 
-        for monitor in monitors:
-            latest_check = session.query(CheckResult)\
-                .filter_by(monitor_id=monitor.id)\
-                .order_by(CheckResult.timestamp.desc())\
-                .first()
-
-            ongoing_incident = session.query(Incident)\
-                .filter_by(monitor_id=monitor.id, ended_at=None)\
-                .first()
+        return _json_response(result)
 
-            result['monitors'].append({
-                'id': monitor.id,
-                'name': monitor.name,
-                'type': monitor.type,
-                'group': monitor.group_name or 'Ungrouped',
-                'status': latest_check.status if latest_check else 'unknown',
-                'response_time': latest_check.response_time if latest_check else None,
-                'last_checked': latest_check.timestamp.isoformat() if latest_check else None,
-                'error_message': latest_check.error_message if latest_check else None,
-                'ongoing_incident_id': ongoing_incident.id if ongoing_incident else None
-            })
-
-        return jsonify(result)
-    finally:
-        session.close()
+    # Polls while nothing has changed get an empty 304
+    return _conditional_response(snapshot['etag'], build)
 
 
 @app.route('/api/monitor/<int:monitor_id>/history')
 def api_monitor_history(monitor_id):
     """JSON API for monitor history data (for charts)"""
-    session = get_session()
-    try:
-        # Get time range from query params (default: last 24 hours)
-        hours = request.args.get('hours', 24, type=int)
-        since = datetime.utcnow() - timedelta(hours=hours)
-
-        # Get check results
-        results = session.query(CheckResult)\
-            .filter(
+    # Get time range from query params (default: last 24 hours)
+    hours = request.args.get('hours', 24, type=int)
+    since = datetime.utcnow() - timedelta(hours=hours)
+
+    def generate():
+        # Runs while the response streams; stream_with_context keeps the
+        # request's session open until it finishes
+        session = get_session()
+        # Fetch plain rows in chunks rather than hydrating every CheckResult
+        rows = session.execute(
+            select(CheckResult.timestamp, CheckResult.status, CheckResult.response_time)
+            .where(
                 CheckResult.monitor_id == monitor_id,
                 CheckResult.timestamp >= since
-            )\
-            .order_by(CheckResult.timestamp.asc())\
-            .all()
-
-        data = {
-            'monitor_id': monitor_id,
-            'hours': hours,
-            'data_points': []
-        }
+            )
+            .order_by(CheckResult.timestamp.asc())
+            .execution_options(yield_per=HISTORY_CHUNK_SIZE)
+        )
 
-        for result in results:
-            data['data_points'].append({
-                'timestamp': result.timestamp.isoformat(),
-                'status': result.status,
-                'response_time': result.response_time
+        yield _json_bytes({'monitor_id': monitor_id, 'hours': hours})[:-1] + b',"data_points":['
+        separator = b''
+        for timestamp, status, response_time in rows:
+            yield separator + _json_bytes({
+                'timestamp': timestamp,
+                'status': status,
+                'response_time': response_time
             })
+            separator = b','
+        yield b']}'
 
-        return jsonify(data)
-    finally:
-        session.close()
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @app.route('/api/push/<int:monitor_id>/<secret_key>', methods=['POST', 'GET'])
@@ -226,27 +327,42 @@ def api_push_update(monitor_id, secret_key):
     """
     session = get_session()
     try:
-        # Find push monitor
-        push_monitor = session.query(PushMonitorModel)\
-            .filter_by(monitor_id=monitor_id)\
-            .first()
-
-        if not push_monitor:
-            return jsonify({'error': 'Push monitor not found'}), 404
-
-        # Verify secret key
-        if push_monitor.secret_key != secret_key:
+        now = datetime.utcnow()
+        push_monitors = PushMonitorModel.__table__
+
+        # Record the push and its next deadline in one UPDATE; the secret
+        # key is matched by the database rather than compared in Python
+        stmt = update(push_monitors)\
+            .where(
+                push_monitors.c.monitor_id == monitor_id,
+                push_monitors.c.secret_key == secret_key
+            )\
+            .values(
+                last_push_at=now,
+                next_expected_at=add_seconds(
+                    literal(now, DateTime),
+                    push_monitors.c.expected_interval + func.coalesce(push_monitors.c.grace_period, 0)
+                )
+            )
+
+        if session.get_bind().dialect.update_returning:
+            next_expected = session.execute(stmt.returning(push_monitors.c.next_expected_at)).scalar()
+            updated = next_expected is not None
+        else:
+            updated = session.execute(stmt).rowcount > 0
+            next_expected = session.execute(
+                select(push_monitors.c.next_expected_at).where(push_monitors.c.monitor_id == monitor_id)
+            ).scalar() if updated else None
+
+        if not updated:
+            # Only failed pushes pay for telling a missing monitor from a bad key
+            exists = session.execute(
+                select(push_monitors.c.id).where(push_monitors.c.monitor_id == monitor_id)
+            ).first()
+            if not exists:
+                return jsonify({'error': 'Push monitor not found'}), 404
             return jsonify({'error': 'Invalid secret key'}), 403
 
-        # Update last push time
-        push_monitor.last_push_at = datetime.utcnow()
-
-        # Calculate next expected time
-        next_expected = push_monitor.last_push_at + timedelta(
-            seconds=push_monitor.expected_interval + push_monitor.grace_period
-        )
-        push_monitor.next_expected_at = next_expected
-
         session.commit()
 
         logger.info(f"Push received for monitor ID {monitor_id}")
@@ -254,56 +370,43 @@ def api_push_update(monitor_id, secret_key):
         return jsonify({
             'success': True,
             'monitor_id': monitor_id,
-            'received_at': push_monitor.last_push_at.isoformat(),
+            'received_at': now.isoformat(),
             'next_expected_by': next_expected.isoformat()
         })
 
     except Exception as e:
         logger.error(f"Error processing push for monitor {monitor_id}: {e}")
         return jsonify({'error': 'Internal server error'}), 500
-    finally:
-        session.close()
 
 
 @app.route('/debug')
 def debug_data():
     """Debug endpoint to see what data is being passed to template"""
-    session = get_session()
-    try:
-        config = get_config()
-        monitors = session.query(MonitorModel).filter_by(enabled=True).all()
-        groups = config.get_monitors_by_group()
-        group_order = config.get_group_display_order()
-
-        # Get latest check results for each monitor
-        monitor_statuses = {}
-        for monitor in monitors:
-            latest_check = session.query(CheckResult)\
-                .filter_by(monitor_id=monitor.id)\
-                .order_by(CheckResult.timestamp.desc())\
-                .first()
-
-            target_info = _get_monitor_target(monitor.type, monitor.config)
-
-            monitor_statuses[monitor.name] = {
-                'id': monitor.id,
-                'name': monitor.name,
-                'type': monitor.type,
-                'group': monitor.group_name or 'Ungrouped',
-                'target': target_info,
-                'status': latest_check.status if latest_check else 'unknown',
-            }
-
-        debug_info = {
-            'total_monitors': len(monitors),
-            'group_order': group_order,
-            'groups_in_config': list(groups.keys()),
-            'monitor_statuses': monitor_statuses
+    config = get_config()
+    groups = config.get_monitors_by_group()
+    group_order = config.get_group_display_order()
+
+    monitor_statuses = {
+        name: {
+            'id': status['id'],
+            'name': status['name'],
+            'type': status['type'],
+            'group': status['group'],
+            'target': status['target'],
+            'status': status['status'],
         }
+        for name, status in _get_status_snapshot()['monitors'].items()
+    }
 
-        return jsonify(debug_info)
-    finally:
-        session.close()
+    debug_info = {
+        'total_monitors': len(monitor_statuses),
+        'group_order': group_order,
+        'groups_in_config': list(groups.keys()),
+        'monitor_statuses': monitor_statuses,
+        'executor': app.scheduler.executor.stats() if app.scheduler else None
+    }
+
+    return jsonify(debug_info)
 
 
 @app.route('/settings')
@@ -315,81 +418,193 @@ def settings():
                          config=config)
 
 
-def _get_monitor_target(monitor_type: str, config: dict) -> str:
+def _get_latest_checks(session, monitor_ids: List[int]) -> Dict[int, Row]:
     """
-    Extract human-readable target information from monitor config.
+    Get the most recent check result of each monitor in one query.
+
+    Each monitor's latest result id is found by a correlated subquery that
+    seeks the (monitor_id, timestamp) index, so the cost grows with the
+    number of monitors rather than with the size of the history.
 
     Args:
-        monitor_type: Type of monitor
-        config: Monitor configuration dict
+        session: Database session
+        monitor_ids: Monitor IDs
 
     Returns:
-        Human-readable target string
+        Dictionary of monitor ID to a row with its latest check's monitor_id,
+        timestamp, status, response_time and error_message (monitors
+        without any checks are left out)
     """
-    if monitor_type == 'http':
-        return config.get('url', 'Unknown')
-    elif monitor_type == 'tcp':
-        host = config.get('host', 'Unknown')
-        port = config.get('port', '')
-        return f"{host}:{port}" if port else host
-    elif monitor_type == 'ping':
-        return config.get('host', 'Unknown')
-    elif monitor_type == 'dns':
-        hostname = config.get('hostname', 'Unknown')
-        record_type = config.get('record_type', 'A')
-        resolver = config.get('resolver', '8.8.8.8')
-        return f"{hostname} ({record_type}) via {resolver}"
-    elif monitor_type == 'websocket':
-        return config.get('url', 'Unknown')
-    elif monitor_type == 'docker':
-        return config.get('container_name', 'Unknown')
-    elif monitor_type == 'push':
-        return 'Push-based (passive)'
-    else:
-        return 'Unknown'
+    if not monitor_ids:
+        return {}
+
+    latest_id = select(CheckResult.id)\
+        .where(CheckResult.monitor_id == MonitorModel.id)\
+        .order_by(CheckResult.timestamp.desc())\
+        .limit(1)\
+        .correlate(MonitorModel)\
+        .scalar_subquery()
 
+    latest_checks = session.execute(
+        select(
+            CheckResult.monitor_id, CheckResult.timestamp, CheckResult.status,
+            CheckResult.response_time, CheckResult.error_message
+        ).where(CheckResult.id.in_(
+            select(latest_id).where(MonitorModel.id.in_(monitor_ids))
+        ))
+    ).all()
 
-def _calculate_uptime(session, monitor_id: int, hours: int = None, days: int = None) -> float:
+    return {check.monitor_id: check for check in latest_checks}
+
+
+def _get_ongoing_incidents(session, monitor_ids: List[int]) -> Dict[int, int]:
     """
-    Calculate uptime percentage for a monitor over a time period.
+    Get the ongoing incident of each monitor in one query.
 
     Args:
         session: Database session
-        monitor_id: Monitor ID
-        hours: Hours to look back
-        days: Days to look back
+        monitor_ids: Monitor IDs
 
     Returns:
-        Uptime percentage (0-100)
+        Dictionary of monitor ID to ongoing incident ID (monitors without
+        an ongoing incident are left out)
     """
-    if hours:
-        since = datetime.utcnow() - timedelta(hours=hours)
-    elif days:
-        since = datetime.utcnow() - timedelta(days=days)
-    else:
-        since = datetime.utcnow() - timedelta(hours=24)
+    if not monitor_ids:
+        return {}
+
+    return dict(session.execute(
+        select(Incident.monitor_id, func.max(Incident.id))
+        .where(Incident.monitor_id.in_(monitor_ids), Incident.ended_at.is_(None))
+        .group_by(Incident.monitor_id)
+    ).all())
+
+
+# Windows shown for every monitor's uptime, longest first
+UPTIME_WINDOWS = {
+    '30d': timedelta(days=30),
+    '7d': timedelta(days=7),
+    '24h': timedelta(hours=24)
+}
+
+# Rows fetched per round trip when streaming monitor history
+HISTORY_CHUNK_SIZE = 2000
+
+# Seconds the shared dashboard/API status snapshot is reused for
+SNAPSHOT_TTL = 3
+
+# (monotonic expiry time, snapshot) of the latest status snapshot
+_snapshot: Optional[Tuple[float, Dict[str, Any]]] = None
+_snapshot_lock = threading.Lock()
+
+# Uptime changes slowly compared to how often the dashboard and API are
+# polled, so computed percentages are reused for this many seconds
+UPTIME_CACHE_TTL = 30
+
+# Monitor ID -> (monotonic expiry time, {window: uptime percentage})
+_uptime_cache: Dict[int, Tuple[float, Dict[str, float]]] = {}
+_uptime_cache_lock = threading.Lock()
+
 
-    # Get total checks
-    total_checks = session.query(func.count(CheckResult.id))\
-        .filter(
-            CheckResult.monitor_id == monitor_id,
-            CheckResult.timestamp >= since
-        )\
-        .scalar()
+def _calculate_uptimes(session, monitor_ids: List[int]) -> Dict[int, Dict[str, float]]:
+    """
+    Calculate uptime percentages for monitors over every UPTIME_WINDOWS window.
+
+    Results are cached for UPTIME_CACHE_TTL seconds. Monitors without a
+    fresh cache entry are computed together: whole days come from the
+    per-day UptimeStats counters (including today's, which is kept current
+    as checks are recorded), and only the partial first day of each window
+    is counted from raw check results.
+
+    Args:
+        session: Database session
+        monitor_ids: Monitor IDs
+
+    Returns:
+        Dictionary of monitor ID to {window: uptime percentage (0-100)};
+        every requested monitor is included, with 0.0 for windows without checks
+    """
+    uptimes = {}
+    missing = []
+    current_time = time.monotonic()
+    with _uptime_cache_lock:
+        for monitor_id in monitor_ids:
+            cached = _uptime_cache.get(monitor_id)
+            if cached and cached[0] > current_time:
+                uptimes[monitor_id] = cached[1]
+            else:
+                missing.append(monitor_id)
 
-    if total_checks == 0:
-        return 0.0
+    if not missing:
+        return uptimes
+
+    # Running (total, successful) counts per monitor and window
+    counts = {monitor_id: {window: [0, 0] for window in UPTIME_WINDOWS} for monitor_id in missing}
+
+    now = datetime.utcnow()
+    since = {window: now - length for window, length in UPTIME_WINDOWS.items()}
+    # First whole day of each window; the part of the window before it is partial
+    first_day = {window: since[window].date() + timedelta(days=1) for window in UPTIME_WINDOWS}
+
+    stats_columns = []
+    for window in UPTIME_WINDOWS:
+        in_window = UptimeStats.date >= first_day[window]
+        stats_columns.append(func.sum(case((in_window, UptimeStats.total_checks), else_=0)))
+        stats_columns.append(func.sum(case((in_window, UptimeStats.successful_checks), else_=0)))
+
+    stats_rows = session.execute(
+        select(UptimeStats.monitor_id, *stats_columns)
+        .where(
+            UptimeStats.monitor_id.in_(missing),
+            UptimeStats.date >= min(first_day.values())
+        )
+        .group_by(UptimeStats.monitor_id)
+    ).all()
+
+    is_up = CheckResult.status == 'up'
+    partial_days = {
+        window: and_(
+            CheckResult.timestamp >= since[window],
+            CheckResult.timestamp < datetime.combine(first_day[window], datetime.min.time())
+        )
+        for window in UPTIME_WINDOWS
+    }
+    check_columns = []
+    for window in UPTIME_WINDOWS:
+        check_columns.append(func.count(case((partial_days[window], 1))))
+        check_columns.append(func.count(case((and_(partial_days[window], is_up), 1))))
+
+    check_rows = session.execute(
+        select(CheckResult.monitor_id, *check_columns)
+        .where(
+            CheckResult.monitor_id.in_(missing),
+            or_(*partial_days.values())
+        )
+        .group_by(CheckResult.monitor_id)
+    ).all()
+
+    for monitor_id, *values in stats_rows + check_rows:
+        for i, window in enumerate(UPTIME_WINDOWS):
+            counts[monitor_id][window][0] += values[2 * i] or 0
+            counts[monitor_id][window][1] += values[2 * i + 1] or 0
+
+    computed = {
+        monitor_id: {
+            window: successful_checks / total_checks * 100 if total_checks else 0.0
+            for window, (total_checks, successful_checks) in windows.items()
+        }
+        for monitor_id, windows in counts.items()
+    }
 
-    # Get successful checks
-    successful_checks = session.query(func.count(CheckResult.id))\
-        .filter(
-            CheckResult.monitor_id == monitor_id,
-            CheckResult.timestamp >= since,
-            CheckResult.status == 'up'
-        )\
-        .scalar()
+    expires_at = current_time + UPTIME_CACHE_TTL
+    with _uptime_cache_lock:
+        # Drop expired entries so deleted monitors don't linger
+        for monitor_id in [m for m, (expiry, _) in _uptime_cache.items() if expiry <= current_time]:
+            del _uptime_cache[monitor_id]
+        for monitor_id, values in computed.items():
+            _uptime_cache[monitor_id] = (expires_at, values)
 
-    return (successful_checks / total_checks * 100) if total_checks > 0 else 0.0
+    uptimes.update(computed)
+    return uptimes
 
 
 @app.errorhandler(404)
@@ -405,86 +620,248 @@ def internal_error(error):
     return render_template('500.html'), 500
 
 
-# Template filters
-@app.template_filter('timeago')
-def timeago_filter(timestamp):
-    """Convert timestamp to time ago string"""
-    if not timestamp:
-        return 'Never'
-
-    now = datetime.utcnow()
-    if timestamp.tzinfo:
-        timestamp = timestamp.replace(tzinfo=None)
-
-    diff = now - timestamp
-
-    seconds = diff.total_seconds()
-    if seconds < 60:
-        return f"{int(seconds)}s ago"
-    elif seconds < 3600:
-        return f"{int(seconds / 60)}m ago"
-    elif seconds < 86400:
-        return f"{int(seconds / 3600)}h ago"
-    else:
-        return f"{int(seconds / 86400)}d ago"
-
-
-@app.template_filter('duration')
-def duration_filter(seconds):
-    """Convert seconds to human-readable duration"""
-    if not seconds:
-        return 'N/A'
-
-    if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        return f"{int(seconds / 60)}m {int(seconds % 60)}s"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
-        return f"{hours}h {minutes}m"
-    else:
-        days = int(seconds / 86400)
-        hours = int((seconds % 86400) / 3600)
-        return f"{days}d {hours}h"
-
 # ============================================================================
 # Monitor Management Routes
 # ============================================================================
 
+# libyaml-backed loader/dumper when PyYAML was built with it (much faster
+# than the pure Python implementation)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Prefault all pages of the config mapping up front where supported (Linux)
+_MAP_POPULATE = getattr(mmap, 'MAP_POPULATE', 0)
+
+# config.yaml files smaller than this are read into memory rather than mapped
+_MMAP_MIN_SIZE = 64 * 1024
+_READ_BUFFER_SIZE = 128 * 1024
+
+# config.yaml edited by the management pages, resolved once at import so a
+# later chdir cannot point the app at a different file
+_CONFIG_PATH = os.path.abspath(os.fspath(os.path.join(os.getcwd(), 'config.yaml')))
+
+# Row of the monitor management table, built once per parse of config.yaml
+MonitorView = namedtuple('MonitorView', 'name type enabled group interval target')
+
+# Parsed config.yaml, reused while the file's stat is unchanged
+_YAML_CACHE = {'stat': None, 'data': None, 'groups': None, 'monitors_view': ()}
+_yaml_cache_lock = threading.Lock()
+
+# Rendered monitor management page, as (config.yaml stat key, HTML)
+_manage_html: Optional[Tuple[tuple, str]] = None
+
+# Seconds between checks of config.yaml for edits made outside the web UI
+CONFIG_WATCH_INTERVAL = 2.0
+
+_config_watcher: Optional[threading.Thread] = None
+
+
 def _load_yaml_config():
-    """Load config.yaml file"""
-    config_path = os.path.join(os.getcwd(), 'config.yaml')
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    """
+    Load config.yaml file.
+
+    The parsed file is cached and only re-read when its inode, mtime or
+    size changes. Callers get their own deep copy, so they may modify it.
+    """
+    with _yaml_cache_lock:
+        _refresh_yaml_cache()
+        return copy.deepcopy(_YAML_CACHE['data'])
+
+
+def _refresh_yaml_cache():
+    """Re-parse config.yaml into the cache if it changed on disk (call with _yaml_cache_lock held)"""
+    st = os.stat(_CONFIG_PATH)
+    stat_key = _stat_key(st)
+
+    if _YAML_CACHE['stat'] != stat_key:
+        _set_yaml_cache(stat_key, _parse_yaml_file(_CONFIG_PATH))
+
+
+def _stat_key(st):
+    """Cache key for a stat of config.yaml; saves replace the file, so the inode changes too"""
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _set_yaml_cache(stat_key, config_data):
+    """Store parsed config.yaml data and what is derived from it (call with _yaml_cache_lock held)"""
+    groups = set()
+    if config_data:
+        # Get groups from monitors
+        for monitor in config_data.get('monitors') or []:
+            if isinstance(monitor.get('type'), str):
+                monitor['type'] = sys.intern(monitor['type'])
+            if monitor.get('group'):
+                groups.add(monitor['group'])
+
+        # Get groups from groups section
+        for group in config_data.get('groups') or []:
+            groups.add(group['name'])
+
+    extractor = _TARGET_EXTRACTORS.get
+    monitors_view = tuple(
+        MonitorView(
+            m['name'], m['type'], m.get('enabled', True), m.get('group'), m.get('interval', ''),
+            extractor(m['type'], _unknown_target)(m.get('config') or {})
+        )
+        for m in (config_data or {}).get('monitors') or ()
+    )
+
+    _YAML_CACHE['data'] = config_data
+    _YAML_CACHE['groups'] = sorted(groups)
+    _YAML_CACHE['monitors_view'] = monitors_view
+    _YAML_CACHE['stat'] = stat_key
+
+
+def _parse_yaml_file(path):
+    """
+    Parse a YAML file (None if it is empty).
+
+    Files of at least _MMAP_MIN_SIZE are parsed from a read-only memory map;
+    smaller ones, where setting up the mapping costs more than it saves,
+    are read whole through a single large buffer.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size < _MMAP_MIN_SIZE:
+            with open(fd, 'rb', buffering=_READ_BUFFER_SIZE, closefd=False) as f:
+                return yaml.load(f.read(), Loader=_YAML_LOADER)
+        mapped = mmap.mmap(fd, 0, flags=mmap.MAP_PRIVATE | _MAP_POPULATE, prot=mmap.PROT_READ)
+    finally:
+        # The mapping stays valid after the descriptor is closed
+        os.close(fd)
+    try:
+        return yaml.load(mapped, Loader=_YAML_LOADER)
+    finally:
+        mapped.close()
 
 
 def _save_yaml_config(config_data):
-    """Save config.yaml file"""
-    config_path = os.path.join(os.getcwd(), 'config.yaml')
-    with open(config_path, 'w') as f:
-        yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+    """
+    Save config.yaml file.
+
+    The YAML is serialized in memory, written to a temporary file next to
+    config.yaml and fsynced, then renamed over it, so readers never see a
+    partially written file. The cache is updated with the saved data, so
+    the next load is a cache hit and the config watcher doesn't mistake
+    this write for an outside edit.
+    """
+    content = yaml.dump(
+        config_data, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+    ).encode('utf-8')
+
+    with _yaml_cache_lock:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(_CONFIG_PATH), prefix='.config-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep config.yaml's mode
+            if os.path.exists(_CONFIG_PATH):
+                shutil.copymode(_CONFIG_PATH, tmp_path)
+            os.replace(tmp_path, _CONFIG_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        st = os.stat(_CONFIG_PATH)
+        _set_yaml_cache(_stat_key(st), copy.deepcopy(config_data))
+
+
+def _reload_scheduler():
+    """Hot reload the scheduler's monitors from config.yaml"""
+    try:
+        scheduler = app.scheduler
+        if scheduler:
+            logger.info("Calling scheduler.reload_monitors()...")
+            scheduler.reload_monitors()
+            logger.info("Scheduler reload completed")
+        else:
+            logger.warning("Scheduler is None, cannot reload")
+    except Exception as e:
+        logger.error(f"Error reloading monitors: {e}", exc_info=True)
+
+
+def _update_scheduler(change: str, *args):
+    """
+    Apply a single monitor change to the running scheduler.
+
+    Args:
+        change: Scheduler method to call (add_monitor, update_monitor or remove_monitor)
+        *args: Arguments for that method
+    """
+    try:
+        scheduler = app.scheduler
+        if scheduler:
+            getattr(scheduler, change)(*args)
+        else:
+            logger.warning("Scheduler is None, cannot apply monitor change")
+    except Exception as e:
+        logger.error(f"Error applying monitor change: {e}", exc_info=True)
+
+
+def _watch_config():
+    """Re-parse config.yaml and reload monitors whenever the file is changed outside the web UI"""
+
+    while True:
+        time.sleep(CONFIG_WATCH_INTERVAL)
+        try:
+            # Under the lock, so a save in progress isn't seen as an outside edit
+            with _yaml_cache_lock:
+                st = os.stat(_CONFIG_PATH)
+                if _YAML_CACHE['stat'] == _stat_key(st):
+                    continue
+
+            logger.info("config.yaml changed on disk, reloading monitors")
+            _load_yaml_config()
+            _reload_scheduler()
+        except Exception as e:
+            logger.error(f"Error watching config.yaml: {e}")
+
+
+def start_config_watcher():
+    """
+    Start watching config.yaml for outside edits (once per process).
+
+    The watcher polls the file's stat every CONFIG_WATCH_INTERVAL seconds
+    and, on a change, re-parses it into the shared cache that the
+    management routes read from and hot reloads the scheduler.
+    """
+    global _config_watcher
 
+    if _config_watcher is not None:
+        return
 
-def _reload_config():
-    """Reload configuration (requires app restart for now)"""
-    # For now, we'll require a manual restart
-    # Future: Could implement hot reload by restarting scheduler
-    pass
+    try:
+        _load_yaml_config()
+    except Exception as e:
+        logger.warning(f"Could not load config.yaml for watching: {e}")
+
+    _config_watcher = threading.Thread(target=_watch_config, name="config-watcher", daemon=True)
+    _config_watcher.start()
 
 
 @app.route('/monitors/manage')
 def monitors_manage():
     """Monitor management page"""
+    global _manage_html
+
     try:
-        yaml_config = _load_yaml_config()
-        monitors = yaml_config.get('monitors', [])
-        
-        # Get target info for each monitor
-        for monitor in monitors:
-            monitor['target'] = _get_monitor_target(monitor['type'], monitor.get('config', {}))
-        
-        return render_template('monitors_manage.html', monitors=monitors)
+        # Rows with targets resolved are precomputed when config.yaml is parsed
+        with _yaml_cache_lock:
+            _refresh_yaml_cache()
+            stat_key = _YAML_CACHE['stat']
+            monitors = _YAML_CACHE['monitors_view']
+
+        # The page only depends on config.yaml: reuse the HTML until it changes
+        cached = _manage_html
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        body = render_template('monitors_manage.html', monitors=monitors)
+        _manage_html = (stat_key, body)
+        return body
     except Exception as e:
         logger.error(f"Error loading monitors: {e}")
         return f"Error loading monitors: {str(e)}", 500
@@ -495,13 +872,21 @@ def monitor_add():
     """Add new monitor"""
     if request.method == 'POST':
         try:
+            # Reject bad input before touching config.yaml
+            error = _validate_form(request.form)
+            if error:
+                return render_template('monitor_form.html',
+                                     error=error,
+                                     groups=_get_groups_list(),
+                                     monitor=None)
+
             yaml_config = _load_yaml_config()
             
             # Build monitor config from form data
             monitor_config = _build_monitor_from_form(request.form)
             
             # Check for duplicate name
-            existing_names = [m['name'] for m in yaml_config.get('monitors', [])]
+            existing_names = {m['name'] for m in yaml_config.get('monitors', ())}
             if monitor_config['name'] in existing_names:
                 return render_template('monitor_form.html', 
                                      error="Monitor name already exists",
@@ -516,18 +901,8 @@ def monitor_add():
             # Save config
             _save_yaml_config(yaml_config)
 
-            # Hot reload monitors
-            try:
-                scheduler = app.config.get('SCHEDULER')
-                logger.info(f"Got scheduler from app.config: {scheduler}")
-                if scheduler:
-                    logger.info("Calling scheduler.reload_monitors()...")
-                    scheduler.reload_monitors()
-                    logger.info("Scheduler reload completed")
-                else:
-                    logger.warning("Scheduler is None, cannot reload")
-            except Exception as e:
-                logger.error(f"Error reloading monitors: {e}", exc_info=True)
+            # Start just the new monitor
+            _update_scheduler('add_monitor', monitor_config)
 
             logger.info(f"Added new monitor: {monitor_config['name']}")
             return redirect(url_for('monitors_manage'))
@@ -556,33 +931,36 @@ def monitor_edit(monitor_index):
             return "Monitor not found", 404
         
         if request.method == 'POST':
+            error = _validate_form(request.form)
+            if error:
+                return render_template('monitor_form.html',
+                                     error=error,
+                                     groups=_get_groups_list(),
+                                     monitor=monitors[monitor_index])
+
             # Build updated monitor config
             monitor_config = _build_monitor_from_form(request.form)
             
             # Check for duplicate name (excluding current monitor)
-            existing_names = [m['name'] for i, m in enumerate(monitors) if i != monitor_index]
+            existing_names = {m['name'] for i, m in enumerate(monitors) if i != monitor_index}
             if monitor_config['name'] in existing_names:
                 return render_template('monitor_form.html',
                                      error="Monitor name already exists",
                                      groups=_get_groups_list(),
                                      monitor=monitors[monitor_index])
-            
+
+            # Nothing changed: skip the rewrite and the scheduler reload
+            if monitor_config == monitors[monitor_index]:
+                logger.info(f"Monitor unchanged, not saving: {monitor_config['name']}")
+                return redirect(url_for('monitors_manage'))
+
             # Update monitor
+            old_name = monitors[monitor_index]['name']
             monitors[monitor_index] = monitor_config
             _save_yaml_config(yaml_config)
 
-            # Hot reload monitors
-            try:
-                scheduler = app.config.get('SCHEDULER')
-                logger.info(f"Got scheduler from app.config: {scheduler}")
-                if scheduler:
-                    logger.info("Calling scheduler.reload_monitors()...")
-                    scheduler.reload_monitors()
-                    logger.info("Scheduler reload completed")
-                else:
-                    logger.warning("Scheduler is None, cannot reload")
-            except Exception as e:
-                logger.error(f"Error reloading monitors: {e}", exc_info=True)
+            # Replace just this monitor
+            _update_scheduler('update_monitor', old_name, monitor_config)
 
             logger.info(f"Updated monitor: {monitor_config['name']}")
             return redirect(url_for('monitors_manage'))
@@ -612,18 +990,8 @@ def monitor_delete(monitor_index):
 
         _save_yaml_config(yaml_config)
 
-        # Hot reload monitors
-        try:
-            scheduler = app.config.get('SCHEDULER')
-            logger.info(f"Got scheduler from app.config: {scheduler}")
-            if scheduler:
-                logger.info("Calling scheduler.reload_monitors()...")
-                scheduler.reload_monitors()
-                logger.info("Scheduler reload completed")
-            else:
-                logger.warning("Scheduler is None, cannot reload")
-        except Exception as e:
-            logger.error(f"Error reloading monitors: {e}", exc_info=True)
+        # Stop just this monitor
+        _update_scheduler('remove_monitor', deleted_name)
 
         logger.info(f"Deleted monitor: {deleted_name}")
         return redirect(url_for('monitors_manage'))
@@ -633,9 +1001,122 @@ def monitor_delete(monitor_index):
         return f"Error: {str(e)}", 500
 
 
+def _parse_status_codes(value):
+    """Parse a comma separated list of HTTP status codes"""
+    return [int(c.strip()) for c in value.split(',')]
+
+
+# Monitor type -> (config key, form field, cast or None, default) for each
+# type-specific setting on the monitor form
+_MONITOR_FORM_FIELDS = {
+    'http': (
+        ('url', 'http_url', None, None),
+        ('method', 'http_method', None, 'GET'),
+        ('expected_status_codes', 'http_expected_codes', _parse_status_codes, '200'),
+    ),
+    'tcp': (
+        ('host', 'tcp_host', None, None),
+        ('port', 'tcp_port', int, None),
+    ),
+    'ping': (
+        ('host', 'ping_host', None, None),
+        ('packet_count', 'ping_count', int, 3),
+    ),
+    'dns': (
+        ('hostname', 'dns_hostname', None, None),
+        ('record_type', 'dns_record_type', None, 'A'),
+        ('resolver', 'dns_resolver', None, '8.8.8.8'),
+    ),
+    'websocket': (
+        ('url', 'ws_url', None, None),
+    ),
+    'docker': (
+        ('container_name', 'docker_container', None, None),
+    ),
+}
+
+# Monitor type -> fixed config values not exposed on the form
+_MONITOR_FORM_CONSTANTS = {
+    'http': {'verify_ssl': True},
+}
+
+
+def _make_field_getter(field, cast, default):
+    """Make a function reading one form field, with its cast and default bound in"""
+    if cast is None:
+        return lambda form: form.get(field, default)
+    return lambda form: cast(form.get(field, default))
+
+
+def _make_config_builder(fields, constants):
+    """Make a function building one monitor type's config from a submitted form"""
+    getters = tuple((key, _make_field_getter(field, cast, default)) for key, field, cast, default in fields)
+    constants = tuple(constants.items())
+
+    def build(form):
+        config = {key: get(form) for key, get in getters}
+        config.update(constants)
+        return config
+
+    return build
+
+
+def _empty_config(form):
+    return {}
+
+
+# Monitor type -> specialized config builder, generated once from the tables above
+_MONITOR_CONFIG_BUILDERS = {
+    monitor_type: _make_config_builder(fields, _MONITOR_FORM_CONSTANTS.get(monitor_type, {}))
+    for monitor_type, fields in _MONITOR_FORM_FIELDS.items()
+}
+
+
+def _is_whole_number(value):
+    """Check that a form value is a non-negative integer"""
+    return isinstance(value, int) or (isinstance(value, str) and value.strip().isdigit())
+
+
+def _validate_form(form):
+    """
+    Check a submitted monitor form before anything is parsed or built from it.
+
+    Args:
+        form: Submitted form data
+
+    Returns:
+        Error message to show, or None if the form is valid
+    """
+    if not form.get('name', '').strip():
+        return "Monitor name is required"
+
+    monitor_type = form.get('type')
+    if monitor_type not in VALID_MONITOR_TYPES:
+        return "Invalid monitor type"
+
+    for field in ('interval', 'timeout'):
+        value = form.get(field, '1')
+        if not _is_whole_number(value) or int(value) < 1:
+            return f"Invalid {field}: must be a whole number, at least 1"
+
+    for key, field, cast, default in _MONITOR_FORM_FIELDS.get(monitor_type, ()):
+        value = form.get(field, default)
+        label = key.replace('_', ' ')
+        if default is None and not value:
+            return f"Missing {label}"
+        if cast is int and not _is_whole_number(value):
+            return f"Invalid {label}: must be a whole number"
+        if cast is _parse_status_codes and not all(_is_whole_number(c) for c in value.split(',')):
+            return f"Invalid {label}: must be comma separated numbers"
+
+    return None
+
+
 def _build_monitor_from_form(form):
     """Build monitor configuration dict from form data"""
     monitor_type = form.get('type')
+    if monitor_type is not None:
+        monitor_type = sys.intern(monitor_type)
     
     # Basic config
     monitor = {
@@ -652,58 +1133,19 @@ def _build_monitor_from_form(form):
     }
     
     # Type-specific config
-    if monitor_type == 'http':
-        monitor['config'] = {
-            'url': form.get('http_url'),
-            'method': form.get('http_method', 'GET'),
-            'expected_status_codes': [int(c.strip()) for c in form.get('http_expected_codes', '200').split(',')],
-            'verify_ssl': True
-        }
-    elif monitor_type == 'tcp':
-        monitor['config'] = {
-            'host': form.get('tcp_host'),
-            'port': int(form.get('tcp_port'))
-        }
-    elif monitor_type == 'ping':
-        monitor['config'] = {
-            'host': form.get('ping_host'),
-            'packet_count': int(form.get('ping_count', 3))
-        }
-    elif monitor_type == 'dns':
-        monitor['config'] = {
-            'hostname': form.get('dns_hostname'),
-            'record_type': form.get('dns_record_type', 'A'),
-            'resolver': form.get('dns_resolver', '8.8.8.8')
-        }
-    elif monitor_type == 'websocket':
-        monitor['config'] = {
-            'url': form.get('ws_url')
-        }
-    elif monitor_type == 'docker':
-        monitor['config'] = {
-            'container_name': form.get('docker_container')
-        }
+    monitor['config'] = _MONITOR_CONFIG_BUILDERS.get(monitor_type, _empty_config)(form)
     
     return monitor
 
 
 def _get_groups_list():
-    """Get list of existing groups from config"""
+    """Get list of existing groups from config (precomputed when config.yaml is parsed)"""
     try:
-        yaml_config = _load_yaml_config()
-        groups = set()
-        
-        # Get groups from monitors
-        for monitor in yaml_config.get('monitors', []):
-            if monitor.get('group'):
-                groups.add(monitor['group'])
-        
-        # Get groups from groups section
-        for group in yaml_config.get('groups', []):
-            groups.add(group['name'])
-        
-        return sorted(list(groups))
-    except:
+        with _yaml_cache_lock:
+            _refresh_yaml_cache()
+            return list(_YAML_CACHE['groups'])
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Could not read groups from config.yaml: {e}")
         return []
 
 
@@ -711,7 +1153,9 @@ def _get_groups_list():
 def monitors_reload():
     """Reload monitor configuration"""
     try:
-        # This requires restarting the service
-        return render_template('reload_required.html')
+        # Apply config.yaml now instead of waiting for the watcher
+        _load_yaml_config()
+        _reload_scheduler()
+        return redirect(url_for('monitors_manage'))
     except Exception as e:
         return f"Error: {str(e)}", 500